@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the interpolation of a gathered trajectory at detector frame times (FrameInterpolator):
+
+* a python loop over the frames, as a reference, timed on a subset
+* increasing frame times (np.interp path), frame times in random order (indexed path), and a
+  2 positioners trajectory
+* the peak memory allocated during the interpolation, bounded by the chunk size
+
+Run with: python benchmarks/bench_frame_interpolation.py [nb_frames] [nb_lines]
+"""
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from pymodaq_plugins_newport.hardware.xps_interpolation import FrameInterpolator
+
+
+def python_loop(times, positions, frame_times):
+    results = []
+    for frame_time in frame_times:
+        index = min(max(int(np.searchsorted(times, frame_time, side="right")) - 1, 0), times.size - 2)
+        weight = (frame_time - times[index]) / (times[index + 1] - times[index])
+        results.append(positions[index] + weight * (positions[index + 1] - positions[index]))
+    return results
+
+
+def timed(function, *arguments):
+    start = time.perf_counter()
+    function(*arguments)
+    return time.perf_counter() - start
+
+
+def main(nb_frames=2_000_000, nb_lines=80_000):
+    rng = np.random.default_rng(0)
+    times = 100. + np.arange(nb_lines) / 8000.  # 8 kHz servo rate
+    positions = np.cumsum(rng.normal(0., 1e-4, nb_lines))
+    velocities = np.gradient(positions, times)
+    frame_times = np.sort(rng.uniform(times[0], times[-1], nb_frames))
+    shuffled = rng.permutation(frame_times)
+    interpolator = FrameInterpolator(times, positions, velocities)
+    xy = FrameInterpolator(times, np.stack([positions, -positions], axis=1))
+
+    loop = timed(python_loop, times, positions, frame_times[:20000]) * nb_frames / 20000
+    increasing = timed(interpolator, frame_times)
+    random_order = timed(interpolator, shuffled)
+    two_positioners = timed(xy, frame_times)
+    output = np.empty(nb_frames), np.empty(nb_frames)
+    tracemalloc.start()
+    interpolator(shuffled, *output)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"{nb_frames} frames, {nb_lines} gathered lines")
+    print(f"python loop (extrapolated):   {loop:8.3f} s")
+    print(f"increasing frame times:       {increasing:8.3f} s ({loop / increasing:.0f}x)")
+    print(f"frame times in random order:  {random_order:8.3f} s ({loop / random_order:.0f}x)")
+    print(f"2 positioners, no velocities: {two_positioners:8.3f} s")
+    print(f"peak temporary memory:        {peak / 2 ** 20:8.1f} MiB "
+          f"(chunks of {interpolator.chunk_size} frames, outputs preallocated)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the client side of the XPS driver against the XPS simulator:
+
+* round trip of GroupPositionCurrentGet
+* reading the positions of several positioners with sequential requests vs one batch
+* latency of an abort, from GroupMoveAbort sent to the blocked move command returning
+* latency of the end of a motion reported by the MotionDone event vs by the move command, the same within a
+  few ms: the event spares the position polling during the move, not time
+
+Run with: python benchmarks/bench_xps_client.py [latency_ms] [nb_requests]
+"""
+import sys
+import time
+
+import numpy as np
+
+from pymodaq_plugins_newport.hardware.xps_codec import XPSError
+from pymodaq_plugins_newport.hardware.xps_q8_simplified import SimpleXPS
+from pymodaq_plugins_newport.hardware.xps_simulator import XPSSimulator
+
+POSITIONERS = ["X", "Y", "Z", "T"]
+
+
+def timed(function, nb_requests):
+    """Median duration of function in ms"""
+    durations = []
+    for _ in range(nb_requests):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return np.median(durations) * 1e3
+
+
+def main(latency_ms=0.2, nb_requests=200):
+    with XPSSimulator({"Group1": POSITIONERS}, latency=latency_ms * 1e-3, ready=True) as simulator:
+        controller = SimpleXPS("127.0.0.1", simulator.port, "Group1", "X")
+        names = [f"Group1.{positioner}" for positioner in POSITIONERS]
+
+        round_trip = timed(controller.get_position, nb_requests)
+
+        def sequential():
+            return [controller.query("GroupPositionCurrentGet", name, 1) for name in names]
+
+        def batched():
+            batch = controller.batch()
+            for name in names:
+                batch.add("GroupPositionCurrentGet", name)
+            return batch.execute()
+
+        sequential_time = timed(sequential, nb_requests)
+        batch_time = timed(batched, nb_requests)
+
+        aborts = []
+        for _ in range(10):
+            motion = controller.move_absolute(50., wait=False)
+            time.sleep(0.05)
+            start = time.perf_counter()
+            controller.stop_motion()
+            try:
+                motion.result()
+            except XPSError:
+                pass
+            aborts.append(time.perf_counter() - start)
+            controller.move_absolute(0.)
+
+        listener = controller.motion_done_listener()
+        events, commands = [], []
+        for target in (1., 0.) * 5:
+            start = time.perf_counter()
+            done = listener.watch(lambda: controller.move_absolute(target, wait=False))
+            done.result()
+            events.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            controller.move_absolute(target + 1.)
+            commands.append(time.perf_counter() - start)
+            controller.move_absolute(target)
+        controller.close_tcpip()
+
+    print(f"{latency_ms} ms per request, median of {nb_requests} requests")
+    print(f"GroupPositionCurrentGet round trip:  {round_trip:8.3f} ms")
+    print(f"{len(names)} positions, sequential:         {sequential_time:8.3f} ms")
+    print(f"{len(names)} positions, batch:              {batch_time:8.3f} ms ({sequential_time / batch_time:.1f}x)")
+    print(f"abort to move command return:        {np.median(aborts) * 1e3:8.3f} ms")
+    print(f"1 mm move done by MotionDone event:  {np.median(events) * 1e3:8.3f} ms")
+    print(f"1 mm move done by the move command:  {np.median(commands) * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main(*(float(arg) if n == 0 else int(arg) for n, arg in enumerate(sys.argv[1:])))
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark of the XPS reply parsing: legacy character loop + eval versus xps_codec.decode_reply
+
+Run with: python benchmarks/bench_xps_codec.py
+"""
+import random
+import timeit
+
+from pymodaq_plugins_newport.hardware.xps_codec import SIGNATURES, decode_reply, output_types
+
+_SAMPLES = {'int': '12', 'short': '3', 'unsigned short': '255', 'long': '123456', 'double': '-1.234567e-03',
+            'bool': '1'}
+
+
+def legacy_parse(returned_string, nb_values):
+    """Parser previously copied in every method of XPS_Q8_drivers"""
+    i, j, ret_list = 0, 0, [0]
+    for param_nb in range(nb_values):
+        while (i + j) < len(returned_string) and returned_string[i + j] != ',':
+            j += 1
+        ret_list.append(eval(returned_string[i:i + j]))
+        i, j = i + j + 1, 0
+    return ret_list
+
+
+def arities():
+    """One representative API (without string output) per return arity, plus per-positioner APIs up to 8 axes"""
+    cases = {}
+    for api_name, signature in SIGNATURES.items():
+        if 'char' in signature.outputs:
+            continue
+        for nb_element in (range(1, 9) if signature.per_element else (1,)):
+            cases.setdefault(len(output_types(api_name, nb_element)), (api_name, nb_element))
+    return dict(sorted(cases.items()))
+
+
+def main(number=20000):
+    random.seed(0)
+    print(f"{'arity':>5} {'api':<45} {'legacy (us)':>12} {'codec (us)':>12} {'speedup':>8}")
+    for arity, (api_name, nb_element) in arities().items():
+        returned_string = ','.join(_SAMPLES[c_type] for c_type in output_types(api_name, nb_element))
+        assert [float(val) for val in legacy_parse(returned_string, arity)[1:]] == \
+               [float(val) for val in decode_reply(api_name, returned_string, nb_element)]
+        legacy = timeit.timeit(lambda: legacy_parse(returned_string, arity), number=number) / number
+        codec = timeit.timeit(lambda: decode_reply(api_name, returned_string, nb_element), number=number) / number
+        print(f'{arity:>5} {api_name:<45} {legacy * 1e6:>12.2f} {codec * 1e6:>12.2f} {legacy / codec:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
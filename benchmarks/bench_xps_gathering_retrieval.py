@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the two ways to retrieve an XPS gathering:
+
+* text replies of GatheringDataMultipleLinesGet, chunk by chunk (GatheringSession.read)
+* one FTP transfer of the file saved by GatheringStopAndSave (XPSFileStore.fetch_gathering)
+
+Both run against local stand-ins: the XPS simulator, gathering a motion and answering after a
+configurable network latency, and its LocalFTP, with the ftplib.FTP interface, serving the temporary
+directory where the simulator saves the gathering file.
+
+Run with: python benchmarks/bench_xps_gathering_retrieval.py [nb_lines] [latency_ms]
+"""
+import sys
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+from pymodaq_plugins_newport.hardware.xps_files import XPSFileStore
+from pymodaq_plugins_newport.hardware.xps_q8_simplified import SimpleXPS
+from pymodaq_plugins_newport.hardware.xps_simulator import LocalFTP, XPSSimulator
+
+TYPES = ["Group1.Pos.SetpointPosition", "Group1.Pos.CurrentPosition", "Group1.Pos.FollowingError"]
+
+
+def main(nb_lines=200000, latency_ms=1.0):
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        # the whole run is gathered within 0.1 s during a 0.1 s motion
+        simulator = XPSSimulator({"Group1": ["Pos"]}, latency=latency_ms * 1e-3, ready=True,
+                                 velocity=100., acceleration=4e4, servo_rate=nb_lines * 10, files_root=root)
+        with simulator:
+            controller = SimpleXPS("127.0.0.1", simulator.port, "Group1", "Pos")
+            session = controller.gathering(nb_lines)
+            session.start()
+            controller.move_absolute(10.)
+            while session.current_number() < nb_lines:
+                time.sleep(0.01)
+            controller.query("GatheringStopAndSave")
+            start = time.perf_counter()
+            text = session.read(0, nb_lines)
+            text_time = time.perf_counter() - start
+            controller.close_tcpip()
+
+        store = XPSFileStore("127.0.0.1", ftp_factory=partial(LocalFTP, root))
+        start = time.perf_counter()
+        bulk = store.fetch_gathering(TYPES)
+        bulk_time = time.perf_counter() - start
+        start = time.perf_counter()
+        mapped = store.fetch_gathering(TYPES, npy_path=root / "gathering.npy", nb_lines=nb_lines)
+        mapped_time = time.perf_counter() - start
+
+        for array in (bulk, mapped):
+            assert np.allclose(array[TYPES[1]], text[TYPES[1]])
+        del mapped
+
+    print(f"{nb_lines} lines of {len(TYPES)} values, {latency_ms} ms per request")
+    print(f"GatheringDataMultipleLinesGet: {text_time:8.3f} s")
+    print(f"FTP file to array:             {bulk_time:8.3f} s ({text_time / bulk_time:.1f}x)")
+    print(f"FTP file to memory-mapped npy: {mapped_time:8.3f} s ({text_time / mapped_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) if n == 0 else float(arg) for n, arg in enumerate(sys.argv[1:])))
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the import of the XPS driver module and of the first use of its API methods, compared with
+the driver with hand-written API methods (all defined at import) of a baseline git revision.
+
+Each measure runs in a fresh interpreter, with the compiled bytecode already cached as in normal use,
+and also compiling the module from its source as after an install or an update.
+The modules imported by the driver (asyncio, socket, xps_codec, xps_stats...) are imported beforehand so
+that only the driver module itself is measured: its import time, the increase of the resident memory
+and, in a separate run as tracing slows the import down, the memory allocated by the import
+(tracemalloc). Then the time to get five API methods, as a plugin does. Both modules are loaded from
+their file as pymodaq_plugins_newport.hardware.XPS_Q8_drivers, the baseline being read with git show.
+
+Run with: python benchmarks/bench_xps_import.py [nb_runs] [baseline_revision]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+MEASURE = """
+import asyncio, importlib.util, json, resource, socket, sys, threading, time, tracemalloc
+import pymodaq_plugins_newport.hardware.xps_codec, pymodaq_plugins_newport.hardware.xps_stats
+
+def load(path):
+    spec = importlib.util.spec_from_file_location('pymodaq_plugins_newport.hardware.XPS_Q8_drivers', path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def rss():
+    with open('/proc/self/statm') as file:
+        return int(file.read().split()[1]) * resource.getpagesize()
+
+if sys.argv[1] == 'trace':
+    tracemalloc.start()
+rss_before = rss()
+start = time.perf_counter()
+XPS = load(sys.argv[2]).XPS
+import_time = time.perf_counter() - start
+rss_after = rss()
+allocated = tracemalloc.get_traced_memory()[0]
+xps = XPS()
+start = time.perf_counter()
+for name in ('GroupStatusGet', 'GroupPositionCurrentGet', 'GroupMoveAbsolute', 'GroupMoveAbort', 'GroupKill'):
+    getattr(xps, name)
+first_use = time.perf_counter() - start
+print(json.dumps([import_time, allocated, rss_after - rss_before, first_use]))
+"""
+
+
+def measure(path, mode, options=()):
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return json.loads(subprocess.run([sys.executable, *options, "-c", MEASURE, mode, str(path)], check=True,
+                                     capture_output=True, text=True, env=env).stdout)
+
+
+def measure_module(path, nb_runs):
+    # the first run writes the bytecode cache
+    measure(path, "time")
+    import_time, _, resident, first_use = np.median([measure(path, "time") for _ in range(nb_runs)], axis=0)
+    allocated = np.median([measure(path, "trace")[1] for _ in range(nb_runs)])
+    with tempfile.TemporaryDirectory() as directory:
+        # empty bytecode cache, never written
+        source_time = np.median([measure(path, "time", ("-B", "-X", f"pycache_prefix={directory}"))[0]
+                                 for _ in range(nb_runs)])
+    return import_time, source_time, allocated, resident, first_use
+
+
+def main(nb_runs=20, baseline="9c73b0f^"):
+    import pymodaq_plugins_newport.hardware
+    path = Path(pymodaq_plugins_newport.hardware.__file__).parent / "XPS_Q8_drivers.py"
+    source = subprocess.run(["git", "show", f"{baseline}:src/pymodaq_plugins_newport/hardware/XPS_Q8_drivers.py"],
+                            check=True, capture_output=True, cwd=path.parent).stdout
+    with tempfile.TemporaryDirectory() as directory:
+        baseline_path = Path(directory) / "XPS_Q8_drivers.py"
+        baseline_path.write_bytes(source)
+        baseline_results = measure_module(baseline_path, nb_runs)
+    results = measure_module(path, nb_runs)
+
+    print(f"XPS_Q8_drivers, median of {nb_runs} interpreters: baseline {baseline} -> current")
+    for (label, unit, scale), before, after in zip(
+        [("import time", "ms", 1e3), ("import time from source", "ms", 1e3), ("memory allocated", "kB", 1 / 1024),
+         ("resident memory", "kB", 1 / 1024), ("first use of 5 methods", "ms", 1e3)],
+        baseline_results, results,
+    ):
+        print(f"{label + ':':25}{before * scale:9.3f} {unit} -> {after * scale:9.3f} {unit}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) if index == 0 else arg for index, arg in enumerate(sys.argv[1:])))
@@ -1,3 +1,9 @@
+import queue
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
 from pymodaq.control_modules.move_utility_classes import (
     DAQ_Move_base,
     comon_parameters_fun,
@@ -9,10 +15,20 @@ from pymodaq.utils.daq_utils import (
     ThreadCommand,
 )  # object used to send info back to the main thread
 from pymodaq.utils.parameter import Parameter
+from pymodaq.utils.config import get_set_config_dir
 from pymodaq_plugins_newport.hardware.xps_q8_simplified import (
     SimpleXPS,
     XPSError,
 )
+from pymodaq_plugins_newport.hardware.xps_pool import XPSConnectionPool
+from pymodaq_plugins_newport.hardware.xps_fast_steps import FastSteps
+from pymodaq_plugins_newport.hardware.xps_pco import (
+    PULSE_WIDTHS,
+    ENCODER_SETTLING_TIMES,
+)
+
+
+SGAMMA_PARAMETERS = ("velocity", "acceleration", "min_jerk_time", "max_jerk_time")
 
 
 class DAQ_Move_XpsQ8(DAQ_Move_base):
@@ -27,6 +43,10 @@ class DAQ_Move_XpsQ8(DAQ_Move_base):
     please notify the author(s) if you have tested this plugin on a different model so it can be added
     to the list of compatible controllers.
 
+    Setting the group positionners (ex: "X, Y, Z") turns the plugin into a single multi-valued actuator
+    controlling the whole group: positions are read with one GroupPositionCurrentGet and the moves are
+    coordinated GroupMoveAbsolute/GroupMoveRelative commands.
+
     Attributes:
     -----------
     controller: object
@@ -65,25 +85,270 @@ class DAQ_Move_XpsQ8(DAQ_Move_base):
             "type": "str",
             "value": "Pos",
         },  # positionner to be moved
+        {
+            "title": "Group positionners :",
+            "name": "group_positionners",
+            "type": "str",
+            "value": "",
+        },  # comma separated, ex: "X, Y, Z". If set, the whole group is moved as one multi-valued actuator
+        {
+            "title": "Sockets per controller :",
+            "name": "pool_size",
+            "type": "int",
+            "value": XPSConnectionPool.DEFAULT_SIZE,
+            "min": 2,
+        },  # connections shared by all the plugins using the same XPS, a move holds one until it ends
+        {
+            "title": "Abort acceleration multiplier :",
+            "name": "abort_acceleration",
+            "type": "float",
+            "value": 1.0,
+            "min": 1.0,
+        },  # values above 1 use GroupMoveAbortFast
+        {
+            "title": "Use asyncio client :",
+            "name": "use_asyncio",
+            "type": "bool",
+            "value": False,
+        },  # requests of all the controllers multiplexed on one event loop
+        {
+            "title": "Reuse homed group :",
+            "name": "fast_startup",
+            "type": "bool",
+            "value": True,
+        },  # skips kill/initialize/home when the group is already READY
+        {
+            "title": "Bring up groups :",
+            "name": "bring_up_groups",
+            "type": "str",
+            "value": "",
+        },  # comma separated, other groups of the controller initialized and homed concurrently
+        {
+            "title": "Motion done events :",
+            "name": "motion_events",
+            "type": "bool",
+            "value": False,
+        },  # end of the moves pushed by the XPS instead of polled, not sooner, costs a socket and 2 requests per move
+        {
+            "title": "Position refresh during moves (s) :",
+            "name": "position_refresh",
+            "type": "float",
+            "value": 0.5,
+            "min": 0.0,
+        },  # with motion done events, minimum time between two position requests
+        {
+            "title": "Log call statistics every (s) :",
+            "name": "stats_log_interval",
+            "type": "float",
+            "value": 0.0,
+            "min": 0.0,
+        },  # latency histograms of the XPS calls, 0 to disable
+        {
+            "title": "Sample controller health every (s) :",
+            "name": "telemetry_interval",
+            "type": "float",
+            "value": 0.0,
+            "min": 0.0,
+        },  # temperature, loads and following errors kept in a ring buffer, 0 to disable
+        {
+            "title": "Sync controller clock every (s) :",
+            "name": "clock_sync_interval",
+            "type": "float",
+            "value": 0.0,
+            "min": 0.0,
+        },  # positions stamped with the controller time of their acquisition (controller_time), 0 to disable
+        {
+            "title": "Motion profile :",
+            "name": "motion",
+            "type": "group",
+            "children": [
+                {
+                    "title": "Velocity :",
+                    "name": "velocity",
+                    "type": "float",
+                    "value": 0.0,
+                    "min": 0.0,
+                },  # SGamma parameters, read from the XPS at initialization
+                {
+                    "title": "Acceleration :",
+                    "name": "acceleration",
+                    "type": "float",
+                    "value": 0.0,
+                    "min": 0.0,
+                },
+                {
+                    "title": "Minimum jerk time (s) :",
+                    "name": "min_jerk_time",
+                    "type": "float",
+                    "value": 0.0,
+                    "min": 0.0,
+                },
+                {
+                    "title": "Maximum jerk time (s) :",
+                    "name": "max_jerk_time",
+                    "type": "float",
+                    "value": 0.0,
+                    "min": 0.0,
+                },
+                {
+                    "title": "Fast small steps :",
+                    "name": "fast_steps",
+                    "type": "bool",
+                    "value": False,
+                },  # steps moved with the maximum acceleration and the minimum jerk time, single positionner only
+                {
+                    "title": "Largest fast step :",
+                    "name": "fast_max_step",
+                    "type": "float",
+                    "value": 0.0,
+                    "min": 0.0,
+                },  # 0 for the displacement from which the profile reaches its velocity
+                {
+                    "title": "Time saved per step (ms) :",
+                    "name": "time_saved",
+                    "type": "float",
+                    "value": 0.0,
+                    "readonly": True,
+                },  # measured by the XPS, compared to the profile above
+                {
+                    "title": "Calibrate move durations :",
+                    "name": "calibrate",
+                    "type": "bool",
+                    "value": False,
+                },  # times of each move read back to fit the predicted durations, costs a request per move
+            ],
+        },
+        {
+            "title": "Position compare triggering :",
+            "name": "pco",
+            "type": "group",
+            "children": [
+                {
+                    "title": "Enabled :",
+                    "name": "pco_enabled",
+                    "type": "bool",
+                    "value": False,
+                },  # TTL pulses emitted by the XPS while crossing the window
+                {
+                    "title": "Start :",
+                    "name": "pco_start",
+                    "type": "float",
+                    "value": 0.0,
+                },
+                {
+                    "title": "Stop :",
+                    "name": "pco_stop",
+                    "type": "float",
+                    "value": 1.0,
+                },
+                {
+                    "title": "Step :",
+                    "name": "pco_step",
+                    "type": "float",
+                    "value": 0.01,
+                },
+                {
+                    "title": "Pulse width (µs) :",
+                    "name": "pco_pulse_width",
+                    "type": "list",
+                    "limits": list(PULSE_WIDTHS),
+                    "value": PULSE_WIDTHS[0],
+                },
+                {
+                    "title": "Encoder settling time (µs) :",
+                    "name": "pco_settling_time",
+                    "type": "list",
+                    "limits": list(ENCODER_SETTLING_TIMES),
+                    "value": ENCODER_SETTLING_TIMES[0],
+                },
+                {
+                    "title": "Configured pulses :",
+                    "name": "pco_nb_pulses",
+                    "type": "int",
+                    "value": 0,
+                    "readonly": True,
+                },  # pulses of the configuration read back from the XPS
+            ],
+        },
     ] + comon_parameters_fun(is_multiaxes, axis_names=_axis_names, epsilon=_epsilon)
 
     def ini_attributes(self):
         self.controller: SimpleXPS | None = None
+        self._watched_motion: Future | None = None
+        self._last_position: float | None = None
+        self._last_position_time = 0.0
+        # controller time (s) of the acquisition of the last position, None without clock sync
+        self._last_controller_time: float | None = None
+        # predicted end of the current move (perf_counter time) and its displacement, to calibrate the model
+        self._motion_end = 0.0
+        self._motion_displacement: float | None = None
+        self._fast_steps: FastSteps | None = None
+        self._reading_motion_profile = False
+        # motions ended in the threads of the controller with their displacement, fast steps mode and SGamma
+        # parameters, reported from the plugin thread
+        self._finished_motions = queue.SimpleQueue()
 
     def get_actuator_value(self):
         """Get the current value from the hardware with scaling conversion.
 
+        While a move watched by the motion done events is running, the position is only requested every
+        position_refresh seconds, the end of the move being reported by the XPS. Other moves are polled
+        every position_refresh seconds too until their predicted end, then at each call. The ends of the moves
+        are reported from here, in the plugin thread. With clock sync, the controller time in seconds of the
+        acquisition of the position is attached to it as its controller_time attribute.
+
         Returns
         -------
         float: The position obtained after scaling conversion.
         """
-        pos = DataActuator(data=self.controller.get_position())
+        self._report_motions()
+        now = time.perf_counter()
+        watched = self._watched_motion is not None and not self._watched_motion.done()
+        if (
+            not (watched or now < self._motion_end)
+            or self._last_position is None
+            or now - self._last_position_time >= self.settings["position_refresh"]
+        ):
+            if self._group_positionners():
+                self._last_position = self.controller.get_group_positions()
+            else:
+                self._last_position = self.controller.get_position()
+            self._last_position_time = now
+            self._last_controller_time = self._controller_time(self.controller.position_time)
+        pos = self._to_actuator(self._last_position)
         pos = self.get_position_with_scaling(pos)
+        return self._stamped(pos)
+
+    def _controller_time(self, position_time: float | None) -> float | None:
+        """Controller time of a position while the clock sync is enabled, else None"""
+        return position_time if self.settings["clock_sync_interval"] > 0 else None
+
+    def _stamped(self, pos: DataActuator) -> DataActuator:
+        """Attaches the controller time of the acquisition of the last position to a scaled position"""
+        if self._last_controller_time is not None:
+            pos.add_extra_attribute(controller_time=self._last_controller_time)
         return pos
 
+    def _group_positionners(self) -> list:
+        """Names of the group positionners moved together, empty in single positionner mode"""
+        return [
+            name.strip()
+            for name in self.settings["group_positionners"].split(",")
+            if name.strip()
+        ]
+
+    @staticmethod
+    def _to_actuator(position) -> DataActuator:
+        """Wraps the position of a positionner, or the list of positions of a group"""
+        if isinstance(position, list):
+            return DataActuator(data=np.array(position))
+        return DataActuator(data=position)
+
     def close(self):
         """Terminate the communication protocol"""
         if self.controller is not None:  # There's nothing to close otherwise
+            self._report_motions()
+            self._stop_fast_steps()
             self.controller.close_tcpip()
 
     def commit_settings(self, param: Parameter):
@@ -94,6 +359,8 @@ class DAQ_Move_XpsQ8(DAQ_Move_base):
         param: Parameter
             A given parameter (within detector_settings) whose value has been changed by the user
         """
+        # the moves made with the previous settings are reported first
+        self._report_motions()
         if param.name() == "xps_ip_address":
             self.controller.set_ip(param.value())
         elif param.name() == "xps_port":
@@ -102,6 +369,20 @@ class DAQ_Move_XpsQ8(DAQ_Move_base):
             self.controller.set_group(param.value())
         elif param.name() == "positionner":
             self.controller.set_positionner(param.value())
+        elif param.name() == "stats_log_interval":
+            self.update_statistics()
+        elif param.name() == "telemetry_interval":
+            self.update_telemetry()
+        elif param.name() == "clock_sync_interval":
+            self.update_clock_sync()
+        elif param.name() == "group_positionners":
+            self.controller.set_group_positionners(self._group_positionners())
+        elif param.name() in SGAMMA_PARAMETERS:
+            self.update_motion_profile()
+        elif param.name() in ("fast_steps", "fast_max_step"):
+            self.update_fast_steps()
+        elif param.name().startswith("pco_") and param.name() != "pco_nb_pulses":
+            self.update_position_compare()
         else:
             pass
 
@@ -126,6 +407,17 @@ class DAQ_Move_XpsQ8(DAQ_Move_base):
                 port=self.settings["xps_port"],
                 group=self.settings["group"],
                 positionner=self.settings["positionner"],
+                pool_size=self.settings["pool_size"],
+                use_asyncio=self.settings["use_asyncio"],
+                group_positionners=self._group_positionners(),
+                fast_startup=self.settings["fast_startup"],
+                bring_up_groups=[
+                    group.strip()
+                    for group in self.settings["bring_up_groups"].split(",")
+                    if group.strip()
+                ],
+                # error and status strings of the controller firmware, saved with the plugin config
+                strings_directory=get_set_config_dir("newport_xps"),
             )
         except XPSError as e:
             initialized = False
@@ -138,10 +430,147 @@ class DAQ_Move_XpsQ8(DAQ_Move_base):
             )
 
         initialized = self.controller.check_connected()
+        self.read_motion_profile()
+        if self.settings["motion", "fast_steps"]:
+            self.update_fast_steps()
+        if self.settings["pco", "pco_enabled"]:
+            self.update_position_compare()
+        if self.settings["stats_log_interval"] > 0:
+            self.update_statistics()
+        if self.settings["telemetry_interval"] > 0:
+            self.update_telemetry()
+        if self.settings["clock_sync_interval"] > 0:
+            self.update_clock_sync()
         # here 'initialized' should always be True, as any error would have been caught above
-        info = "XPS controller initialization"
+        info = (
+            f"XPS controller initialization: group {self.controller.startup_path} "
+            f"in {self.controller.startup_time:.1f} s"
+        )
+        self.emit_status(
+            ThreadCommand(
+                "Update_Status",
+                [f"XPS groups: {self.controller.startup().summary()}"],
+            )
+        )
         return info, initialized
 
+    def update_statistics(self):
+        """Enables the statistics of the XPS calls, logged every stats_log_interval seconds, or disables them"""
+        try:
+            if self.settings["stats_log_interval"] > 0:
+                self.controller.enable_statistics(self.settings["stats_log_interval"])
+            else:
+                self.controller.disable_statistics()
+        except XPSError as e:
+            self.emit_status(ThreadCommand("Update_Status", [f"{e}"]))
+
+    def update_telemetry(self):
+        """Starts sampling the controller health every telemetry_interval seconds, or stops it"""
+        if self.settings["telemetry_interval"] > 0:
+            self.controller.start_telemetry(self.settings["telemetry_interval"])
+        else:
+            self.controller.stop_telemetry()
+
+    def update_clock_sync(self):
+        """Starts aligning the host clock on the controller clock every clock_sync_interval seconds, or stops it"""
+        try:
+            if self.settings["clock_sync_interval"] > 0:
+                self.controller.start_clock_sync(self.settings["clock_sync_interval"])
+            else:
+                self.controller.stop_clock_sync()
+        except XPSError as e:
+            self.emit_status(ThreadCommand("Update_Status", [f"{e}"]))
+
+    def read_motion_profile(self):
+        """Shows the SGamma parameters of the positionner, or of the first group positionner"""
+        try:
+            parameters = self.controller.sgamma_parameters(next(iter(self._group_positionners()), None))
+        except XPSError as e:
+            self.emit_status(ThreadCommand("Update_Status", [f"{e}"]))
+        else:
+            # the settings changes are not sent back to the XPS
+            self._reading_motion_profile = True
+            try:
+                for name, value in zip(SGAMMA_PARAMETERS, parameters):
+                    self.settings.child("motion", name).setValue(value)
+            finally:
+                self._reading_motion_profile = False
+
+    def update_motion_profile(self):
+        """Sets the SGamma parameters of the positionner, or of all the group positionners, from the settings"""
+        if self._reading_motion_profile:
+            return
+        parameters = applied = [self.settings["motion", name] for name in SGAMMA_PARAMETERS]
+        try:
+            for positionner in self._group_positionners() or [None]:
+                if list(self.controller.motion_model(positionner).parameters()) != parameters:
+                    self._stop_fast_steps()
+                    applied = self.controller.set_sgamma_parameters(*parameters, positionner=positionner)
+        except XPSError as e:
+            self.emit_status(ThreadCommand("Update_Status", [f"{e}"]))
+            return
+        if self._fast_steps is None and self.settings["motion", "fast_steps"]:
+            self.update_fast_steps()
+        if applied != parameters:
+            # limited to the maximum velocity and acceleration of the positionner
+            self.read_motion_profile()
+
+    def update_fast_steps(self):
+        """Starts the fast small steps mode, with the current profile as default, or stops it"""
+        self._stop_fast_steps()
+        if not self.settings["motion", "fast_steps"]:
+            return
+        if self._group_positionners():
+            self.emit_status(ThreadCommand("Update_Status", ["Fast steps need a single positionner"]))
+            return
+        try:
+            self._fast_steps = self.controller.fast_steps(max_step=self.settings["motion", "fast_max_step"] or None)
+        except XPSError as e:
+            self.emit_status(ThreadCommand("Update_Status", [f"{e}"]))
+
+    def _stop_fast_steps(self):
+        """Restores the default profile of the fast steps mode, if active"""
+        if self._fast_steps is None:
+            return
+        fast_steps, self._fast_steps = self._fast_steps, None
+        try:
+            fast_steps.restore()
+        except XPSError as e:
+            self.emit_status(ThreadCommand("Update_Status", [f"{e}"]))
+        else:
+            if fast_steps.nb_steps:
+                self.emit_status(ThreadCommand("Update_Status", [fast_steps.summary()]))
+
+    def update_position_compare(self):
+        """Programs the position compare output of the XPS from the settings and reads back the configured pulses"""
+        trigger = self.controller.position_compare()
+        try:
+            if self.settings["pco", "pco_enabled"]:
+                trigger.configure(
+                    self.settings["pco", "pco_start"],
+                    self.settings["pco", "pco_stop"],
+                    self.settings["pco", "pco_step"],
+                    pulse_width=self.settings["pco", "pco_pulse_width"],
+                    encoder_settling_time=self.settings["pco", "pco_settling_time"],
+                )
+                trigger.enable()
+                positions = trigger.configured_pulse_positions()
+                self.settings.child("pco", "pco_nb_pulses").setValue(positions.size)
+                self.emit_status(
+                    ThreadCommand(
+                        "Update_Status",
+                        [
+                            f"Position compare armed: {positions.size} pulses configured from "
+                            f"{positions[0]:g} to {positions[-1]:g}"
+                        ],
+                    )
+                )
+            else:
+                trigger.disable()
+                self.settings.child("pco", "pco_nb_pulses").setValue(0)
+        except XPSError as e:
+            self.emit_status(ThreadCommand("Update_Status", [f"{e}"]))
+
     def move_abs(self, value: DataActuator):
         """Move the actuator to the absolute target defined by value
 
@@ -149,6 +578,7 @@ class DAQ_Move_XpsQ8(DAQ_Move_base):
         ----------
         value: (float) value of the absolute target positioning
         """
+        self._report_motions()
         value = self.check_bound(
             value
         )  # if user checked bounds, the defined bounds are applied here
@@ -156,11 +586,26 @@ class DAQ_Move_XpsQ8(DAQ_Move_base):
         value = self.set_position_with_scaling(
             value
         )  # apply scaling if the user specified one
-        self.emit_status(ThreadCommand("Update_Status", ["move_absolute command sent"]))
         try:
-            self.controller.move_absolute(value.value())
+            self._prepare_motion(
+                None if self._last_position is None
+                else np.atleast_1d(value.data[0]) - np.asarray(self._last_position)
+            )
+            self.emit_status(ThreadCommand("Update_Status", [f"move_absolute command sent{self._predicted()}"]))
+            if self._group_positionners():
+                motion = self._start_motion(
+                    lambda: self.controller.move_group_absolute(
+                        np.atleast_1d(value.data[0]), wait=False
+                    )
+                )
+            else:
+                motion = self._start_motion(
+                    lambda: self.controller.move_absolute(value.value(), wait=False)
+                )
         except XPSError as e:
             self.emit_status(ThreadCommand("Update_Status", [f"{e}"]))
+        else:
+            self._follow_motion(motion)
 
     def move_rel(self, value: DataActuator):
         """Move the actuator to the relative target actuator value defined by value
@@ -169,29 +614,143 @@ class DAQ_Move_XpsQ8(DAQ_Move_base):
         ----------
         value: (float) value of the relative target positioning
         """
+        self._report_motions()
         value = self.check_bound(self.current_position + value) - self.current_position
         self.target_value = value + self.current_position
         value = self.set_position_relative_with_scaling(value)
 
-        self.emit_status(ThreadCommand("Update_Status", ["move_relative command sent"]))
         try:
-            self.controller.move_relative(value.value())
+            self._prepare_motion(np.atleast_1d(value.data[0]))
+            self.emit_status(ThreadCommand("Update_Status", [f"move_relative command sent{self._predicted()}"]))
+            if self._group_positionners():
+                motion = self._start_motion(
+                    lambda: self.controller.move_group_relative(
+                        np.atleast_1d(value.data[0]), wait=False
+                    )
+                )
+            else:
+                motion = self._start_motion(
+                    lambda: self.controller.move_relative(value.value(), wait=False)
+                )
         except XPSError as e:
             self.emit_status(ThreadCommand("Update_Status", [f"{e}"]))
+        else:
+            self._follow_motion(motion)
 
     def move_home(self):
         """Call the reference method of the controller"""
+        self._report_motions()
         self.emit_status(ThreadCommand("Update_Status", ["moved_home command sent"]))
+        self._motion_end = 0.0
+        self._motion_displacement = None
+        try:
+            motion = self._start_motion(
+                lambda: self.controller.move_home(wait=False)
+            )
+        except XPSError as e:
+            self.emit_status(ThreadCommand("Update_Status", [f"{e}"]))
+        else:
+            self._follow_motion(motion)
+
+    def _prepare_motion(self, displacements: np.ndarray | None):
+        """
+        Picks the SGamma profile of a move in fast steps mode and predicts its end from the profile of the
+        positionners, see SimpleXPS.motion_model. Unknown displacements (None) use the default profile.
+        """
+        self._motion_end = 0.0
+        self._motion_displacement = None
         try:
-            self.controller.move_home()
+            if self._fast_steps is not None:
+                self._fast_steps.prepare(np.inf if displacements is None else displacements[0])
+            if displacements is None:
+                return
+            if self._group_positionners():
+                duration = self.controller.predict_group_move_time(displacements)
+            else:
+                duration = self.controller.predict_move_time(displacements[0])
+                self._motion_displacement = float(displacements[0])
+        except XPSError:
+            # the moves are then polled at each call
+            return
+        self._motion_end = time.perf_counter() + float(duration)
+
+    def _predicted(self) -> str:
+        """Predicted duration of the current move, for the status messages"""
+        remaining = self._motion_end - time.perf_counter()
+        return f" ({remaining:.2f} s)" if remaining > 0 else ""
+
+    def _start_motion(self, start_motion) -> Future:
+        """Issues a motion, watched by the motion done events of the XPS if enabled"""
+        if not self.settings["motion_events"]:
+            return start_motion()
+        self._watched_motion = self.controller.motion_done_listener().watch(start_motion)
+        return self._watched_motion
+
+    def _follow_motion(self, motion: Future):
+        """Queues the end of a motion for _report_motions, the motion ending in a thread of the controller"""
+        displacement, fast_steps, parameters = self._motion_displacement, self._fast_steps, None
+        if displacement is not None:
+            parameters = self.controller.motion_model().parameters()
+        motion.add_done_callback(
+            lambda future: self._finished_motions.put((future, displacement, fast_steps, parameters))
+        )
+
+    def _report_motions(self):
+        """Reports the end of the motions, or the errors of the motion commands, from the plugin thread"""
+        while True:
+            try:
+                motion, *moved_with = self._finished_motions.get_nowait()
+            except queue.Empty:
+                return
+            self._motion_finished(motion, *moved_with)
+
+    def _motion_finished(self, motion: Future, displacement: float | None, fast_steps: FastSteps | None,
+                         parameters: tuple | None):
+        self._motion_end = 0.0
+        if motion.cancelled():
+            return
+        if motion.exception() is not None:
+            self.emit_status(ThreadCommand("Update_Status", [f"{motion.exception()}"]))
+            return
+        if motion is self._watched_motion:
+            self._last_position = motion.result()
+            self._last_position_time = time.perf_counter()
+            # the final position is reported by the motion done event, stamped at its reception
+            self._last_controller_time = self._controller_time(
+                self.controller.controller_time(time.perf_counter_ns())
+            )
+            self.move_done(self._stamped(self.get_position_with_scaling(self._to_actuator(motion.result()))))
+        if displacement is None or fast_steps is not self._fast_steps:
+            return
+        # the times of the move cost a request, read in fast steps mode or if the calibration is enabled
+        try:
+            if self.controller.motion_model().parameters() != parameters:
+                # the profile changed since the move was sent, ex: fast steps stopped during the move
+                return
+            if fast_steps is not None:
+                if fast_steps.record(displacement) is not None:
+                    saved, _ = self._fast_steps.time_saved()
+                    self.settings.child("motion", "time_saved").setValue(saved * 1e3)
+            elif self.settings["motion", "calibrate"]:
+                self.controller.calibrate_motion_model(displacement)
         except XPSError as e:
             self.emit_status(ThreadCommand("Update_Status", [f"{e}"]))
 
     def stop_motion(self):
-        """NOT IMPLEMENTED --- Stop the actuator and emits move_done signal"""
-
-        ## Not possible to implement with this system as far as I'm aware.
-        raise NotImplementedError
+        """Stop the actuator and emits move_done signal"""
+        try:
+            latency = self.controller.stop_motion(
+                self.settings["abort_acceleration"]
+            )
+        except XPSError as e:
+            self.emit_status(ThreadCommand("Update_Status", [f"{e}"]))
+        else:
+            self.emit_status(
+                ThreadCommand(
+                    "Update_Status", [f"Motion aborted in {latency * 1e3:.1f} ms"]
+                )
+            )
+        self.move_done()
 
 
 if __name__ == "__main__":
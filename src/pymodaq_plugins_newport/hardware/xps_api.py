@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+"""
+Declarative table of the XPS API functions.
+
+Each line of :data:`API_TABLE` declares the input arguments of one function, as in the XPS programmer's
+manual, followed by its description::
+
+    Name(Argument1, Argument2[], nbElement) : description
+
+* ``Argument[]`` is a list argument. Its values are joined with commas, and the values of several
+  list arguments are interleaved, ex: ``GPIOAnalogSet(GPIO2.DAC1,1.5,GPIO2.DAC2,0.5)``
+* ``nbElement`` is the number of positioners of the group for the functions returning one set of values
+  per positioner. It is not sent, the outputs are repeated instead
+
+The outputs of each function are declared in :data:`xps_codec.SIGNATURES`. The methods of the XPS
+class are generated from these two tables on their first use, see XPS_Q8_drivers.
+"""
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+from .xps_codec import SIGNATURES, build_command, output_types
+
+# functions returning their two strings unsplit, as [error, returnedString]
+RAW_REPLY_APIS = ('EventExtendedGet', 'HardwareDriverAndStageGet')
+
+API_TABLE = """
+ControllerMotionKernelMinMaxTimeLoadGet() : Get controller motion kernel minimum and maximum time load
+ControllerMotionKernelMinMaxTimeLoadReset() : Reset controller motion kernel min/max time load
+ControllerMotionKernelTimeLoadGet() : Get controller motion kernel time load
+ControllerRTTimeGet() : Get controller corrector period and calculation time
+ControllerSlaveStatusGet() : Read slave controller status
+ControllerSlaveStatusStringGet(SlaveControllerStatusCode) : Return the slave controller status string
+ControllerSynchronizeCorrectorISR(ModeString) : Synchronize controller corrector ISR
+ControllerStatusGet() : Get controller current status and reset the status
+ControllerStatusRead() : Read controller current status
+ControllerStatusStringGet(ControllerStatusCode) : Return the controller status string
+ElapsedTimeGet() : Return elapsed time from controller power on
+ErrorStringGet(ErrorCode) : Return the error string corresponding to the error code
+FirmwareVersionGet() : Return firmware version
+TCLScriptExecute(TCLFileName, TaskName, ParametersList) : Execute a TCL script from a TCL file
+TCLScriptExecuteAndWait(TCLFileName, TaskName, InputParametersList) : Execute a TCL script from a TCL file and wait the end of execution to return
+TCLScriptExecuteWithPriority(TCLFileName, TaskName, TaskPriorityLevel, ParametersList) : Execute a TCL script with defined priority
+TCLScriptKill(TaskName) : Kill TCL Task
+TCLScriptKillAll() : Kill all TCL Tasks
+TimerGet(TimerName) : Get a timer
+TimerSet(TimerName, FrequencyTicks) : Set a timer
+Reboot() : Reboot the controller
+Login(Name, Password) : Log in
+CloseAllOtherSockets() : Close all socket beside the one used to send this command
+HardwareDateAndTimeGet() : Return hardware date and time
+HardwareDateAndTimeSet(DateAndTime) : Set hardware date and time
+EventAdd(PositionerName, EventName, EventParameter, ActionName, ActionParameter1, ActionParameter2, ActionParameter3) : ** OBSOLETE ** Add an event
+EventGet(PositionerName) : ** OBSOLETE ** Read events and actions list
+EventRemove(PositionerName, EventName, EventParameter) : ** OBSOLETE ** Delete an event
+EventWait(PositionerName, EventName, EventParameter) : ** OBSOLETE ** Wait an event
+EventExtendedConfigurationTriggerSet(ExtendedEventName[], EventParameter1[], EventParameter2[], EventParameter3[], EventParameter4[]) : Configure one or several events
+EventExtendedConfigurationTriggerGet() : Read the event configuration
+EventExtendedConfigurationActionSet(ExtendedActionName[], ActionParameter1[], ActionParameter2[], ActionParameter3[], ActionParameter4[]) : Configure one or several actions
+EventExtendedConfigurationActionGet() : Read the action configuration
+EventExtendedStart() : Launch the last event and action configuration and return an ID
+EventExtendedAllGet() : Read all event and action configurations
+EventExtendedGet(ID) : Read the event and action configuration defined by ID
+EventExtendedRemove(ID) : Remove the event and action configuration defined by ID
+EventExtendedWait() : Wait events from the last event configuration
+GatheringConfigurationGet() : Read different mnemonique type
+GatheringConfigurationSet(Type[]) : Configuration acquisition
+GatheringCurrentNumberGet() : Maximum number of samples and current number during acquisition
+GatheringStopAndSave() : Stop acquisition and save data
+GatheringDataAcquire() : Acquire a configured data
+GatheringDataGet(IndexPoint) : Get a data line from gathering buffer
+GatheringDataMultipleLinesGet(IndexPoint, NumberOfLines) : Get multiple data lines from gathering buffer
+GatheringReset() : Empty the gathered data in memory to start new gathering from scratch
+GatheringRun(DataNumber, Divisor) : Start a new gathering
+GatheringRunAppend() : Re-start the stopped gathering to add new data
+GatheringStop() : Stop the data gathering (without saving to file)
+GatheringExternalConfigurationSet(Type[]) : Configuration acquisition
+GatheringExternalConfigurationGet() : Read different mnemonique type
+GatheringExternalCurrentNumberGet() : Maximum number of samples and current number during acquisition
+GatheringExternalDataGet(IndexPoint) : Get a data line from external gathering buffer
+GatheringExternalStopAndSave() : Stop acquisition and save data
+GlobalArrayGet(Number) : Get global array value
+GlobalArraySet(Number, ValueString) : Set global array value
+DoubleGlobalArrayGet(Number) : Get double global array value
+DoubleGlobalArraySet(Number, DoubleValue) : Set double global array value
+GPIOAnalogGet(GPIOName[]) : Read analog input or analog output for one or few input
+GPIOAnalogSet(GPIOName[], AnalogOutputValue[]) : Set analog output for one or few output
+GPIOAnalogGainGet(GPIOName[]) : Read analog input gain (1, 2, 4 or 8) for one or few input
+GPIOAnalogGainSet(GPIOName[], AnalogInputGainValue[]) : Set analog input gain (1, 2, 4 or 8) for one or few input
+GPIODigitalGet(GPIOName) : Read digital output or digital input
+GPIODigitalSet(GPIOName, Mask, DigitalOutputValue) : Set Digital Output for one or few output TTL
+GroupAccelerationSetpointGet(GroupName, nbElement) : Return setpoint accelerations
+GroupAnalogTrackingModeEnable(GroupName, Type) : Enable Analog Tracking mode on selected group
+GroupAnalogTrackingModeDisable(GroupName) : Disable Analog Tracking mode on selected group
+GroupCorrectorOutputGet(GroupName, nbElement) : Return corrector outputs
+GroupCurrentFollowingErrorGet(GroupName, nbElement) : Return current following errors
+GroupHomeSearch(GroupName) : Start home search sequence
+GroupHomeSearchAndRelativeMove(GroupName, TargetDisplacement[]) : Start home search sequence and execute a displacement
+GroupInitialize(GroupName) : Start the initialization
+GroupInitializeNoEncoderReset(GroupName) : Start the initialization with no encoder reset
+GroupInitializeWithEncoderCalibration(GroupName) : Start the initialization with encoder calibration
+GroupInterlockDisable(GroupName) : Set group interlock disable
+GroupInterlockEnable(GroupName) : Set group interlock enable
+GroupJogParametersSet(GroupName, Velocity[], Acceleration[]) : Modify Jog parameters on selected group and activate the continuous move
+GroupJogParametersGet(GroupName, nbElement) : Get Jog parameters on selected group
+GroupJogCurrentGet(GroupName, nbElement) : Get Jog current on selected group
+GroupJogModeEnable(GroupName) : Enable Jog mode on selected group
+GroupJogModeDisable(GroupName) : Disable Jog mode on selected group
+GroupKill(GroupName) : Kill the group
+GroupMotionDisable(GroupName) : Set Motion disable on selected group
+GroupMotionEnable(GroupName) : Set Motion enable on selected group
+GroupMotionStatusGet(GroupName, nbElement) : Return group or positioner status
+GroupMoveAbort(GroupName) : Abort a move
+GroupMoveAbortFast(GroupName, AccelerationMultiplier) : Abort quickly a move
+GroupMoveAbsolute(GroupName, TargetPosition[]) : Do an absolute move
+GroupMoveRelative(GroupName, TargetDisplacement[]) : Do a relative move
+GroupPositionCorrectedProfilerGet(GroupName, PositionX, PositionY) : Return corrected profiler positions
+GroupPositionCurrentGet(GroupName, nbElement) : Return current positions
+GroupPositionPCORawEncoderGet(GroupName, PositionX, PositionY) : Return PCO raw encoder positions
+GroupPositionSetpointGet(GroupName, nbElement) : Return setpoint positions
+GroupPositionTargetGet(GroupName, nbElement) : Return target positions
+GroupReferencingActionExecute(PositionerName, ReferencingAction, ReferencingSensor, ReferencingParameter) : Execute an action in referencing mode
+GroupReferencingStart(GroupName) : Enter referencing mode
+GroupReferencingStop(GroupName) : Exit referencing mode
+GroupStatusGet(GroupName) : Return group status
+GroupStatusStringGet(GroupStatusCode) : Return the group status string corresponding to the group status code
+GroupVelocityCurrentGet(GroupName, nbElement) : Return current velocities
+KillAll() : Put all groups in 'Not initialized' state
+RestartApplication() : Restart the Controller
+PositionerAnalogTrackingPositionParametersGet(PositionerName) : Read dynamic parameters for one axe of a group for a future analog tracking position
+PositionerAnalogTrackingPositionParametersSet(PositionerName, GPIOName, Offset, Scale, Velocity, Acceleration) : Update dynamic parameters for one axe of a group for a future analog tracking position
+PositionerAnalogTrackingVelocityParametersGet(PositionerName) : Read dynamic parameters for one axe of a group for a future analog tracking velocity
+PositionerAnalogTrackingVelocityParametersSet(PositionerName, GPIOName, Offset, Scale, DeadBandThreshold, Order, Velocity, Acceleration) : Update dynamic parameters for one axe of a group for a future analog tracking velocity
+PositionerBacklashGet(PositionerName) : Read backlash value and status
+PositionerBacklashSet(PositionerName, BacklashValue) : Set backlash value
+PositionerBacklashEnable(PositionerName) : Enable the backlash
+PositionerBacklashDisable(PositionerName) : Disable the backlash
+PositionerCompensatedPCOAbort(PositionerName) : Abort CIE08 compensated PCO mode
+PositionerCompensatedPCOCurrentStatusGet(PositionerName) : Get current status of CIE08 compensated PCO mode
+PositionerCompensatedPCOEnable(PositionerName) : Enable CIE08 compensated PCO mode execution
+PositionerCompensatedPCOFromFile(PositionerName, DataFileName) : Load file to CIE08 compensated PCO data buffer
+PositionerCompensatedPCOLoadToMemory(PositionerName, DataLines) : Load data lines to CIE08 compensated PCO data buffer
+PositionerCompensatedPCOMemoryReset(PositionerName) : Reset CIE08 compensated PCO data buffer
+PositionerCompensatedPCOPrepare(PositionerName, ScanDirection, StartPosition[]) : Prepare data for CIE08 compensated PCO mode
+PositionerCompensatedPCOSet(PositionerName, Start, Stop, Distance, Width) : Set data to CIE08 compensated PCO data buffer
+PositionerCompensationFrequencyNotchsGet(PositionerName) : Read frequency compensation notch filters parameters
+PositionerCompensationFrequencyNotchsSet(PositionerName, NotchFrequency1, NotchBandwidth1, NotchGain1, NotchFrequency2, NotchBandwidth2, NotchGain2, NotchFrequency3, NotchBandwidth3, NotchGain3) : Update frequency compensation notch filters parameters
+PositionerCompensationLowPassTwoFilterGet(PositionerName) : Read second order low-pass filter parameters
+PositionerCompensationLowPassTwoFilterSet(PositionerName, CutOffFrequency) : Update second order low-pass filter parameters
+PositionerCompensationNotchModeFiltersGet(PositionerName) : Read notch mode filters parameters
+PositionerCompensationNotchModeFiltersSet(PositionerName, NotchModeFr1, NotchModeFa1, NotchModeZr1, NotchModeZa1, NotchModeFr2, NotchModeFa2, NotchModeZr2, NotchModeZa2) : Update notch mode filters parameters
+PositionerCompensationPhaseCorrectionFiltersGet(PositionerName) : Read phase correction filters parameters
+PositionerCompensationPhaseCorrectionFiltersSet(PositionerName, PhaseCorrectionFn1, PhaseCorrectionFd1, PhaseCorrectionGain1, PhaseCorrectionFn2, PhaseCorrectionFd2, PhaseCorrectionGain2) : Update phase correction filters parameters
+PositionerCompensationSpatialPeriodicNotchsGet(PositionerName) : Read spatial compensation notch filters parameters
+PositionerCompensationSpatialPeriodicNotchsSet(PositionerName, SpatialNotchStep1, SpatialNotchBandwidth1, SpatialNotchGain1, SpatialNotchStep2, SpatialNotchBandwidth2, SpatialNotchGain2, SpatialNotchStep3, SpatialNotchBandwidth3, SpatialNotchGain3) : Update spatial compensation notch filters parameters
+PositionerCorrectorNotchFiltersSet(PositionerName, NotchFrequency1, NotchBandwidth1, NotchGain1, NotchFrequency2, NotchBandwidth2, NotchGain2) : Update filters parameters
+PositionerCorrectorNotchFiltersGet(PositionerName) : Read filters parameters
+PositionerCorrectorPIDBaseSet(PositionerName, MovingMass, StaticMass, Viscosity, Stiffness) : Update PIDBase parameters
+PositionerCorrectorPIDBaseGet(PositionerName) : Read PIDBase parameters
+PositionerCorrectorPIDFFAccelerationSet(PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, KFeedForwardAcceleration, KFeedForwardJerk) : Update corrector parameters
+PositionerCorrectorPIDFFAccelerationGet(PositionerName) : Read corrector parameters
+PositionerCorrectorP2IDFFAccelerationSet(PositionerName, ClosedLoopStatus, KP, KI, KI2, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, KFeedForwardAcceleration, KFeedForwardJerk, SetpointPositionDelay) : Update corrector parameters
+PositionerCorrectorP2IDFFAccelerationGet(PositionerName) : Read corrector parameters
+PositionerCorrectorPIDFFVelocitySet(PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, KFeedForwardVelocity) : Update corrector parameters
+PositionerCorrectorPIDFFVelocityGet(PositionerName) : Read corrector parameters
+PositionerCorrectorPIDDualFFVoltageSet(PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, KFeedForwardVelocity, KFeedForwardAcceleration, Friction) : Update corrector parameters
+PositionerCorrectorPIDDualFFVoltageGet(PositionerName) : Read corrector parameters
+PositionerCorrectorPIPositionSet(PositionerName, ClosedLoopStatus, KP, KI, IntegrationTime) : Update corrector parameters
+PositionerCorrectorPIPositionGet(PositionerName) : Read corrector parameters
+PositionerCorrectorSR1AccelerationSet(PositionerName, ClosedLoopStatus, KP, KI, KV, ObserverFrequency, CompensationGainVelocity, CompensationGainAcceleration, CompensationGainJerk) : Update corrector parameters
+PositionerCorrectorSR1AccelerationGet(PositionerName) : Read corrector parameters
+PositionerCorrectorSR1ObserverAccelerationSet(PositionerName, ParameterA, ParameterB, ParameterC) : Update SR1 corrector observer parameters
+PositionerCorrectorSR1ObserverAccelerationGet(PositionerName) : Read SR1 corrector observer parameters
+PositionerCorrectorSR1OffsetAccelerationSet(PositionerName, AccelerationOffset) : Update SR1 corrector output acceleration offset
+PositionerCorrectorSR1OffsetAccelerationGet(PositionerName) : Read SR1 corrector output acceleration offset
+PositionerCorrectorTypeGet(PositionerName) : Read corrector type
+PositionerCurrentVelocityAccelerationFiltersSet(PositionerName, CurrentVelocityCutOffFrequency, CurrentAccelerationCutOffFrequency) : Set current velocity and acceleration cut off frequencies
+PositionerCurrentVelocityAccelerationFiltersGet(PositionerName) : Get current velocity and acceleration cut off frequencies
+PositionerDriverFiltersGet(PositionerName) : Get driver filters parameters
+PositionerDriverFiltersSet(PositionerName, KI, NotchFrequency, NotchBandwidth, NotchGain, LowpassFrequency) : Set driver filters parameters
+PositionerDriverPositionOffsetsGet(PositionerName) : Get driver stage and gage position offset
+PositionerDriverStatusGet(PositionerName) : Read positioner driver status
+PositionerDriverStatusStringGet(PositionerDriverStatus) : Return the positioner driver status string corresponding to the positioner error code
+PositionerEncoderAmplitudeValuesGet(PositionerName) : Read analog interpolated encoder amplitude values
+PositionerEncoderCalibrationParametersGet(PositionerName) : Read analog interpolated encoder calibration parameters
+PositionerErrorGet(PositionerName) : Read and clear positioner error code
+PositionerErrorRead(PositionerName) : Read only positioner error code without clear it
+PositionerErrorStringGet(PositionerErrorCode) : Return the positioner status string corresponding to the positioner error code
+PositionerExcitationSignalGet(PositionerName) : Get excitation signal mode
+PositionerExcitationSignalSet(PositionerName, Mode, Frequency, Amplitude, Time) : Set excitation signal mode
+PositionerHardwareStatusGet(PositionerName) : Read positioner hardware status
+PositionerHardwareStatusStringGet(PositionerHardwareStatus) : Return the positioner hardware status string corresponding to the positioner error code
+PositionerHardInterpolatorFactorGet(PositionerName) : Get hard interpolator parameters
+PositionerHardInterpolatorFactorSet(PositionerName, InterpolationFactor) : Set hard interpolator parameters
+PositionerHardInterpolatorPositionGet(PositionerName) : Read external latch position
+PositionerMaximumVelocityAndAccelerationGet(PositionerName) : Return maximum velocity and acceleration of the positioner
+PositionerMotionDoneGet(PositionerName) : Read motion done parameters
+PositionerMotionDoneSet(PositionerName, PositionWindow, VelocityWindow, CheckingTime, MeanPeriod, TimeOut) : Update motion done parameters
+PositionerPositionCompareAquadBAlwaysEnable(PositionerName) : Enable AquadB signal in always mode
+PositionerPositionCompareAquadBWindowedGet(PositionerName) : Read position compare AquadB windowed parameters
+PositionerPositionCompareAquadBWindowedSet(PositionerName, MinimumPosition, MaximumPosition) : Set position compare AquadB windowed parameters
+PositionerPositionCompareGet(PositionerName) : Read position compare parameters
+PositionerPositionCompareSet(PositionerName, MinimumPosition, MaximumPosition, PositionStep) : Set position compare parameters
+PositionerPositionCompareEnable(PositionerName) : Enable position compare
+PositionerPositionCompareDisable(PositionerName) : Disable position compare
+PositionerPositionComparePulseParametersGet(PositionerName) : Get position compare PCO pulse parameters
+PositionerPositionComparePulseParametersSet(PositionerName, PCOPulseWidth, EncoderSettlingTime) : Set position compare PCO pulse parameters
+PositionerPositionCompareScanAccelerationLimitGet(PositionerName) : Get position compare scan acceleration limit
+PositionerPositionCompareScanAccelerationLimitSet(PositionerName, ScanAccelerationLimit) : Set position compare scan acceleration limit
+PositionerPreCorrectorExcitationSignalGet(PositionerName) : Get pre-corrector excitation signal mode
+PositionerPreCorrectorExcitationSignalSet(PositionerName, Frequency, Amplitude, Time) : Set pre-corrector excitation signal mode
+PositionerRawEncoderPositionGet(PositionerName, UserEncoderPosition) : Get the raw encoder position
+PositionersEncoderIndexDifferenceGet(PositionerName) : Return the difference between index of primary axis and secondary axis (only after homesearch)
+PositionerSGammaExactVelocityAjustedDisplacementGet(PositionerName, DesiredDisplacement) : Return adjusted displacement to get exact velocity
+PositionerSGammaParametersGet(PositionerName) : Read dynamic parameters for one axe of a group for a future displacement
+PositionerSGammaParametersSet(PositionerName, Velocity, Acceleration, MinimumTjerkTime, MaximumTjerkTime) : Update dynamic parameters for one axe of a group for a future displacement
+PositionerSGammaPreviousMotionTimesGet(PositionerName) : Read SettingTime and SettlingTime
+PositionerStageParameterGet(PositionerName, ParameterName) : Return the stage parameter
+PositionerStageParameterSet(PositionerName, ParameterName, ParameterValue) : Save the stage parameter
+PositionerTimeFlasherGet(PositionerName) : Read time flasher parameters
+PositionerTimeFlasherSet(PositionerName, MinimumPosition, MaximumPosition, TimeInterval) : Set time flasher parameters
+PositionerTimeFlasherEnable(PositionerName) : Enable time flasher
+PositionerTimeFlasherDisable(PositionerName) : Disable time flasher
+PositionerUserTravelLimitsGet(PositionerName) : Read UserMinimumTarget and UserMaximumTarget
+PositionerUserTravelLimitsSet(PositionerName, UserMinimumTarget, UserMaximumTarget) : Update UserMinimumTarget and UserMaximumTarget
+PositionerWarningFollowingErrorSet(PositionerName, WarningFollowingError) : Set positioner warning following error limit
+PositionerWarningFollowingErrorGet(PositionerName) : Get positioner warning following error limit
+PositionerCorrectorAutoTuning(PositionerName, TuningMode) : Astrom&Hagglund based auto-tuning
+PositionerAccelerationAutoScaling(PositionerName) : Astrom&Hagglund based auto-scaling
+MultipleAxesPVTVerification(GroupName, TrajectoryFileName) : Multiple axes PVT trajectory verification
+MultipleAxesPVTVerificationResultGet(PositionerName) : Multiple axes PVT trajectory verification result get
+MultipleAxesPVTExecution(GroupName, TrajectoryFileName, ExecutionNumber) : Multiple axes PVT trajectory execution
+MultipleAxesPVTParametersGet(GroupName) : Multiple axes PVT trajectory get parameters
+MultipleAxesPVTPulseOutputSet(GroupName, StartElement, EndElement, TimeInterval) : Configure pulse output on trajectory
+MultipleAxesPVTPulseOutputGet(GroupName) : Get pulse output on trajectory configuration
+MultipleAxesPVTLoadToMemory(GroupName, TrajectoryPart) : Multiple Axes Load PVT trajectory through function
+MultipleAxesPVTResetInMemory(GroupName) : Multiple Axes PVT trajectory reset in memory
+SingleAxisSlaveModeEnable(GroupName) : Enable the slave mode
+SingleAxisSlaveModeDisable(GroupName) : Disable the slave mode
+SingleAxisSlaveParametersSet(GroupName, PositionerName, Ratio) : Set slave parameters
+SingleAxisSlaveParametersGet(GroupName) : Get slave parameters
+SingleAxisThetaClampDisable(GroupName) : Set clamping disable on selected group
+SingleAxisThetaClampEnable(GroupName) : Set clamping enable on selected group
+SingleAxisThetaSlaveModeEnable(GroupName) : Enable the slave mode
+SingleAxisThetaSlaveModeDisable(GroupName) : Disable the slave mode
+SingleAxisThetaSlaveParametersSet(GroupName, PositionerName, Ratio) : Set slave parameters
+SingleAxisThetaSlaveParametersGet(GroupName) : Get slave parameters
+SpindleSlaveModeEnable(GroupName) : Enable the slave mode
+SpindleSlaveModeDisable(GroupName) : Disable the slave mode
+SpindleSlaveParametersSet(GroupName, PositionerName, Ratio) : Set slave parameters
+SpindleSlaveParametersGet(GroupName) : Get slave parameters
+GroupSpinParametersSet(GroupName, Velocity, Acceleration) : Modify Spin parameters on selected group and activate the continuous move
+GroupSpinParametersGet(GroupName) : Get Spin parameters on selected group
+GroupSpinCurrentGet(GroupName) : Get Spin current on selected group
+GroupSpinModeStop(GroupName, Acceleration) : Stop Spin mode on selected group with specified acceleration
+XYLineArcVerification(GroupName, TrajectoryFileName) : XY trajectory verification
+XYLineArcVerificationResultGet(PositionerName) : XY trajectory verification result get
+XYLineArcExecution(GroupName, TrajectoryFileName, Velocity, Acceleration, ExecutionNumber) : XY trajectory execution
+XYLineArcParametersGet(GroupName) : XY trajectory get parameters
+XYLineArcPulseOutputSet(GroupName, StartLength, EndLength, PathLengthInterval) : Configure pulse output on trajectory
+XYLineArcPulseOutputGet(GroupName) : Get pulse output on trajectory configuration
+XYPVTVerification(GroupName, TrajectoryFileName) : XY PVT trajectory verification
+XYPVTVerificationResultGet(PositionerName) : XY PVT trajectory verification result get
+XYPVTExecution(GroupName, TrajectoryFileName, ExecutionNumber) : XY PVT trajectory execution
+XYPVTParametersGet(GroupName) : XY PVT trajectory get parameters
+XYPVTPulseOutputSet(GroupName, StartElement, EndElement, TimeInterval) : Configure pulse output on trajectory
+XYPVTPulseOutputGet(GroupName) : Get pulse output on trajectory configuration
+XYPVTLoadToMemory(GroupName, TrajectoryPart) : XY Load PVT trajectory through function
+XYPVTResetInMemory(GroupName) : XY PVT trajectory reset in memory
+XYZGroupPositionCorrectedProfilerGet(GroupName, PositionX, PositionY, PositionZ) : Return corrected profiler positions
+XYZGroupPositionPCORawEncoderGet(GroupName, PositionX, PositionY, PositionZ) : Return PCO raw encoder positions
+XYZSplineVerification(GroupName, TrajectoryFileName) : XYZ trajectory verifivation
+XYZSplineVerificationResultGet(PositionerName) : XYZ trajectory verification result get
+XYZSplineExecution(GroupName, TrajectoryFileName, Velocity, Acceleration) : XYZ trajectory execution
+XYZSplineParametersGet(GroupName) : XYZ trajectory get parameters
+TZPVTVerification(GroupName, TrajectoryFileName) : TZ PVT trajectory verification
+TZPVTVerificationResultGet(PositionerName) : TZ PVT trajectory verification result get
+TZPVTExecution(GroupName, TrajectoryFileName, ExecutionNumber) : TZ PVT trajectory execution
+TZPVTParametersGet(GroupName) : TZ PVT trajectory get parameters
+TZPVTPulseOutputSet(GroupName, StartElement, EndElement, TimeInterval) : Configure pulse output on trajectory
+TZPVTPulseOutputGet(GroupName) : Get pulse output on trajectory configuration
+TZPVTLoadToMemory(GroupName, TrajectoryPart) : TZ Load PVT trajectory through function
+TZPVTResetInMemory(GroupName) : TZ PVT trajectory reset in memory
+TZFocusModeEnable(GroupName) : Enable the focus mode
+TZFocusModeDisable(GroupName) : Disable the focus mode
+TZTrackingUserMaximumZZZTargetDifferenceGet(GroupName) : Get user maximum ZZZ target difference for tracking control
+TZTrackingUserMaximumZZZTargetDifferenceSet(GroupName, UserMaximumZZZTargetDifference) : Set user maximum ZZZ target difference for tracking control
+FocusProcessSocketReserve() : Set user maximum ZZZ target difference for tracking control
+FocusProcessSocketFree() : Set user maximum ZZZ target difference for tracking control
+PositionerMotorOutputOffsetGet(PositionerName) : Get soft (user defined) motor output DAC offsets
+PositionerMotorOutputOffsetSet(PositionerName, PrimaryDAC1, PrimaryDAC2, SecondaryDAC1, SecondaryDAC2) : Set soft (user defined) motor output DAC offsets
+SingleAxisThetaPositionRawGet(GroupName) : Get raw encoder positions for single axis theta encoder
+EEPROMCIESet(CardNumber, ReferenceString) : Get raw encoder positions for single axis theta encoder
+EEPROMDACOffsetCIESet(PlugNumber, DAC1Offset, DAC2Offset) : Get raw encoder positions for single axis theta encoder
+EEPROMDriverSet(PlugNumber, ReferenceString) : Get raw encoder positions for single axis theta encoder
+EEPROMINTSet(CardNumber, ReferenceString) : Get raw encoder positions for single axis theta encoder
+CPUCoreAndBoardSupplyVoltagesGet() : Get raw encoder positions for single axis theta encoder
+CPUTemperatureAndFanSpeedGet() : Get raw encoder positions for single axis theta encoder
+ActionListGet() : Action list
+ActionExtendedListGet() : Action extended list
+APIExtendedListGet() : API method list
+APIListGet() : API method list without extended API
+ControllerStatusListGet() : Controller status list
+ErrorListGet() : Error list
+EventListGet() : General event list
+GatheringListGet() : Gathering type list
+GatheringExtendedListGet() : Gathering type extended list
+GatheringExternalListGet() : External Gathering type list
+GroupStatusListGet() : Group status list
+HardwareInternalListGet() : Internal hardware list
+HardwareDriverAndStageGet(PlugNumber) : Smart hardware
+ObjectsListGet() : Group name and positioner name
+PositionerErrorListGet() : Positioner error list
+PositionerHardwareStatusListGet() : Positioner hardware status list
+PositionerDriverStatusListGet() : Positioner driver status list
+ReferencingActionListGet() : Get referencing action list
+ReferencingSensorListGet() : Get referencing sensor list
+GatheringUserDatasGet() : Return UserDatas values
+ControllerMotionKernelPeriodMinMaxGet() : Get controller motion kernel min/max periods
+ControllerMotionKernelPeriodMinMaxReset() : Reset controller motion kernel min/max periods
+SocketsStatusGet() : Get sockets current status
+TestTCP(InputString) : Test TCP/IP transfert
+OptionalModuleExecute(ModuleFileName) : Execute an optional module
+OptionalModuleKill(TaskName) : Kill an optional module
+"""
+
+
+class ApiSpec(NamedTuple):
+    """Input arguments of an XPS function
+
+    arguments: tuple of str
+        names of the arguments of the XPS method, after socketId
+    lists: tuple of bool
+        True for the list arguments
+    description: str
+    """
+    arguments: Tuple[str, ...]
+    lists: Tuple[bool, ...]
+    description: str = ''
+
+
+@lru_cache(maxsize=None)
+def api_spec(api_name: str) -> Optional[ApiSpec]:
+    """Returns the declaration of the XPS function api_name, None if it isn't in the table
+
+    Only the line of the function is parsed, so that using a few functions doesn't cost the parsing of
+    the whole table.
+    """
+    start = API_TABLE.find(f'\n{api_name}(')
+    if start < 0:
+        return None
+    line = API_TABLE[start + len(api_name) + 2:API_TABLE.index('\n', start + 1)]
+    arguments, _, description = line.partition(' : ')
+    arguments = [argument.strip() for argument in arguments.rstrip(')').split(',') if argument.strip()]
+    return ApiSpec(tuple(argument.rstrip('[]') for argument in arguments),
+                   tuple(argument.endswith('[]') for argument in arguments), description)
+
+
+@lru_cache(maxsize=None)
+def api_names() -> Tuple[str, ...]:
+    """Names of all the functions of the table"""
+    return tuple(re.findall(r'^(\w+)\(', API_TABLE, re.MULTILINE))
+
+
+def build_api_command(api_name: str, arguments: Sequence) -> Tuple[str, int]:
+    """Build the command string of an XPS function from the arguments of its method
+
+    Parameters
+    ----------
+    api_name: str
+        name of the XPS function, ex: 'GroupPositionCurrentGet'
+    arguments: sequence
+        arguments of the XPS method, without socketId, ex: ('Group1', 2)
+
+    Returns
+    -------
+    str: the command, ex: 'GroupPositionCurrentGet(Group1,double *,double *)'
+    int: the number of elements to decode the reply with, see xps_codec.decode_reply
+    """
+    spec = api_spec(api_name)
+    if spec is None:
+        # undeclared function, ex: an API of a newer firmware, sent as is
+        return build_command(api_name, arguments), 1
+    if len(arguments) != len(spec.arguments):
+        raise TypeError(f'{api_name}() takes {len(spec.arguments)} arguments after socketId '
+                        f'({len(arguments)} given)')
+    nb_element = 1
+    fields = []
+    lists = []
+    for name, is_list, argument in zip(spec.arguments, spec.lists, arguments):
+        if name == 'nbElement':
+            nb_element = argument
+        elif is_list:
+            lists.append(argument)
+        else:
+            fields.append(argument)
+    if not lists:
+        return build_command(api_name, fields, nb_element), nb_element
+
+    signature = SIGNATURES.get(api_name)
+    per_element = signature is not None and signature.per_element
+    if per_element:
+        # one set of outputs after each element, ex: GPIOAnalogGet(GPIO2.ADC1,double *,GPIO2.ADC2,double *)
+        nb_element = len(lists[0])
+        placeholders = [f'{c_type} *' for c_type in signature.outputs]
+    for index in range(len(lists[0])):
+        fields.extend(str(values[index]) for values in lists)
+        if per_element:
+            fields.extend(placeholders)
+    if not per_element:
+        fields.extend(f'{c_type} *' for c_type in output_types(api_name))
+    return f"{api_name}({','.join(str(field) for field in fields)})", nb_element
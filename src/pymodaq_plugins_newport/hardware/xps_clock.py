@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Alignment of the host clock on the clock of the XPS.
+
+A position read by the host is only known to have been acquired by the controller somewhere between the
+request and the reply, the network jitter becomes position noise once correlated with detector data.
+:class:`ClockSync` samples the controller clock (ElapsedTimeGet, seconds since the controller boot)
+against time.perf_counter_ns, keeps for each sample the request with the shortest round trip of a burst,
+and fits the offset and the drift of the controller clock over a sliding window of samples. The host
+times of the positions and of the gathering runs are then converted into controller times.
+"""
+import threading
+import time
+from collections import deque
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .xps_codec import XPSError
+
+
+class ClockSync:
+    """
+    Online estimate of the controller clock from the host clock
+
+    Parameters
+    ----------
+    controller: SimpleXPS
+        connection to the XPS, the samples are requested on a socket reserved in its pool
+    interval: float
+        time in seconds between two samples of the background thread, see start
+    window: int
+        number of samples of the fit, older ones are dropped so that the drift follows the temperature
+    burst: int
+        number of ElapsedTimeGet per sample, the one with the shortest round trip is kept
+
+    Example
+    -------
+    >>> clock = simple_xps.start_clock_sync(interval=5.)
+    >>> position = simple_xps.get_position()
+    >>> simple_xps.position_time  # controller time of the position acquisition, in s
+    >>> clock.controller_time(time.perf_counter_ns())
+    """
+
+    def __init__(self, controller, interval: float = 10.0, window: int = 60, burst: int = 5):
+        self._controller = controller
+        self.interval = interval
+        self.burst = burst
+        # (host time in s, controller time in s, round trip in s)
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        # controller time = offset + rate * (host time - host_reference)
+        self._host_reference = 0.0
+        self.offset = 0.0
+        self.rate = 1.0
+        self.residual: Optional[float] = None
+        self._socket_id = -1
+        self._stop: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self.nb_errors = 0
+        self.last_error = ""
+
+    @property
+    def synchronized(self) -> bool:
+        """True once a sample was taken"""
+        return bool(self._samples)
+
+    @property
+    def drift(self) -> float:
+        """Relative drift of the controller clock, ex: 2e-6 if it gains 2 µs per second of the host clock"""
+        return self.rate - 1.0
+
+    @property
+    def running(self) -> bool:
+        return self._stop is not None
+
+    def start(self):
+        """Samples the controller clock now, then every interval seconds from a daemon thread"""
+        self.stop()
+        self.sample()
+        stop = self._stop = threading.Event()
+
+        def run():
+            while not stop.wait(self.interval):
+                try:
+                    self.sample()
+                except XPSError as e:
+                    self.nb_errors += 1
+                    self.last_error = f"{e}"
+        self._thread = threading.Thread(target=run, name="xps_clock_sync", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        """Stops sampling and closes the socket of the sampler, the fit is kept"""
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+            self._thread.join(timeout)
+            self._thread = None
+        self._release()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _socket(self) -> int:
+        pool = self._controller.pool
+        if self._socket_id == -1 or not pool.is_valid(self._socket_id):
+            self._release()
+            self._socket_id = pool.reserve()
+        return self._socket_id
+
+    def _release(self):
+        if self._socket_id != -1:
+            self._controller.pool.unreserve(self._socket_id)
+            self._socket_id = -1
+
+    def sample(self) -> Tuple[float, float, float]:
+        """
+        Takes one sample and updates the fit
+
+        Returns
+        -------
+        tuple: host time (s, perf_counter), controller time (s) and round trip (s) of the kept request
+        """
+        pool = self._controller.pool
+        socket_id = self._socket()
+        best = None
+        with pool.reserved(socket_id):
+            for _ in range(self.burst):
+                start = time.perf_counter_ns()
+                [elapsed_time] = self._controller.query_on(socket_id, "ElapsedTimeGet")
+                end = time.perf_counter_ns()
+                if best is None or end - start < best[2]:
+                    best = ((start + end) // 2, elapsed_time, end - start)
+        host_time, controller_time, round_trip = best[0] * 1e-9, best[1], best[2] * 1e-9
+        with self._lock:
+            self._samples.append((host_time, controller_time, round_trip))
+            self._fit()
+        return host_time, controller_time, round_trip
+
+    def _fit(self):
+        host_times, controller_times, round_trips = np.array(self._samples).T
+        # the samples delayed by the network or the controller are left out of the fit
+        kept = round_trips <= np.median(round_trips) if round_trips.size >= 4 else slice(None)
+        host_times, controller_times = host_times[kept], controller_times[kept]
+        self._host_reference = host_times[-1]
+        if host_times.size < 2 or np.ptp(host_times) == 0:
+            # only an offset
+            self.offset = controller_times[-1]
+            return
+        rate, offset = np.polyfit(host_times - self._host_reference, controller_times, 1)
+        self.rate, self.offset = rate, offset
+        self.residual = float(np.std(controller_times - offset - rate * (host_times - self._host_reference)))
+
+    def controller_time(self, host_time_ns) -> np.ndarray:
+        """
+        Converts host times into controller times
+
+        Parameters
+        ----------
+        host_time_ns: int or array
+            times of time.perf_counter_ns
+
+        Returns
+        -------
+        ndarray: controller times in seconds (ElapsedTimeGet), NaN before the first sample
+        """
+        host_time = np.asarray(host_time_ns, dtype=np.float64) * 1e-9
+        if not self._samples:
+            return np.full_like(host_time, np.nan)
+        with self._lock:
+            return self.offset + self.rate * (host_time - self._host_reference)
+
+    def host_time_ns(self, controller_time) -> np.ndarray:
+        """Converts controller times in seconds into host times of time.perf_counter_ns, see controller_time"""
+        controller_time = np.asarray(controller_time, dtype=np.float64)
+        if not self._samples:
+            return np.full_like(controller_time, np.nan)
+        with self._lock:
+            return ((controller_time - self.offset) / self.rate + self._host_reference) * 1e9
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+Command builder and reply decoder for the Newport XPS TCP API.
+
+Every XPS function is sent as ``Name(arg1,arg2,type *,...)`` and answered with
+``error,value1,value2,...,EndOfAPI``. The output placeholders (``int *``, ``double *``,
+``bool *``, ``char *``) of each function are listed once in :data:`SIGNATURES` and used both to
+build the command string and to convert the returned fields into python values, without any
+``eval`` call.
+"""
+from functools import lru_cache
+from typing import Callable, List, NamedTuple, Sequence, Tuple
+
+END_OF_API = ',EndOfAPI'
+
+
+class XPSError(Exception):
+    """
+    Exception related to the Newport XPS system
+    """
+
+    pass
+
+
+class ApiSignature(NamedTuple):
+    """Output placeholders of an XPS function
+
+    outputs: tuple of str
+        C types of the returned values, in order, ex: ('double', 'double')
+    per_element: bool
+        If True, the outputs are repeated once per positioner of the group (nbElement argument)
+    """
+    outputs: Tuple[str, ...]
+    per_element: bool = False
+
+
+def _to_bool(field: str) -> bool:
+    return field.strip() not in ('0', '', 'false', 'False')
+
+
+CONVERTERS = {
+    'int': int,
+    'short': int,
+    'unsigned short': int,
+    'long': int,
+    'double': float,
+    'bool': _to_bool,
+    'char': str,
+}
+
+SIGNATURES = {
+    'ControllerMotionKernelMinMaxTimeLoadGet': ApiSignature(('double',) * 8),
+    'ControllerMotionKernelTimeLoadGet': ApiSignature(('double',) * 4),
+    'ControllerRTTimeGet': ApiSignature(('double',) * 2),
+    'ControllerSlaveStatusGet': ApiSignature(('int',)),
+    'ControllerSlaveStatusStringGet': ApiSignature(('char',)),
+    'ControllerStatusGet': ApiSignature(('int',)),
+    'ControllerStatusRead': ApiSignature(('int',)),
+    'ControllerStatusStringGet': ApiSignature(('char',)),
+    'ElapsedTimeGet': ApiSignature(('double',)),
+    'ErrorStringGet': ApiSignature(('char',)),
+    'FirmwareVersionGet': ApiSignature(('char',)),
+    'TCLScriptExecuteAndWait': ApiSignature(('char',)),
+    'TimerGet': ApiSignature(('int',)),
+    'HardwareDateAndTimeGet': ApiSignature(('char',)),
+    'EventGet': ApiSignature(('char',)),
+    'EventExtendedConfigurationTriggerGet': ApiSignature(('char',)),
+    'EventExtendedConfigurationActionGet': ApiSignature(('char',)),
+    'EventExtendedStart': ApiSignature(('int',)),
+    'EventExtendedAllGet': ApiSignature(('char',)),
+    'EventExtendedGet': ApiSignature(('char',) * 2),
+    'GatheringConfigurationGet': ApiSignature(('char',)),
+    'GatheringCurrentNumberGet': ApiSignature(('int',) * 2),
+    'GatheringDataGet': ApiSignature(('char',)),
+    'GatheringDataMultipleLinesGet': ApiSignature(('char',)),
+    'GatheringExternalConfigurationGet': ApiSignature(('char',)),
+    'GatheringExternalCurrentNumberGet': ApiSignature(('int',) * 2),
+    'GatheringExternalDataGet': ApiSignature(('char',)),
+    'GlobalArrayGet': ApiSignature(('char',)),
+    'DoubleGlobalArrayGet': ApiSignature(('double',)),
+    'GPIOAnalogGet': ApiSignature(('double',), per_element=True),
+    'GPIOAnalogGainGet': ApiSignature(('int',), per_element=True),
+    'GPIODigitalGet': ApiSignature(('unsigned short',)),
+    'GroupAccelerationSetpointGet': ApiSignature(('double',), per_element=True),
+    'GroupCorrectorOutputGet': ApiSignature(('double',), per_element=True),
+    'GroupCurrentFollowingErrorGet': ApiSignature(('double',), per_element=True),
+    'GroupJogParametersGet': ApiSignature(('double',) * 2, per_element=True),
+    'GroupJogCurrentGet': ApiSignature(('double',) * 2, per_element=True),
+    'GroupMotionStatusGet': ApiSignature(('int',), per_element=True),
+    'GroupPositionCorrectedProfilerGet': ApiSignature(('double',) * 2),
+    'GroupPositionCurrentGet': ApiSignature(('double',), per_element=True),
+    'GroupPositionPCORawEncoderGet': ApiSignature(('double',) * 2),
+    'GroupPositionSetpointGet': ApiSignature(('double',), per_element=True),
+    'GroupPositionTargetGet': ApiSignature(('double',), per_element=True),
+    'GroupStatusGet': ApiSignature(('int',)),
+    'GroupStatusStringGet': ApiSignature(('char',)),
+    'GroupVelocityCurrentGet': ApiSignature(('double',), per_element=True),
+    'PositionerAnalogTrackingPositionParametersGet': ApiSignature(('char', 'double', 'double', 'double', 'double')),
+    'PositionerAnalogTrackingVelocityParametersGet': ApiSignature(('char', 'double', 'double', 'double', 'int', 'double', 'double')),
+    'PositionerBacklashGet': ApiSignature(('double', 'char')),
+    'PositionerCompensatedPCOCurrentStatusGet': ApiSignature(('int',)),
+    'PositionerCompensationFrequencyNotchsGet': ApiSignature(('double',) * 9),
+    'PositionerCompensationLowPassTwoFilterGet': ApiSignature(('double',)),
+    'PositionerCompensationNotchModeFiltersGet': ApiSignature(('double',) * 8),
+    'PositionerCompensationPhaseCorrectionFiltersGet': ApiSignature(('double',) * 6),
+    'PositionerCompensationSpatialPeriodicNotchsGet': ApiSignature(('double',) * 9),
+    'PositionerCorrectorNotchFiltersGet': ApiSignature(('double',) * 6),
+    'PositionerCorrectorPIDBaseGet': ApiSignature(('double',) * 4),
+    'PositionerCorrectorPIDFFAccelerationGet': ApiSignature(('bool', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')),
+    'PositionerCorrectorP2IDFFAccelerationGet': ApiSignature(('bool', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')),
+    'PositionerCorrectorPIDFFVelocityGet': ApiSignature(('bool', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')),
+    'PositionerCorrectorPIDDualFFVoltageGet': ApiSignature(('bool', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')),
+    'PositionerCorrectorPIPositionGet': ApiSignature(('bool', 'double', 'double', 'double')),
+    'PositionerCorrectorSR1AccelerationGet': ApiSignature(('bool', 'double', 'double', 'double', 'double', 'double', 'double', 'double')),
+    'PositionerCorrectorSR1ObserverAccelerationGet': ApiSignature(('double',) * 3),
+    'PositionerCorrectorSR1OffsetAccelerationGet': ApiSignature(('double',)),
+    'PositionerCorrectorTypeGet': ApiSignature(('char',)),
+    'PositionerCurrentVelocityAccelerationFiltersGet': ApiSignature(('double',) * 2),
+    'PositionerDriverFiltersGet': ApiSignature(('double',) * 5),
+    'PositionerDriverPositionOffsetsGet': ApiSignature(('double',) * 2),
+    'PositionerDriverStatusGet': ApiSignature(('int',)),
+    'PositionerDriverStatusStringGet': ApiSignature(('char',)),
+    'PositionerEncoderAmplitudeValuesGet': ApiSignature(('double',) * 4),
+    'PositionerEncoderCalibrationParametersGet': ApiSignature(('double',) * 4),
+    'PositionerErrorGet': ApiSignature(('int',)),
+    'PositionerErrorRead': ApiSignature(('int',)),
+    'PositionerErrorStringGet': ApiSignature(('char',)),
+    'PositionerExcitationSignalGet': ApiSignature(('int', 'double', 'double', 'double')),
+    'PositionerHardwareStatusGet': ApiSignature(('int',)),
+    'PositionerHardwareStatusStringGet': ApiSignature(('char',)),
+    'PositionerHardInterpolatorFactorGet': ApiSignature(('int',)),
+    'PositionerHardInterpolatorPositionGet': ApiSignature(('double',)),
+    'PositionerMaximumVelocityAndAccelerationGet': ApiSignature(('double',) * 2),
+    'PositionerMotionDoneGet': ApiSignature(('double',) * 5),
+    'PositionerPositionCompareAquadBWindowedGet': ApiSignature(('double', 'double', 'bool')),
+    'PositionerPositionCompareGet': ApiSignature(('double', 'double', 'double', 'bool')),
+    'PositionerPositionComparePulseParametersGet': ApiSignature(('double',) * 2),
+    'PositionerPositionCompareScanAccelerationLimitGet': ApiSignature(('double',)),
+    'PositionerPreCorrectorExcitationSignalGet': ApiSignature(('double',) * 3),
+    'PositionerRawEncoderPositionGet': ApiSignature(('double',)),
+    'PositionersEncoderIndexDifferenceGet': ApiSignature(('double',)),
+    'PositionerSGammaExactVelocityAjustedDisplacementGet': ApiSignature(('double',)),
+    'PositionerSGammaParametersGet': ApiSignature(('double',) * 4),
+    'PositionerSGammaPreviousMotionTimesGet': ApiSignature(('double',) * 2),
+    'PositionerStageParameterGet': ApiSignature(('char',)),
+    'PositionerTimeFlasherGet': ApiSignature(('double', 'double', 'double', 'bool')),
+    'PositionerUserTravelLimitsGet': ApiSignature(('double',) * 2),
+    'PositionerWarningFollowingErrorGet': ApiSignature(('double',)),
+    'PositionerCorrectorAutoTuning': ApiSignature(('double',) * 3),
+    'PositionerAccelerationAutoScaling': ApiSignature(('double',)),
+    'MultipleAxesPVTVerificationResultGet': ApiSignature(('char', 'double', 'double', 'double', 'double')),
+    'MultipleAxesPVTParametersGet': ApiSignature(('char', 'int')),
+    'MultipleAxesPVTPulseOutputGet': ApiSignature(('int', 'int', 'double')),
+    'SingleAxisSlaveParametersGet': ApiSignature(('char', 'double')),
+    'SingleAxisThetaSlaveParametersGet': ApiSignature(('char', 'double')),
+    'SpindleSlaveParametersGet': ApiSignature(('char', 'double')),
+    'GroupSpinParametersGet': ApiSignature(('double',) * 2),
+    'GroupSpinCurrentGet': ApiSignature(('double',) * 2),
+    'XYLineArcVerificationResultGet': ApiSignature(('char', 'double', 'double', 'double', 'double')),
+    'XYLineArcParametersGet': ApiSignature(('char', 'double', 'double', 'int')),
+    'XYLineArcPulseOutputGet': ApiSignature(('double',) * 3),
+    'XYPVTVerificationResultGet': ApiSignature(('char', 'double', 'double', 'double', 'double')),
+    'XYPVTParametersGet': ApiSignature(('char', 'int')),
+    'XYPVTPulseOutputGet': ApiSignature(('int', 'int', 'double')),
+    'XYZGroupPositionCorrectedProfilerGet': ApiSignature(('double',) * 3),
+    'XYZGroupPositionPCORawEncoderGet': ApiSignature(('double',) * 3),
+    'XYZSplineVerificationResultGet': ApiSignature(('char', 'double', 'double', 'double', 'double')),
+    'XYZSplineParametersGet': ApiSignature(('char', 'double', 'double', 'int')),
+    'TZPVTVerificationResultGet': ApiSignature(('char', 'double', 'double', 'double', 'double')),
+    'TZPVTParametersGet': ApiSignature(('char', 'int')),
+    'TZPVTPulseOutputGet': ApiSignature(('int', 'int', 'double')),
+    'TZTrackingUserMaximumZZZTargetDifferenceGet': ApiSignature(('double',)),
+    'PositionerMotorOutputOffsetGet': ApiSignature(('double',) * 4),
+    'SingleAxisThetaPositionRawGet': ApiSignature(('double',) * 3),
+    'CPUCoreAndBoardSupplyVoltagesGet': ApiSignature(('double',) * 8),
+    'CPUTemperatureAndFanSpeedGet': ApiSignature(('double',) * 2),
+    'ActionListGet': ApiSignature(('char',)),
+    'ActionExtendedListGet': ApiSignature(('char',)),
+    'APIExtendedListGet': ApiSignature(('char',)),
+    'APIListGet': ApiSignature(('char',)),
+    'ControllerStatusListGet': ApiSignature(('char',)),
+    'ErrorListGet': ApiSignature(('char',)),
+    'EventListGet': ApiSignature(('char',)),
+    'GatheringListGet': ApiSignature(('char',)),
+    'GatheringExtendedListGet': ApiSignature(('char',)),
+    'GatheringExternalListGet': ApiSignature(('char',)),
+    'GroupStatusListGet': ApiSignature(('char',)),
+    'HardwareInternalListGet': ApiSignature(('char',)),
+    'HardwareDriverAndStageGet': ApiSignature(('char',) * 2),
+    'ObjectsListGet': ApiSignature(('char',)),
+    'PositionerErrorListGet': ApiSignature(('char',)),
+    'PositionerHardwareStatusListGet': ApiSignature(('char',)),
+    'PositionerDriverStatusListGet': ApiSignature(('char',)),
+    'ReferencingActionListGet': ApiSignature(('char',)),
+    'ReferencingSensorListGet': ApiSignature(('char',)),
+    'GatheringUserDatasGet': ApiSignature(('double',) * 8),
+    'ControllerMotionKernelPeriodMinMaxGet': ApiSignature(('double',) * 6),
+    'SocketsStatusGet': ApiSignature(('char',)),
+    'TestTCP': ApiSignature(('char',)),
+}
+
+
+def _format_argument(argument) -> str:
+    if isinstance(argument, (list, tuple)):
+        return ','.join(_format_argument(arg) for arg in argument)
+    return str(argument)
+
+
+def output_types(api_name: str, nb_element: int = 1) -> Tuple[str, ...]:
+    """Returns the C types of the values returned by the XPS function api_name"""
+    signature = SIGNATURES.get(api_name)
+    if signature is None:
+        return ()
+    if signature.per_element:
+        return signature.outputs * nb_element
+    return signature.outputs
+
+
+def build_command(api_name: str, arguments: Sequence = (), nb_element: int = 1) -> str:
+    """Build the command string of an XPS function
+
+    Parameters
+    ----------
+    api_name: str
+        name of the XPS function, ex: 'GroupPositionCurrentGet'
+    arguments: sequence
+        input arguments of the function. Lists or tuples are flattened, ex: the target positions of
+        GroupMoveAbsolute
+    nb_element: int
+        number of positioners to query for the functions returning one set of values per positioner
+
+    Returns
+    -------
+    str: the command, ex: 'GroupPositionCurrentGet(Group1,double *)'
+    """
+    fields = [_format_argument(arg) for arg in arguments]
+    fields.extend(f'{c_type} *' for c_type in output_types(api_name, nb_element))
+    return f"{api_name}({','.join(fields)})"
+
+
+@lru_cache(maxsize=None)
+def _compile(api_name: str, nb_element: int) -> Tuple[Tuple[Callable, ...], int]:
+    types = output_types(api_name, nb_element)
+    converters = tuple(CONVERTERS[c_type] for c_type in types)
+    char_index = types.index('char') if types.count('char') == 1 else -1
+    return converters, char_index
+
+
+def decode_reply(api_name: str, returned_string: str, nb_element: int = 1) -> List:
+    """Convert the returned string of a successful XPS call into a list of typed values
+
+    Parameters
+    ----------
+    api_name: str
+        name of the XPS function that produced the reply
+    returned_string: str
+        reply without the leading error code and the trailing ',EndOfAPI'
+    nb_element: int
+        see :func:`build_command`
+
+    Returns
+    -------
+    list: one python value (int, float, bool or str) per output of the function
+    """
+    converters, char_index = _compile(api_name, nb_element)
+    if len(converters) == 1:
+        return [converters[0](returned_string)]
+    fields = returned_string.split(',')
+    extra = len(fields) - len(converters)
+    if extra > 0 and char_index >= 0:
+        # the only string output may itself contain commas
+        fields[char_index:char_index + extra + 1] = [','.join(fields[char_index:char_index + extra + 1])]
+    return [converter(field) for converter, field in zip(converters, fields)]
+
+
+def decode_result(api_name: str, error: int, returned_string: str, nb_element: int = 1) -> List:
+    """Returns the result of an XPS call in the format of the XPS driver methods
+
+    [error, value1, value2, ...] for a successful call of a function with typed outputs,
+    [error, returned_string] otherwise.
+    """
+    if error != 0 or not output_types(api_name, nb_element):
+        return [error, returned_string]
+    return [error] + decode_reply(api_name, returned_string, nb_element)
+
+
+def split_reply(reply: str) -> Tuple[int, str]:
+    """Split a raw 'error,values,EndOfAPI' reply into the error code and the returned string"""
+    error, _, returned_string = reply.partition(',')
+    return int(error), returned_string[:-len(END_OF_API)]
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Step scans with a faster motion profile.
+
+The SGamma parameters of a stage are tuned for any move, but the moves of a step scan are small: they
+never reach the velocity, so their duration only depends on the acceleration and the jerk time. While
+a :class:`FastSteps` is active, the steps up to max_step use the maximum acceleration of the positioner
+and its minimum jerk time, the larger moves use the default parameters, which are restored at the end.
+After each step, the setting time measured by the XPS (PositionerSGammaPreviousMotionTimesGet) is
+compared with the one predicted for the default parameters by the motion model of the positioner.
+The parameters are switched and the steps recorded under the profile lock of the controller, so that a
+step is recorded with the parameters it was moved with even if other threads use the controller.
+"""
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class FastSteps:
+    """
+    Scan mode switching the SGamma parameters of a positioner by move size
+
+    Parameters
+    ----------
+    controller: SimpleXPS
+        connection to the XPS
+    positioner: str or None
+        name of a positionner of the group, ex: "X", by default the positionner of the controller
+    max_step: float or None
+        largest displacement moved with the fast profile, by default the displacement from which the
+        default profile reaches its velocity
+
+    Example
+    -------
+    >>> with simple_xps.fast_steps() as steps:
+    ...     for _ in range(100):
+    ...         steps.move_relative(0.01)
+    >>> steps.summary()
+    '100 fast steps, 12.4 ms saved per step (41%)'
+    """
+
+    def __init__(self, controller, positioner: Optional[str] = None, max_step: Optional[float] = None):
+        self._controller = controller
+        self.positioner = positioner
+        model = controller.motion_model(positioner)
+        self.defaults = model.parameters()
+        velocity, _, min_jerk_time, _ = self.defaults
+        self.fast = (velocity, model.maximum_acceleration, min_jerk_time, min_jerk_time)
+        self.max_step = velocity * float(model.ramp_time()) if max_step is None else max_step
+        self._applied = self.defaults
+        # setting times of the fast steps, measured and predicted with the default parameters
+        self._times: List[Tuple[float, float]] = []
+
+    def prepare(self, displacement: float) -> bool:
+        """
+        Sets the SGamma parameters for a move of displacement
+
+        Returns
+        -------
+        bool: True if the move uses the fast profile
+        """
+        fast = abs(displacement) <= self.max_step
+        with self._controller.profile_lock:
+            self._apply(self.fast if fast else self.defaults)
+        return fast
+
+    def _apply(self, parameters: Tuple[float, float, float, float]):
+        if parameters != self._applied:
+            self._controller.set_sgamma_parameters(*parameters, positionner=self.positioner)
+            self._applied = parameters
+
+    def record(self, displacement: float) -> Optional[float]:
+        """
+        Reads the times of the last move, of displacement, to calibrate the motion model
+
+        Returns
+        -------
+        float or None: for a fast step, the time saved in seconds compared to the default parameters
+        """
+        with self._controller.profile_lock:
+            setting_time, _ = self._controller.calibrate_motion_model(displacement, self.positioner)
+            if self._applied != self.fast:
+                return None
+        model = self._controller.motion_model(self.positioner)
+        velocity, acceleration, min_jerk_time, max_jerk_time = self.defaults
+        default_time = float(model.setting_time(displacement, velocity, acceleration,
+                                                model.jerk_time_for(min_jerk_time, max_jerk_time)))
+        self._times.append((setting_time, default_time))
+        return default_time - setting_time
+
+    def move_relative(self, displacement: float) -> Optional[float]:
+        """Moves by displacement with the profile of its size, see record for the returned value"""
+        self.prepare(displacement)
+        self._controller.move_relative(displacement)
+        return self.record(displacement)
+
+    def restore(self):
+        """Sets the default SGamma parameters back"""
+        with self._controller.profile_lock:
+            self._apply(self.defaults)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.restore()
+
+    @property
+    def nb_steps(self) -> int:
+        """Number of fast steps recorded"""
+        return len(self._times)
+
+    def time_saved(self) -> Tuple[float, float]:
+        """
+        Returns
+        -------
+        tuple: mean time in seconds saved per fast step, and the ratio to the time with the default parameters
+        """
+        if not self._times:
+            return 0.0, 0.0
+        measured, default = np.mean(self._times, axis=0)
+        return default - measured, (default - measured) / default
+
+    def summary(self) -> str:
+        saved, ratio = self.time_saved()
+        return f"{self.nb_steps} fast steps, {saved * 1e3:.1f} ms saved per step ({ratio:.0%})"
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+Access to the file system of the XPS controller through its FTP service.
+
+Used to fetch the gathering files saved by GatheringStopAndSave in one bulk transfer, and to upload
+trajectory and TCL files.
+"""
+import ftplib
+from contextlib import contextmanager
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+from numpy.lib import format as npy_format
+from numpy.lib.format import open_memmap
+from numpy.lib.recfunctions import unstructured_to_structured
+
+from .xps_codec import XPSError
+
+
+class GatheringFileParser:
+    """
+    Incremental parser of a gathering file (header lines then one line of tab separated values per
+    point), fed with the chunks of the transfer so that the file is never held in memory as text
+
+    Parameters
+    ----------
+    nb_columns: int
+        number of gathered types
+    """
+
+    def __init__(self, nb_columns: int):
+        self.nb_columns = nb_columns
+        self._pending = b""
+        self._in_header = True
+
+    def _is_data_line(self, line: bytes) -> bool:
+        fields = line.split()
+        if len(fields) != self.nb_columns:
+            return False
+        try:
+            float(fields[0])
+        except ValueError:
+            return False
+        return True
+
+    def feed(self, data: bytes) -> np.ndarray:
+        """Parses the complete lines received so far, returns them as an array of shape (n, nb_columns)"""
+        data = self._pending + data
+        end = data.rfind(b"\n") + 1
+        self._pending = data[end:]
+        return self._parse(data[:end])
+
+    def close(self) -> np.ndarray:
+        """Parses the last line if the file doesn't end with a new line"""
+        data, self._pending = self._pending, b""
+        return self._parse(data)
+
+    def _parse(self, data: bytes) -> np.ndarray:
+        while self._in_header and data:
+            line, _, rest = data.partition(b"\n")
+            if self._is_data_line(line):
+                self._in_header = False
+            else:
+                data = rest
+        data = data.strip()
+        if not data:
+            return np.empty((0, self.nb_columns))
+        # np.fromstring raises ValueError at the first value that is not a number, or stops there with older
+        # numpy versions: malformed lines are then detected by the number of values
+        nb_lines = data.count(b"\n") + 1
+        try:
+            values = np.fromstring(data, dtype=np.float64, sep=" ")
+        except ValueError as e:
+            raise XPSError(f"Malformed gathering file data: {e}") from None
+        if values.size != nb_lines * self.nb_columns:
+            raise XPSError(
+                f"Gathering file data of {values.size} values instead of {nb_lines} lines of "
+                f"{self.nb_columns} values"
+            )
+        return values.reshape((nb_lines, self.nb_columns))
+
+
+def _truncate_npy(path: Path, nb_lines: int):
+    """Cuts a one-dimensional .npy file to its first nb_lines elements, rewriting the shape of its header"""
+    with open(path, "r+b") as file:
+        version = npy_format.read_magic(file)
+        size_start = file.tell()
+        if version == (1, 0):
+            _, _, dtype = npy_format.read_array_header_1_0(file)
+        else:
+            _, _, dtype = npy_format.read_array_header_2_0(file)
+        data_start = file.tell()
+        # same header size, the shape having no more digits than before, padded with spaces as numpy does
+        header_start = size_start + (2 if version == (1, 0) else 4)
+        header = repr({"descr": npy_format.dtype_to_descr(dtype), "fortran_order": False, "shape": (nb_lines,)})
+        file.seek(header_start)
+        file.write(header.ljust(data_start - header_start - 1).encode("latin1") + b"\n")
+        file.truncate(data_start + nb_lines * dtype.itemsize)
+
+
+class XPSFileStore:
+    """
+    FTP client of the XPS controller
+
+    Parameters
+    ----------
+    ip: str
+        IP address of the XPS motion controller. ex: "192.168.0.254"
+    user: str
+    password: str
+    port: int
+        FTP port of the XPS
+    timeout: float
+        connection timeout in seconds
+    ftp_factory: callable
+        returns an object with the ftplib.FTP interface, ex: a local stand-in for tests
+    """
+
+    GATHERING_FILE = "/Admin/Public/Gathering.dat"
+    TRAJECTORIES_DIRECTORY = "/Admin/Public/Trajectories"
+    SCRIPTS_DIRECTORY = "/Admin/Public/Scripts"
+    BLOCK_SIZE = 2**20
+
+    def __init__(
+        self,
+        ip: str,
+        user: str = "Administrator",
+        password: str = "Administrator",
+        port: int = 21,
+        timeout: float = 10.0,
+        ftp_factory: Callable[[], ftplib.FTP] = ftplib.FTP,
+    ):
+        self.ip = ip
+        self.user = user
+        self.password = password
+        self.port = port
+        self.timeout = timeout
+        self._ftp_factory = ftp_factory
+
+    @contextmanager
+    def connect(self):
+        """Context manager returning a logged-in FTP session"""
+        ftp = self._ftp_factory()
+        try:
+            ftp.connect(self.ip, self.port, self.timeout)
+            ftp.login(self.user, self.password)
+        except (OSError, ftplib.Error) as e:
+            raise XPSError(f"FTP connection to the XPS failed: {e}")
+        try:
+            yield ftp
+        finally:
+            try:
+                ftp.quit()
+            except (OSError, ftplib.Error):
+                ftp.close()
+
+    def download(self, remote_path: str, callback: Callable[[bytes], None]):
+        """Transfers a file of the XPS, callback is called with each received block"""
+        with self.connect() as ftp:
+            try:
+                ftp.retrbinary(f"RETR {remote_path}", callback, blocksize=self.BLOCK_SIZE)
+            except ftplib.Error as e:
+                raise XPSError(f"Download of {remote_path} failed: {e}")
+
+    def read_bytes(self, remote_path: str) -> bytes:
+        """Returns the content of a file of the XPS"""
+        blocks = []
+        self.download(remote_path, blocks.append)
+        return b"".join(blocks)
+
+    def upload(self, remote_path: str, content: bytes):
+        """Writes content into a file of the XPS, replacing it if it exists"""
+        with self.connect() as ftp:
+            try:
+                ftp.storbinary(f"STOR {remote_path}", BytesIO(content), blocksize=self.BLOCK_SIZE)
+            except ftplib.Error as e:
+                raise XPSError(f"Upload of {remote_path} failed: {e}")
+
+    def fetch_gathering(
+        self,
+        names: Sequence[str],
+        remote_path: str = GATHERING_FILE,
+        npy_path: Optional[Path] = None,
+        nb_lines: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Transfers a gathering file saved by GatheringStopAndSave and parses it while it is received
+
+        Parameters
+        ----------
+        names: sequence of str
+            gathering types, in the order of the gathering configuration
+        remote_path: str
+            path of the gathering file on the XPS
+        npy_path: Path or None
+            if given, the data is written into a memory-mapped .npy file at this path
+        nb_lines: int or None
+            number of lines of the gathering, required with npy_path to size the file. The file is cut to the
+            lines received when the gathering file holds fewer
+
+        Returns
+        -------
+        ndarray: structured array with one float field per gathering type (a memory map if npy_path is
+            given)
+        """
+        dtype = np.dtype([(name, np.float64) for name in names])
+        parser = GatheringFileParser(len(names))
+        if npy_path is not None:
+            if nb_lines is None:
+                raise XPSError("nb_lines is required to write the gathering into a .npy file")
+            output = open_memmap(npy_path, mode="w+", dtype=dtype, shape=(nb_lines,))
+        else:
+            output = []
+        filled = 0
+
+        def store(values: np.ndarray):
+            nonlocal filled
+            if npy_path is not None:
+                values = values[: nb_lines - filled]
+                output[filled: filled + len(values)] = unstructured_to_structured(values, dtype=dtype)
+            else:
+                output.append(values)
+            filled += len(values)
+
+        self.download(remote_path, lambda block: store(parser.feed(block)))
+        store(parser.close())
+
+        if npy_path is not None:
+            output.flush()
+            if filled == nb_lines:
+                return output
+            # shorter file than announced: the .npy file is cut to the lines received
+            del output
+            _truncate_npy(npy_path, filled)
+            return open_memmap(npy_path, mode="r+")
+        values = np.concatenate(output) if output else np.empty((0, len(names)))
+        return unstructured_to_structured(values, dtype=dtype)
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Gathering of servo data on the XPS, streamed into NumPy structured arrays.
+
+The XPS records the configured gathering types at the servo rate divided by a divisor. While the run
+progresses, the completed lines are read with GatheringDataMultipleLinesGet (lines separated by
+'\\n', values by ';') and converted in one vectorised call per chunk. Large gatherings are faster to
+retrieve at once from the file saved by GatheringStopAndSave, through the FTP service of the XPS.
+With the clock sync of the controller running, the lines are stamped with controller times, see
+:meth:`GatheringSession.timestamps`.
+"""
+import time
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+from numpy.lib.recfunctions import unstructured_to_structured
+
+from .xps_codec import XPSError
+from .xps_files import XPSFileStore
+
+GATHERING_QUANTITIES = (
+    "SetpointPosition",
+    "CurrentPosition",
+    "FollowingError",
+    "SetpointVelocity",
+    "CurrentVelocity",
+    "SetpointAcceleration",
+    "CurrentAcceleration",
+    "CorrectorOutput",
+)
+
+
+def parse_gathering_lines(text: str, nb_columns: int, nb_lines: Optional[int] = None) -> np.ndarray:
+    """
+    Converts the text of gathered lines into a 2D float array
+
+    Truncated data is detected by its number of values, as malformed data: np.fromstring raises ValueError
+    at the first value that is not a number, or stops there with older numpy versions.
+
+    Parameters
+    ----------
+    text: str
+        lines separated by '\\n', values by ';'
+    nb_columns: int
+        number of gathered types
+    nb_lines: int or None
+        number of lines expected, by default the number of lines of text
+
+    Returns
+    -------
+    ndarray: of shape (nb_lines, nb_columns)
+
+    Raises
+    ------
+    XPSError: if the text doesn't hold nb_lines * nb_columns values
+    """
+    text = text.strip()
+    if nb_lines is None:
+        nb_lines = text.count("\n") + 1 if text else 0
+    try:
+        values = np.fromstring(text.replace("\n", ";"), dtype=np.float64, sep=";") if text else np.empty(0)
+    except ValueError as e:
+        raise XPSError(f"Malformed gathering data: {e}") from None
+    if values.size != nb_lines * nb_columns:
+        raise XPSError(
+            f"Gathering data of {values.size} values instead of {nb_lines} lines of {nb_columns} values"
+        )
+    return values.reshape((nb_lines, nb_columns))
+
+
+class GatheringSession:
+    """
+    Configures a gathering on the XPS, runs it and streams its data
+
+    Parameters
+    ----------
+    controller: SimpleXPS
+        connection to the XPS, each request borrows a socket of its pool
+    types: sequence of str
+        gathering types, ex: ["Group1.Pos.SetpointPosition", "Group1.Pos.CurrentPosition"]
+    nb_points: int
+        number of lines to gather
+    divisor: int
+        the data is gathered once every `divisor` servo cycles
+    chunk_lines: int
+        maximum number of lines fetched per GatheringDataMultipleLinesGet request
+    poll_interval: float
+        time in seconds between two GatheringCurrentNumberGet when no new line is available
+
+    Example
+    -------
+    >>> with controller.gathering(nb_points=100000) as session:
+    ...     controller.move_absolute(10.)
+    ...     for chunk in session.stream():
+    ...         errors = chunk[f"{controller.positionner_name}.FollowingError"]
+    """
+
+    # lines are gathered every period: none for STALL_PERIODS periods, and at least MIN_STALL_TIME seconds,
+    # means that the run was stopped on the controller, ex: by another client
+    STALL_PERIODS = 10
+    MIN_STALL_TIME = 1.0
+
+    def __init__(
+        self,
+        controller,
+        types: Sequence[str],
+        nb_points: int,
+        divisor: int = 1,
+        chunk_lines: int = 1000,
+        poll_interval: float = 0.05,
+    ):
+        self._controller = controller
+        self.types = list(types)
+        self.nb_points = nb_points
+        self.divisor = divisor
+        self.chunk_lines = chunk_lines
+        self.poll_interval = poll_interval
+        self.dtype = np.dtype([(name, np.float64) for name in self.types])
+        self._read_index = 0
+        self._running = False
+        # controller time (s) of the first line, with clock sync only, and time between two lines (s)
+        self.start_time: Optional[float] = None
+        self.period: Optional[float] = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def nb_read(self) -> int:
+        """Number of lines already streamed"""
+        return self._read_index
+
+    def start(self):
+        """Configures the gathering types and starts a new run"""
+        self._controller.query("GatheringReset")
+        self._controller.query("GatheringConfigurationSet", self.types)
+        servo_period, _ = self._controller.query("ControllerRTTimeGet")
+        self.period = servo_period * self.divisor
+        start = time.perf_counter_ns()
+        self._controller.query("GatheringRun", self.nb_points, self.divisor)
+        self.start_time = self._controller.controller_time((start + time.perf_counter_ns()) // 2)
+        self._read_index = 0
+        self._running = True
+
+    def stop(self):
+        """Stops the run, the data already gathered stays available"""
+        if self._running:
+            self._running = False
+            self._controller.query("GatheringStop")
+
+    def current_number(self) -> int:
+        """Number of lines gathered so far"""
+        current, _ = self._controller.query("GatheringCurrentNumberGet")
+        return current
+
+    def timestamps(self, start: int = 0, nb_lines: Optional[int] = None) -> np.ndarray:
+        """
+        Controller times in seconds of gathered lines, the run starting in the middle of the GatheringRun
+        request
+
+        Parameters
+        ----------
+        start: int
+            index of the first line
+        nb_lines: int or None
+            by default up to nb_points
+
+        Raises
+        ------
+        XPSError: if the run was started without clock sync
+        """
+        if self.start_time is None or self.period is None:
+            raise XPSError("Gathering timestamps need the clock sync of the controller, see start_clock_sync")
+        if nb_lines is None:
+            nb_lines = self.nb_points - start
+        return self.start_time + (start + np.arange(nb_lines)) * self.period
+
+    def read(self, start: int, nb_lines: int) -> np.ndarray:
+        """
+        Reads gathered lines
+
+        Parameters
+        ----------
+        start: int
+            index of the first line
+        nb_lines: int
+
+        Returns
+        -------
+        ndarray: structured array of nb_lines elements with one float field per gathering type
+        """
+        chunks = []
+        for index in range(start, start + nb_lines, self.chunk_lines):
+            count = min(self.chunk_lines, start + nb_lines - index)
+            [text] = self._controller.query("GatheringDataMultipleLinesGet", index, count)
+            chunks.append(parse_gathering_lines(text, len(self.types), count))
+        values = np.concatenate(chunks) if chunks else np.empty((0, len(self.types)))
+        return unstructured_to_structured(values, dtype=self.dtype)
+
+    def stream(self, timeout: float = None) -> Iterator[np.ndarray]:
+        """
+        Yields the gathered lines by chunks of chunk_lines until nb_points lines were read, or until the
+        lines gathered before the run was stopped by stop or fetch_saved were read
+
+        Parameters
+        ----------
+        timeout: float or None
+            maximum time in seconds without any new line. None waits as long as the run goes on: no new line
+            during STALL_PERIODS periods means that it was stopped on the controller
+
+        Yields
+        ------
+        ndarray: structured arrays of at most chunk_lines elements
+
+        Raises
+        ------
+        XPSError: if no new line arrived within the timeout, or the run was stopped on the controller
+        """
+        stall_time = timeout
+        if stall_time is None:
+            stall_time = max(self.STALL_PERIODS * (self.period or 0.), self.MIN_STALL_TIME)
+        last_progress = time.perf_counter()
+        last_number = 0
+        while self._read_index < self.nb_points:
+            current_number = min(self.current_number(), self.nb_points)
+            if current_number != last_number:
+                last_number = current_number
+                last_progress = time.perf_counter()
+            available = current_number - self._read_index
+            if self._running and available < min(self.chunk_lines, self.nb_points - self._read_index):
+                # wait for a full chunk (or the end of the run) to keep the number of requests low
+                if time.perf_counter() - last_progress > stall_time:
+                    state = "stalled" if timeout is not None else "stopped on the controller"
+                    raise XPSError(
+                        f"Gathering {state} after {current_number} of {self.nb_points} lines"
+                    )
+                time.sleep(self.poll_interval)
+                continue
+            if available <= 0:
+                # run stopped, all its lines were read
+                break
+            nb_lines = min(available, self.chunk_lines)
+            chunk = self.read(self._read_index, nb_lines)
+            self._read_index += nb_lines
+            yield chunk
+        self._running = False
+
+    def read_all(self, timeout: float = None) -> np.ndarray:
+        """Waits for the end of the run and returns all its lines in one structured array"""
+        chunks = list(self.stream(timeout))
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=self.dtype)
+
+    def fetch_saved(
+        self, file_store: XPSFileStore, npy_path: Optional[Path] = None
+    ) -> np.ndarray:
+        """
+        Stops the run, saves it into the gathering file of the XPS and transfers this file in one go
+
+        Parameters
+        ----------
+        file_store: XPSFileStore
+            FTP access to the XPS
+        npy_path: Path or None
+            if given, the data is written into a memory-mapped .npy file at this path
+
+        Returns
+        -------
+        ndarray: structured array of all the gathered lines
+        """
+        nb_lines = min(self.current_number(), self.nb_points)
+        self._controller.query("GatheringStopAndSave")
+        self._running = False
+        return file_store.fetch_gathering(self.types, npy_path=npy_path, nb_lines=nb_lines)
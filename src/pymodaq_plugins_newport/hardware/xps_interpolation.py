@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Positions of the stage at the times of detector frames, from a gathered trajectory.
+
+After a continuous move, the gathering of the XPS holds the trajectory at the servo rate (see
+xps_gathering) and the detector gives the times of its frames. :class:`FrameInterpolator` returns the
+position and the velocity of the stage at each frame time by linear interpolation between the gathered
+lines: np.interp for increasing frame times of a single positioner, which it walks through in one pass,
+else one searchsorted per chunk of frames (or a division when the lines are evenly spaced, as gathered
+lines are). The frames are processed by chunks of chunk_size, so the temporary arrays stay
+bounded whatever the number of frames, and the results can be written into preallocated (ex:
+memory-mapped) arrays.
+
+The frame times have to be in the time base of the gathering: controller times from
+GatheringSession.timestamps, host times being converted with ClockSync.controller_time.
+"""
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .xps_codec import XPSError
+
+
+class FrameInterpolator:
+    """
+    Linear interpolation of a gathered trajectory at frame times
+
+    Parameters
+    ----------
+    times: array
+        increasing times of the gathered lines, in seconds
+    positions: array
+        gathered positions, of shape (nb_lines,) or (nb_lines, nb_positioners)
+    velocities: array or None
+        gathered velocities, same shape as positions. If None, the velocity of a frame is the slope of the
+        positions between the lines around it
+    chunk_size: int
+        number of frames interpolated at once
+
+    Example
+    -------
+    >>> data = session.read_all()
+    >>> interpolator = FrameInterpolator.from_gathering(session, data)
+    >>> frame_times = simple_xps.clock.controller_time(frame_times_ns)
+    >>> positions, velocities = interpolator(frame_times)  # NaN for the frames outside of the gathering
+    """
+
+    DEFAULT_CHUNK_SIZE = 2 ** 18
+
+    def __init__(self, times, positions, velocities=None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.times = np.ascontiguousarray(times, dtype=np.float64)
+        self.positions = np.ascontiguousarray(positions, dtype=np.float64)
+        self.velocities = None if velocities is None else np.ascontiguousarray(velocities, dtype=np.float64)
+        if self.times.ndim != 1 or self.times.size < 2:
+            raise XPSError("Interpolation needs at least 2 gathered lines")
+        if self.positions.shape[0] != self.times.size or (
+                self.velocities is not None and self.velocities.shape != self.positions.shape):
+            raise XPSError("Gathered times, positions and velocities must have the same number of lines")
+        self.chunk_size = chunk_size
+        steps = np.diff(self.times)
+        if np.any(steps <= 0):
+            raise XPSError("Gathered times must be increasing")
+        # evenly spaced lines are indexed by a division instead of a binary search
+        self.period = steps.mean() if np.allclose(steps, steps.mean(), rtol=1e-9, atol=0) else None
+        # slopes of the segments between two lines, for the velocities without gathered ones
+        self._slopes = (np.diff(self.positions, axis=0) / steps.reshape((-1,) + (1,) * (self.positions.ndim - 1))
+                        if self.velocities is None else None)
+
+    @classmethod
+    def from_gathering(cls, session, data: np.ndarray, position_type: Optional[str] = None,
+                       velocity_type: Optional[str] = None, **kwargs) -> "FrameInterpolator":
+        """
+        Interpolator of the lines of a gathering session, stamped by the clock sync (see timestamps)
+
+        Parameters
+        ----------
+        session: GatheringSession
+            the session that gathered data
+        data: ndarray
+            structured array of its lines, ex: from read_all or fetch_saved
+        position_type, velocity_type: str or None
+            gathering types of the positions and velocities, by default the first CurrentPosition (else
+            SetpointPosition) and CurrentVelocity (else SetpointVelocity, else none) types of the session
+        """
+        position_type = position_type or _first_type(session.types, ("CurrentPosition", "SetpointPosition"))
+        velocity_type = velocity_type or _first_type(session.types, ("CurrentVelocity", "SetpointVelocity"))
+        if position_type is None:
+            raise XPSError("The gathering has no position type")
+        return cls(session.timestamps(0, data.size), data[position_type],
+                   None if velocity_type is None else data[velocity_type], **kwargs)
+
+    def _interpolate(self, frame_times: np.ndarray, positions: np.ndarray, velocities: np.ndarray):
+        if self.positions.ndim == 1 and self.velocities is not None and np.all(frame_times[1:] >= frame_times[:-1]):
+            positions[:] = np.interp(frame_times, self.times, self.positions, left=np.nan, right=np.nan)
+            velocities[:] = np.interp(frame_times, self.times, self.velocities, left=np.nan, right=np.nan)
+            return
+        outside = (frame_times < self.times[0]) | (frame_times > self.times[-1]) | np.isnan(frame_times)
+        frame_times = np.where(outside, self.times[0], frame_times)
+        if self.period is not None:
+            index = np.floor((frame_times - self.times[0]) / self.period)
+            # the division can be one line off at the lines themselves
+            index = np.clip(index, 0, self.times.size - 2).astype(np.intp)
+            index -= frame_times < self.times[index]
+            index += frame_times >= self.times[np.minimum(index + 1, self.times.size - 1)]
+            np.clip(index, 0, self.times.size - 2, out=index)
+        else:
+            index = np.clip(np.searchsorted(self.times, frame_times, side="right") - 1, 0, self.times.size - 2)
+        start_times = self.times[index]
+        weight = (frame_times - start_times) / (self.times[index + 1] - start_times)
+        if self.positions.ndim > 1:
+            weight = weight[:, np.newaxis]
+            outside = outside[:, np.newaxis]
+        start_positions = self.positions[index]
+        np.copyto(positions, np.where(outside, np.nan, start_positions + weight * (self.positions[index + 1]
+                                                                                  - start_positions)))
+        if self.velocities is None:
+            velocity = self._slopes[index]
+        else:
+            start_velocities = self.velocities[index]
+            velocity = start_velocities + weight * (self.velocities[index + 1] - start_velocities)
+        np.copyto(velocities, np.where(outside, np.nan, velocity))
+
+    def __call__(self, frame_times, positions: Optional[np.ndarray] = None,
+                 velocities: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Positions and velocities at frame times, NaN outside of the gathered times
+
+        Parameters
+        ----------
+        frame_times: array
+            times of the frames, in any order
+        positions, velocities: ndarray or None
+            output arrays of shape (nb_frames,) + the shape of a gathered line, ex: np.memmap.
+            Allocated if None
+
+        Returns
+        -------
+        tuple of ndarray: positions and velocities
+        """
+        frame_times = np.asarray(frame_times, dtype=np.float64).ravel()
+        shape = frame_times.shape + self.positions.shape[1:]
+        positions = np.empty(shape) if positions is None else positions
+        velocities = np.empty(shape) if velocities is None else velocities
+        for start in range(0, frame_times.size, self.chunk_size):
+            chunk = slice(start, start + self.chunk_size)
+            self._interpolate(frame_times[chunk], positions[chunk], velocities[chunk])
+        return positions, velocities
+
+    def stream(self, frame_batches: Iterable[Sequence[float]]) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Yields the positions and velocities of each batch of frame times, as they arrive from a detector"""
+        for frame_times in frame_batches:
+            yield self(frame_times)
+
+
+def _first_type(types: Sequence[str], quantities: Sequence[str]) -> Optional[str]:
+    for quantity in quantities:
+        for gathering_type in types:
+            if gathering_type.endswith(f".{quantity}"):
+                return gathering_type
+    return None
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Duration of the XPS moves, computed on the host.
+
+The XPS moves a positioner with an SGamma profile: the jerk is limited by ramping the acceleration up
+and down in a jerk time, then the acceleration and the velocity are limited by the SGamma parameters.
+:class:`SGammaModel` gives the setting time of such a profile in closed form, for arrays of
+displacements at once, so that poll intervals, timeouts and scan schedules can be sized before moving.
+After real moves, the jerk time used by the controller (between the minimum and maximum jerk times of
+the SGamma parameters) and the settling time are fitted to the times reported by
+PositionerSGammaPreviousMotionTimesGet. The jerk time is fitted as a fraction of the jerk time range, so
+that moves made with other SGamma parameters (see :meth:`SGammaModel.set_parameters`) calibrate the same
+model.
+"""
+from collections import deque
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+
+class SGammaModel:
+    """
+    Move durations of one positioner
+
+    Parameters
+    ----------
+    velocity, acceleration: float
+        SGamma velocity (units/s) and acceleration (units/s²) of the moves
+    min_jerk_time, max_jerk_time: float
+        range of the jerk time (s) chosen by the controller
+    maximum_velocity, maximum_acceleration: float or None
+        limits of the positioner, see PositionerMaximumVelocityAndAccelerationGet
+    history: int
+        number of moves kept to calibrate the model
+
+    Example
+    -------
+    >>> model = SGammaModel.from_controller(simple_xps.query, "Group1.Pos")
+    >>> model.duration(np.linspace(0.1, 10, 100))  # s, for 100 moves
+    >>> simple_xps.move_relative(5.)
+    >>> model.record(5., *simple_xps.query("PositionerSGammaPreviousMotionTimesGet", "Group1.Pos"))
+    >>> model.calibrate()
+    """
+
+    # number of jerk times tried in [min_jerk_time, max_jerk_time] by calibrate
+    NB_JERK_TIMES = 64
+
+    def __init__(self, velocity: float, acceleration: float, min_jerk_time: float, max_jerk_time: float,
+                 maximum_velocity: Optional[float] = None, maximum_acceleration: Optional[float] = None,
+                 history: int = 100):
+        self.velocity = velocity
+        self.acceleration = acceleration
+        self.min_jerk_time = min_jerk_time
+        self.max_jerk_time = max_jerk_time
+        self.maximum_velocity = velocity if maximum_velocity is None else maximum_velocity
+        self.maximum_acceleration = acceleration if maximum_acceleration is None else maximum_acceleration
+        # fitted by calibrate, the jerk time is min_jerk_time + jerk_fraction * (max_jerk_time - min_jerk_time)
+        self.jerk_fraction = 0.0
+        self.settling_time = 0.0
+        self.residual: Optional[float] = None
+        # (displacement, setting time, settling time, velocity, acceleration, min and max jerk times) of the
+        # last moves
+        self._moves = deque(maxlen=history)
+
+    @classmethod
+    def from_controller(cls, query: Callable, positioner: str, **kwargs) -> "SGammaModel":
+        """
+        Reads the SGamma parameters and the limits of a positioner
+
+        Parameters
+        ----------
+        query: callable
+            query(api_name, *arguments) calls an API of the XPS and returns its values, ex: SimpleXPS.query
+        positioner: str
+            full name of the positioner, ex: "Group1.Pos"
+        """
+        velocity, acceleration, min_jerk_time, max_jerk_time = query("PositionerSGammaParametersGet", positioner)
+        maximum_velocity, maximum_acceleration = query("PositionerMaximumVelocityAndAccelerationGet", positioner)
+        return cls(velocity, acceleration, min_jerk_time, max_jerk_time,
+                   maximum_velocity, maximum_acceleration, **kwargs)
+
+    @property
+    def jerk_time(self) -> float:
+        """Jerk time of the moves, as fitted by calibrate"""
+        return self.jerk_time_for(self.min_jerk_time, self.max_jerk_time)
+
+    def jerk_time_for(self, min_jerk_time, max_jerk_time):
+        """Jerk time of the moves made with other SGamma jerk times"""
+        return min_jerk_time + self.jerk_fraction * (max_jerk_time - min_jerk_time)
+
+    def parameters(self) -> Tuple[float, float, float, float]:
+        """The SGamma parameters: velocity, acceleration, minimum and maximum jerk times"""
+        return self.velocity, self.acceleration, self.min_jerk_time, self.max_jerk_time
+
+    def set_parameters(self, velocity: float, acceleration: float, min_jerk_time: float, max_jerk_time: float):
+        """Follows a change of the SGamma parameters, see PositionerSGammaParametersSet"""
+        self.velocity = velocity
+        self.acceleration = acceleration
+        self.min_jerk_time = min_jerk_time
+        self.max_jerk_time = max_jerk_time
+
+    def ramp_time(self, velocity=None, acceleration=None, jerk_time=None) -> np.ndarray:
+        """Time to reach the velocity from rest, the acceleration being reached or not, see setting_time"""
+        velocity = np.asarray(self.velocity if velocity is None else velocity, dtype=float)
+        acceleration = np.asarray(self.acceleration if acceleration is None else acceleration, dtype=float)
+        jerk_time = np.asarray(self.jerk_time if jerk_time is None else jerk_time, dtype=float)
+        return np.where(velocity >= acceleration * jerk_time, velocity / acceleration + jerk_time,
+                        2 * np.sqrt(velocity * jerk_time / acceleration))
+
+    def setting_time(self, displacements, velocity=None, acceleration=None, jerk_time=None) -> np.ndarray:
+        """
+        Theoretical durations of moves, from the start to the end of the trajectory
+
+        Parameters
+        ----------
+        displacements: float or array
+            signed or absolute displacements of the moves
+        velocity, acceleration, jerk_time: float, array or None
+            parameters of the profile, broadcast against the displacements, by default the ones of the model
+
+        Returns
+        -------
+        ndarray: durations in seconds, with the shape of the broadcast inputs
+        """
+        distance = np.abs(np.asarray(displacements, dtype=float))
+        velocity = np.asarray(self.velocity if velocity is None else velocity, dtype=float)
+        acceleration = np.asarray(self.acceleration if acceleration is None else acceleration, dtype=float)
+        jerk_time = np.asarray(self.jerk_time if jerk_time is None else jerk_time, dtype=float)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ramp_time = self.ramp_time(velocity, acceleration, jerk_time)
+            # the velocity is reached: ramp up, constant velocity, ramp down
+            cruising = distance / velocity + ramp_time
+            # only the acceleration is reached: the peak velocity solves d = v (v / a + tj)
+            peak_velocity = 0.5 * (np.sqrt((acceleration * jerk_time) ** 2 + 4 * acceleration * distance)
+                                   - acceleration * jerk_time)
+            accelerating = 2 * (peak_velocity / acceleration + jerk_time)
+            # neither: four jerk phases of d / (2 j) ** (1/3), j = a / tj
+            jerking = 4 * np.cbrt(distance * jerk_time / (2 * acceleration))
+        return np.where(distance >= velocity * ramp_time, cruising,
+                        np.where(distance >= 2 * acceleration * jerk_time ** 2, accelerating, jerking))
+
+    def duration(self, displacements, velocity=None, acceleration=None, jerk_time=None) -> np.ndarray:
+        """Durations of moves until the positioner is settled, see setting_time"""
+        return self.setting_time(displacements, velocity, acceleration, jerk_time) + self.settling_time
+
+    def record(self, displacement: float, setting_time: float, settling_time: float):
+        """Adds a move made with the current parameters and its times, as returned by
+        PositionerSGammaPreviousMotionTimesGet"""
+        self._moves.append((abs(displacement), setting_time, settling_time) + self.parameters())
+
+    @property
+    def nb_moves(self) -> int:
+        """Number of moves recorded for the calibration"""
+        return len(self._moves)
+
+    def calibrate(self) -> Tuple[float, float]:
+        """
+        Fits the jerk time and the settling time to the recorded moves
+
+        The jerk time is the one of [min_jerk_time, max_jerk_time] minimising the squared error of the
+        setting times, the settling time is the median of the recorded ones.
+
+        Returns
+        -------
+        tuple: the jerk time (with the current parameters) and the settling time in seconds
+        """
+        if not self._moves:
+            return self.jerk_time, self.settling_time
+        distances, setting_times, settling_times, velocities, accelerations, min_jerk_times, max_jerk_times = \
+            np.array(self._moves).T
+        fractions = np.linspace(0., 1., self.NB_JERK_TIMES)[:, np.newaxis]
+        jerk_times = min_jerk_times + fractions * (max_jerk_times - min_jerk_times)
+        predicted = self.setting_time(distances, velocities, accelerations, jerk_times)
+        errors = np.sum((predicted - setting_times) ** 2, axis=1)
+        best = int(np.argmin(errors))
+        self.jerk_fraction = float(fractions[best, 0])
+        self.settling_time = float(np.median(settling_times))
+        self.residual = float(np.sqrt(errors[best] / distances.size))
+        return self.jerk_time, self.settling_time
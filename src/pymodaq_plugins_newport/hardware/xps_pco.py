@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Position compare output (PCO) of the XPS: TTL pulses emitted by the controller at exact positions.
+
+Once configured with a window [minimum, maximum] and a step, the XPS emits a pulse on the PCO output of
+the positioner each time it crosses minimum + k * step, without any action of the host. Pulses are only
+emitted while the acceleration of the positioner is below its scan acceleration limit, so the window
+has to be crossed at constant velocity.
+"""
+from concurrent.futures import Future
+from typing import Optional
+
+import numpy as np
+
+from .xps_codec import XPSError
+
+PULSE_WIDTHS = (0.2, 1., 2.5, 10.)  # µs, values accepted by PositionerPositionComparePulseParametersSet
+ENCODER_SETTLING_TIMES = (0.075, 1., 4., 12.)  # µs
+
+
+class PositionCompareTrigger:
+    """
+    Hardware triggering of a positioner from a scan definition
+
+    Parameters
+    ----------
+    controller: SimpleXPS
+        connection to the XPS, whose motion worker executes the scans
+    positioner: str
+        full name of the positioner, ex: "Group1.Pos"
+
+    Example
+    -------
+    >>> trigger = simple_xps.position_compare()
+    >>> trigger.scan(0., 10., 0.01).result()  # 1001 pulses, no host time per point
+    >>> positions = trigger.configured_pulse_positions()
+    """
+
+    def __init__(self, controller, positioner: str):
+        self._controller = controller
+        self.positioner = positioner
+
+    def configure(self, start: float, stop: float, step: float, pulse_width: float = 0.2,
+                  encoder_settling_time: float = 0.075):
+        """
+        Programs the pulse positions start, start + step... up to stop, in any direction
+
+        Parameters
+        ----------
+        start, stop: float
+            first and last pulse positions
+        step: float
+            distance between two pulses
+        pulse_width: float
+            width of the pulses in µs, one of PULSE_WIDTHS
+        encoder_settling_time: float
+            filtering time of the encoder signals in µs, one of ENCODER_SETTLING_TIMES
+        """
+        if step == 0:
+            raise XPSError("Position compare step must not be zero")
+        if pulse_width not in PULSE_WIDTHS:
+            raise XPSError(f"Position compare pulse width must be one of {PULSE_WIDTHS} µs")
+        if encoder_settling_time not in ENCODER_SETTLING_TIMES:
+            raise XPSError(f"Position compare encoder settling time must be one of {ENCODER_SETTLING_TIMES} µs")
+        step = abs(step)
+        # the window must contain a whole number of steps, the pulses are at minimum + k * step
+        nb_steps = int(np.floor(abs(stop - start) / step + 1e-9))
+        minimum = min(start, start + np.copysign(nb_steps * step, stop - start))
+        maximum = minimum + nb_steps * step
+        self.disable()
+        self._controller.query("PositionerPositionCompareSet", self.positioner, minimum, maximum, step)
+        self._controller.query("PositionerPositionComparePulseParametersSet", self.positioner,
+                               pulse_width, encoder_settling_time)
+
+    def enable(self):
+        self._controller.query("PositionerPositionCompareEnable", self.positioner)
+
+    def disable(self):
+        self._controller.query("PositionerPositionCompareDisable", self.positioner)
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disable()
+
+    def settings(self):
+        """
+        Returns
+        -------
+        tuple: minimum and maximum positions, step and enabled state read back from the XPS
+        """
+        minimum, maximum, step, enabled = self._controller.query("PositionerPositionCompareGet", self.positioner)
+        return minimum, maximum, step, enabled
+
+    def configured_pulse_positions(self) -> np.ndarray:
+        """
+        Positions at which the XPS is configured to emit the pulses, the grid of the configuration read back from
+        the XPS. It doesn't tell which pulses were actually emitted, ex: by a scan stopped before its end
+        """
+        minimum, maximum, step, _ = self.settings()
+        return minimum + step * np.arange(int(np.floor((maximum - minimum) / step + 1e-9)) + 1)
+
+    def run_up_distance(self) -> float:
+        """
+        Distance needed by the positioner to reach its constant velocity, from its SGamma profile
+
+        The jerk limited ramp reaches the velocity v in v / a + jerk time, covering v^2 / 2a + v * jerk time / 2
+        """
+        velocity, acceleration, _, maximum_jerk_time = self._controller.query(
+            "PositionerSGammaParametersGet", self.positioner)
+        return velocity ** 2 / (2 * acceleration) + velocity * maximum_jerk_time / 2
+
+    def scan(self, start: float, stop: float, step: float, margin: Optional[float] = None,
+             wait: bool = True, **kwargs) -> Future:
+        """
+        Moves across [start, stop] at constant velocity, emitting a pulse every step
+
+        The positioner first goes to the run-up position before start, then the position compare is enabled
+        for a single move to the run-down position after stop, and disabled once the move is done.
+
+        Parameters
+        ----------
+        start, stop, step: float
+            scan definition, see configure
+        margin: float or None
+            run-up and run-down distances, defaults to 1.5 times run_up_distance
+        wait: bool
+            if True, returns once the scan is done
+        kwargs:
+            pulse_width and encoder_settling_time, see configure
+
+        Returns
+        -------
+        Future: completed at the end of the scan motion, once the position compare is disabled
+        """
+        self.configure(start, stop, step, **kwargs)
+        if margin is None:
+            margin = 1.5 * self.run_up_distance()
+        direction = 1. if stop >= start else -1.
+        self._controller.submit_motion(
+            "GroupMoveAbsolute", self.positioner, [start - direction * margin]).result()
+        self.enable()
+        motion = self._controller.submit_motion(
+            "GroupMoveAbsolute", self.positioner, [stop + direction * margin])
+        # the scan ends once the position compare is disabled, not when the motion callbacks are started
+        future = Future()
+        motion.add_done_callback(lambda motion: self._end_scan(motion, future))
+        if wait:
+            future.result()
+        return future
+
+    def _end_scan(self, motion: Future, future: Future):
+        """Disables the position compare at the end of a scan motion, then completes the Future of the scan"""
+        try:
+            self.disable()
+        except XPSError as e:
+            error = e
+        else:
+            error = None
+        if motion.cancelled():
+            future.cancel()
+        elif motion.exception() is not None:
+            future.set_exception(motion.exception())
+        elif error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(motion.result())
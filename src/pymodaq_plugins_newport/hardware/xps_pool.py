@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+Pool of TCP/IP connections to a Newport XPS controller.
+
+The XPS answers each socket sequentially, so several users of the same controller (DAQ_Move
+instances, background pollers...) should not share a single socket. A pool opens up to `size`
+sockets on one controller and lends them with checkout/checkin semantics. Sockets can also be
+reserved for a single owner, ex: a priority socket kept free for aborts. Sockets are connected outside
+of the pool lock, so that a slow or unreachable controller doesn't block the users of the opened sockets.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from .XPS_Q8_drivers import XPS
+from .xps_codec import XPSError
+
+
+class XPSConnectionPool:
+    """
+    Connections to one XPS controller
+
+    Use :meth:`acquire` to get the pool shared by every user of a controller, and :meth:`release` when
+    done with it. Sockets are opened on demand up to `size` and each one is guarded by its own lock, so
+    a checked-out socket is used by a single thread at a time.
+
+    Parameters
+    ----------
+    ip: str
+        IP address of the XPS motion controller. ex: "192.168.0.254"
+    port: int
+        IP port of the XPS. ex: 5001
+    size: int
+        maximum number of sockets opened on the controller
+    timeout: float
+        socket timeout in seconds
+    driver: type
+        class of the driver, XPS or its asyncio based facade SyncXPS
+    """
+
+    DEFAULT_SIZE = 4
+    # time in seconds waited by checkout for a socket to be given back, the motion commands keep their
+    # socket until the end of the motion
+    CHECKOUT_TIMEOUT = 60.0
+
+    _pools: Dict[Tuple[str, int], "XPSConnectionPool"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, ip: str, port: int, size: int = DEFAULT_SIZE, timeout: float = 5.0, driver: type = XPS):
+        self.driver = driver
+        self.xps = driver()
+        self.ip = ip
+        self.port = port
+        self.size = size
+        self.timeout = timeout
+
+        self._condition = threading.Condition()
+        self._idle: List[int] = []
+        self._locks: Dict[int, threading.Lock] = {}
+        self._invalid = set()
+        self._reserved = set()
+        self._connecting = 0  # sockets being connected by checkout, counted in the pool size
+        self._users = 0
+
+    @classmethod
+    def acquire(cls, ip: str, port: int, size: int = DEFAULT_SIZE, timeout: float = 5.0,
+                driver: Optional[type] = None) -> "XPSConnectionPool":
+        """Returns the pool of the controller at ip:port, creating it if it doesn't exist yet, with the XPS
+        driver by default. Raises XPSError if the existing pool was created with another driver than the one
+        requested."""
+        with cls._registry_lock:
+            pool = cls._pools.get((ip, port))
+            if pool is None:
+                pool = cls(ip, port, size, timeout, XPS if driver is None else driver)
+                cls._pools[(ip, port)] = pool
+            elif driver is not None and driver is not pool.driver:
+                raise XPSError(f"The XPS at {ip}:{port} is already connected with the {pool.driver.__name__} "
+                               f"driver, not {driver.__name__}")
+            elif size > pool.size:
+                pool.size = size
+            pool._users += 1
+        return pool
+
+    def release(self):
+        """Gives back a pool obtained with :meth:`acquire`, its sockets are closed with its last user"""
+        with self._registry_lock:
+            self._users -= 1
+            if self._users > 0:
+                return
+            if self._pools.get((self.ip, self.port)) is self:
+                del self._pools[(self.ip, self.port)]
+        self.close()
+
+    @property
+    def nb_opened(self) -> int:
+        """Number of sockets currently opened on the controller"""
+        return len(self._locks)
+
+    @property
+    def nb_shared(self) -> int:
+        """Number of opened sockets lent with checkout/checkin"""
+        return len(self._locks) - len(self._reserved)
+
+    @property
+    def nb_idle(self) -> int:
+        """Number of opened sockets waiting for a user"""
+        return len(self._idle)
+
+    def _open(self) -> int:
+        """Connects a new socket, without the pool lock, the caller registers it in _locks"""
+        socket_id = self.xps.TCP_ConnectToServer(self.ip, self.port, self.timeout)
+        if socket_id == -1:
+            raise XPSError("XPS_Q8 connection failed. Check ip address and port.")
+        return socket_id
+
+    def checkout(self, timeout: Optional[float] = CHECKOUT_TIMEOUT) -> int:
+        """
+        Borrows a socket, opening a new one if all opened sockets are busy and the pool is not full
+
+        Parameters
+        ----------
+        timeout: float or None
+            maximum time to wait for a socket to be returned, None waits forever
+
+        Returns
+        -------
+        int: the socket id to be used with the XPS driver and given back with :meth:`checkin`
+
+        Raises
+        ------
+        XPSError: if no socket was given back within timeout, or if a new socket can't be connected
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        with self._condition:
+            while not self._idle and self.nb_shared + self._connecting >= self.size:
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    raise XPSError(f"No free socket on the XPS at {self.ip} after {timeout} s")
+                self._condition.wait(remaining)
+            if self._idle:
+                socket_id = self._idle.pop()
+                self._locks[socket_id].acquire()
+                return socket_id
+            # the slot is kept while connecting
+            self._connecting += 1
+        try:
+            socket_id = self._open()
+        finally:
+            with self._condition:
+                self._connecting -= 1
+                self._condition.notify()
+        lock = threading.Lock()
+        lock.acquire()
+        with self._condition:
+            self._locks[socket_id] = lock
+        return socket_id
+
+    def checkin(self, socket_id: int, discard: bool = False):
+        """
+        Gives back a socket borrowed with :meth:`checkout`
+
+        Parameters
+        ----------
+        socket_id: int
+        discard: bool
+            if True the socket is closed instead of being reused, ex: after a timeout left unread bytes
+        """
+        with self._condition:
+            lock = self._locks.get(socket_id)
+            if lock is None:
+                return
+            if discard:
+                self.xps.TCP_CloseSocket(socket_id)
+                del self._locks[socket_id]
+                self._invalid.discard(socket_id)
+            else:
+                self._idle.append(socket_id)
+            lock.release()
+            self._condition.notify()
+
+    def reserve(self) -> int:
+        """
+        Opens a socket dedicated to a single owner, it is never lent by checkout and doesn't count in
+        the pool size. Use it with :meth:`reserved` and give it back with :meth:`unreserve`.
+        """
+        socket_id = self._open()
+        with self._condition:
+            self._locks[socket_id] = threading.Lock()
+            self._reserved.add(socket_id)
+        return socket_id
+
+    def unreserve(self, socket_id: int):
+        """Closes a socket opened with :meth:`reserve`"""
+        with self._condition:
+            if socket_id not in self._reserved:
+                return
+            self._reserved.discard(socket_id)
+            self._invalid.discard(socket_id)
+            self.xps.TCP_CloseSocket(socket_id)
+            self._locks.pop(socket_id, None)
+
+    @contextmanager
+    def reserved(self, socket_id: int, timeout: Optional[float] = None):
+        """Context manager holding the lock of a reserved socket for the duration of the block"""
+        lock = self._locks[socket_id]
+        if not lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise XPSError(f"Reserved socket {socket_id} of the XPS at {self.ip} is busy")
+        try:
+            yield socket_id
+        finally:
+            lock.release()
+
+    def is_valid(self, socket_id: int) -> bool:
+        """Returns False if the socket was invalidated or closed"""
+        return socket_id in self._locks and socket_id not in self._invalid
+
+    def invalidate(self, socket_id: int):
+        """Marks a socket so that it is closed instead of being reused when given back"""
+        self._invalid.add(socket_id)
+
+    @contextmanager
+    def socket(self, timeout: Optional[float] = CHECKOUT_TIMEOUT):
+        """Context manager lending a socket id for the duration of the block"""
+        socket_id = self.checkout(timeout)
+        try:
+            yield socket_id
+        finally:
+            self.checkin(socket_id, discard=socket_id in self._invalid)
+
+    def close(self):
+        """Closes every socket of the pool"""
+        with self._condition:
+            for socket_id in list(self._locks):
+                self.xps.TCP_CloseSocket(socket_id)
+            self._locks.clear()
+            self._idle.clear()
+            self._invalid.clear()
+            self._reserved.clear()
+            self._condition.notify_all()
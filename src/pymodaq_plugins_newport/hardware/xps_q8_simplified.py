@@ -1,12 +1,86 @@
-from .XPS_Q8_drivers import XPS
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Sequence
 
+import numpy as np
 
-class XPSError(Exception):
-    """
-    Exception related to the Newport XPS system
+from .XPS_Q8_drivers import XPS, SyncXPS
+from .xps_clock import ClockSync
+from .xps_codec import XPSError
+from .xps_files import XPSFileStore
+from .xps_events import MotionDoneListener
+from .xps_fast_steps import FastSteps
+from .xps_gathering import GatheringSession
+from .xps_motion_model import SGammaModel
+from .xps_pco import PositionCompareTrigger
+from .xps_trajectory import PVTRunner
+from .xps_pool import XPSConnectionPool
+from .xps_stats import XPSStats
+from .xps_strings import XPSStrings
+from .xps_startup import ControllerStartup, GroupStartup, start_group
+from .xps_tcl import TCLScan
+from .xps_telemetry import TelemetrySampler
+
+
+class XPSBatch:
+    """Queue of XPS API calls sent back-to-back on one socket
+
+    Example
+    -------
+    >>> batch = simple_xps.batch()
+    >>> batch.add("GroupPositionCurrentGet", "Group1", nb_element=2)
+    >>> batch.add("GroupVelocityCurrentGet", "Group1", nb_element=2)
+    >>> positions, velocities = batch.execute()
     """
 
-    pass
+    def __init__(self, pool: XPSConnectionPool):
+        self._pool = pool
+        self._calls = []
+
+    def __len__(self):
+        return len(self._calls)
+
+    def add(self, api_name: str, *arguments, nb_element: int = 1):
+        """
+        Queues an API call
+
+        Parameters
+        ----------
+        api_name: str
+            name of the XPS function, ex: "GroupPositionCurrentGet"
+        arguments:
+            input arguments of the function, without the socket id
+        nb_element: int
+            number of positioners for the functions returning one value per positioner
+        """
+        self._calls.append((api_name, arguments, nb_element))
+        return self
+
+    def execute(self) -> list:
+        """
+        Sends the queued calls on one socket of the pool and empties the queue
+
+        Returns
+        -------
+        list: for each call, the list of its decoded returned values (without the error code)
+
+        Raises
+        ------
+        XPSError: if any of the calls returned an error
+        """
+        calls, self._calls = self._calls, []
+        with self._pool.socket() as socket_id:
+            replies = self._pool.xps.Batch(socket_id, calls)
+            if any(error_code in (-2, -108) for error_code, *_ in replies):
+                self._pool.invalidate(socket_id)
+        results = []
+        for (api_name, _, _), [error_code, *values] in zip(calls, replies):
+            if error_code != 0:
+                raise XPSError(f"{api_name} : ERROR {error_code}")
+            results.append(values)
+        return results
 
 
 class SimpleXPS:
@@ -16,6 +90,12 @@ class SimpleXPS:
         port: int,
         group: str,
         positionner: str,
+        pool_size: int = XPSConnectionPool.DEFAULT_SIZE,
+        use_asyncio: bool = False,
+        group_positionners: Sequence[str] = (),
+        fast_startup: bool = True,
+        bring_up_groups: Sequence[str] = (),
+        strings_directory: str | Path | None = None,
     ):
         """
         Parameters
@@ -28,133 +108,696 @@ class SimpleXPS:
             name of the group to control. ex: "Group2"
         positionner: str
             name of the positionner. ex: "Pos"
+        pool_size: int
+            maximum number of sockets opened on the controller, shared by all the SimpleXPS objects
+            connected to the same controller. A move holds one of them until it ends: with a single
+            socket, the other requests wait for the end of the moves
+        use_asyncio: bool
+            if True, the requests go through the asyncio client (AsyncXPS) shared by all the controllers,
+            else through the socket based driver from Newport
+        group_positionners: sequence of str
+            names of all the positionners of a multi-axis group, ex: ("X", "Y", "Z"), in the order of the
+            values of the group methods (get_group_positions, move_group_absolute...)
+        fast_startup: bool
+            if True, a group already READY is reused as is and a NOT REFERENCED group is only homed.
+            If False, the group is always killed, initialized and homed
+        bring_up_groups: sequence of str
+            other groups of the controller to start concurrently with this one, see
+            xps_startup.ControllerStartup. A group already being started is waited for
+        strings_directory: str, Path or None
+            directory where the error and status strings of the controller are saved, see xps_strings.
+            If None, they are requested from the controller at each connection
         """
 
-        # init the wrapper given by Newport and some attributes
-        self.xps = XPS()  # Instantiate the driver from Newport
-
-        # required to connect via TCP/IP
+        # required to connect via TCP/IP. The pool (and the driver from Newport it holds) is shared by
+        # every SimpleXPS connected to the same controller
         self._ip = ip
         self._port = port
-        self.socket_id = -1
+        self._pool_size = pool_size
+        self._driver = SyncXPS if use_asyncio else XPS
+        self._pool: XPSConnectionPool | None = None
 
         # Definition of the stage
         self._group = group
         self._positioner = positionner
         self._full_positionner_name = f"{group}.{positionner}"
+        self._group_positionners = list(group_positionners)
+
+        # Motion commands only return at the end of the motion, they are issued from a worker thread on
+        # their own socket so that the position can still be read during the move. The worker lives
+        # from _init_commands to close_tcpip
+        self._motion_executor: ThreadPoolExecutor | None = None
+        self._motion: Future | None = None
+
+        # Socket reserved for GroupMoveAbort, never used by anything else so that a stop is sent at once
+        self._priority_socket = -1
+        self.last_stop_latency: float | None = None
+
+        self._listener: MotionDoneListener | None = None
+        self._telemetry: TelemetrySampler | None = None
+
+        # Host to controller clock alignment, and controller time (s) of the acquisition of the last
+        # position read, None without clock sync
+        self._clock: ClockSync | None = None
+        self.position_time: float | None = None
+
+        # Error and status strings of the controller, decoded locally
+        self._strings_directory = strings_directory
+        self._strings: XPSStrings | None = None
+
+        # Move duration models of the positionners, read on first use. The lock serializes the changes of
+        # the SGamma parameters with the calibrations, which record the parameters of the moves
+        self._motion_models: dict = {}
+        self._profile_lock = threading.RLock()
+
+        # Startup sequence run by the last connection ("reused", "homed" or "initialized") and its duration
+        self._fast_startup = fast_startup
+        self._bring_up_groups = list(bring_up_groups)
+        self.startup_path = ""
+        self.startup_time = 0.0
 
         # Some required initialisation steps
         self._init_commands()
 
+    @property
+    def xps(self):
+        """The XPS driver from Newport"""
+        return self._pool.xps
+
+    @property
+    def pool(self) -> XPSConnectionPool:
+        """The connection pool shared by the SimpleXPS connected to the same controller"""
+        return self._pool
+
     def _init_commands(self):
         """
         Runs some initial commands : connect to the XPS server, group kill, group intialize, move home.
+        With fast_startup, the state of the group is checked first to skip the steps it doesn't need.
         Some configs could be added here as well
         """
-        self.socket_id = self.xps.TCP_ConnectToServer(
-            self._ip, self._port, 5
+        self._pool = XPSConnectionPool.acquire(
+            self._ip, self._port, self._pool_size, timeout=5, driver=self._driver
         )  # 5s timeout
-        # Check connection passed
-        if self.socket_id == -1:
-            raise XPSError("XPS_Q8 connection failed. Check ip address and port.")
-        else:
-            # Group kill to be sure
-            [error_code, return_string] = self.xps.GroupKill(
-                self.socket_id, self._group
-            )
-            if error_code != 0:
-                self.display_error_and_close(error_code, "GroupKill")
+        # Check connection passed, opening the first socket of the pool raises XPSError otherwise
+        try:
+            with self._pool.socket():
+                pass
+            self._priority_socket = self._pool.reserve()
+        except XPSError:
+            self.close_tcpip()
+            raise
+        self._motion_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="xps_motion"
+        )
+        self._load_strings()
 
-            # Initialize
-            [error_code, return_string] = self.xps.GroupInitialize(
-                self.socket_id, self._group
+        start = time.perf_counter()
+        startup = self.startup()
+        if self._bring_up_groups:
+            startup.bring_up(
+                [group for group in self._bring_up_groups if group != self._group],
+                self._fast_startup,
+                driver=self._driver,
             )
-            if error_code != 0:
-                self.display_error_and_close(error_code, "GroupInitialize")
+        pending = startup.pending(self._group)
+        if pending is not None:
+            # the group is being started by a bring-up: its result is used, not run a second time
+            result = pending.result()
+            if not result.ready:
+                raise XPSError(f"Startup of {self._group} failed: {result.error}")
+            self.startup_path = result.path
+            self.startup_time = time.perf_counter() - start
+            return
+        try:
+            self.startup_path = start_group(
+                self.query, self._group, self._fast_startup, self.move_home
+            )
+        except XPSError as e:
+            startup.record(
+                GroupStartup(self._group, "failed", time.perf_counter() - start, f"{e}")
+            )
+            raise
+        self.startup_time = time.perf_counter() - start
+        startup.record(GroupStartup(self._group, self.startup_path, self.startup_time))
+
+        # Definition of the MotionDone trigger
+        # [error_code, return_string] = self.xps.EventExtendedConfigurationTriggerSet(self.socket_id, 'MotionDone',0,0,0,0)
+        # if (error_code != 0):
+        #     self.display_error_and_close(error_code, 'EventExtendedConfigurationTriggerSet')
+        # [error_code, return_string] = self.xps.EventExtendedConfigurationActionSet(self.socket_id, , 0, 0, 0, 0)
+        # if (error_code != 0):
+        #     self.display_error_and_close(error_code, 'EventExtendedConfigurationActionSet')
 
-            # Home search
-            self.move_home()
+    def _load_strings(self):
+        """Fills the error and status strings, from the cache file of the firmware if there is one"""
+        strings = XPSStrings.get(self._ip, self._port)
+        try:
+            strings.load(self.query, self._strings_directory, self.batch)
+        except XPSError:
+            # older firmwares without the list APIs, the strings are requested one by one when needed
+            pass
+        self._strings = strings
 
-            # Definition of the MotionDone trigger
-            # [error_code, return_string] = self.xps.EventExtendedConfigurationTriggerSet(self.socket_id, 'MotionDone',0,0,0,0)
-            # if (error_code != 0):
-            #     self.display_error_and_close(error_code, 'EventExtendedConfigurationTriggerSet')
-            # [error_code, return_string] = self.xps.EventExtendedConfigurationActionSet(self.socket_id, , 0, 0, 0, 0)
-            # if (error_code != 0):
-            #     self.display_error_and_close(error_code, 'EventExtendedConfigurationActionSet')
+    @property
+    def strings(self) -> XPSStrings | None:
+        """Error and status strings of the controller"""
+        return self._strings
+
+    def query(self, api_name: str, *arguments) -> list:
+        """
+        Calls an API of the XPS driver on a socket borrowed from the pool
+
+        Returns
+        -------
+        list: the returned values, without the error code
+
+        Raises
+        ------
+        XPSError: if the connection is closed or if the XPS returned an error
+        """
+        if not self.check_connected():
+            raise XPSError("XPS connection failed")
+        with self._pool.socket() as socket_id:
+            return self.query_on(socket_id, api_name, *arguments)
+
+    def query_on(self, socket_id: int, api_name: str, *arguments) -> list:
+        """Calls an API of the XPS driver on a given socket, see query"""
+        error_code, *values = getattr(self.xps, api_name)(socket_id, *arguments)
+        if error_code != 0:
+            self.display_error_and_close(error_code, api_name, socket_id)
+        return values
 
     def check_connected(self):
         """Returns true if the connection was successful, else false."""
-        return self.socket_id != -1
+        return self._pool is not None
 
-    def display_error_and_close(self, error_code, api_name):
+    def display_error_and_close(self, error_code, api_name, socket_id):
         """Method to recover an error string based on an error code. Closes the TCPIP connection afterwards"""
         if (error_code != -2) and (error_code != -108):
-            [error_code, error_string] = self.xps.ErrorStringGet(
-                self.socket_id, error_code
-            )
-            if error_code != 0:
-                raise XPSError(f"{api_name} : ERROR {error_code}")
-            else:
-                raise XPSError(f"{api_name} : {error_string}")
+            error_string = None if self._strings is None else self._strings.error_string(error_code)
+            if error_string is None:
+                [error, error_string] = self.xps.ErrorStringGet(socket_id, error_code)
+                if error != 0:
+                    raise XPSError(f"{api_name} : ERROR {error_code}")
+                if self._strings is not None:
+                    self._strings.add_error_string(error_code, error_string)
+            raise XPSError(f"{api_name} : {error_string}")
         else:
+            # the socket can't be trusted anymore, it is closed when given back to the pool
+            self._pool.invalidate(socket_id)
             if error_code == -2:
                 raise XPSError(f"{api_name} : TCP timeout")
             if error_code == -108:
                 raise XPSError(
                     f"{api_name} : The TCP/IP connection was closed by an administrator"
                 )
-        self.close_tcpip()
+
+    def batch(self) -> XPSBatch:
+        """Returns an empty queue of API calls to be sent in one round trip"""
+        if not self.check_connected():
+            raise XPSError("XPS connection failed")
+        return XPSBatch(self._pool)
 
     def close_tcpip(self):
-        """Call the method to close the socket."""
-        self.xps.TCP_CloseSocket(self.socket_id)
+        """Gives back the connection pool, its sockets are closed if no other SimpleXPS uses them."""
+        self._close_listener()
+        self.stop_telemetry()
+        self.stop_clock_sync()
+        self._motion_models.clear()
+        if self._motion_executor is not None:
+            # the motions still queued would run on closed sockets
+            self._motion_executor.shutdown(wait=False, cancel_futures=True)
+            self._motion_executor = None
+        if self._pool is not None:
+            self._pool.unreserve(self._priority_socket)
+            self._priority_socket = -1
+            self._pool.release()
+            self._pool = None
 
-    def get_position(self):
-        """Returns current the position"""
-        if self.check_connected():
-            [error_code, current_position] = self.xps.GroupPositionCurrentGet(
-                self.socket_id, self._full_positionner_name, 1
-            )
-            if error_code != 0:
-                self.display_error_and_close(error_code, "GroupPositionCurrentGet")
-            else:
-                return float(current_position)
-        else:
-            raise XPSError("XPS connection failed")
+    def enable_statistics(self, log_interval: float | None = None) -> XPSStats:
+        """
+        Records the latency, throughput and errors of every call to the controller, see xps_stats
 
-    def move_absolute(self, value):
-        """Moves the stage to the position value."""
-        if self.check_connected():
-            [error_code, return_string] = self.xps.GroupMoveAbsolute(
-                self.socket_id, self._full_positionner_name, [value]
-            )
-            if error_code != 0:
-                self.display_error_and_close(error_code, "GroupMoveAbsolute")
-        else:
-            raise XPSError("XPS connection failed")
+        Parameters
+        ----------
+        log_interval: float or None
+            if given, a summary line is logged every log_interval seconds
 
-    def move_relative(self, value):
-        """Moves the stage to value relative to it's current position."""
-        if self.socket_id != -1:
-            [error_code, return_string] = self.xps.GroupMoveRelative(
-                self.socket_id, self._full_positionner_name, [value]
-            )
-            if error_code != 0:
-                self.display_error_and_close(error_code, "GroupMoveRelative")
+        Returns
+        -------
+        XPSStats: the statistics, shared by all the users of the controller
+        """
+        if not isinstance(self.xps, XPS):
+            raise XPSError("Call statistics are only available with the socket based driver")
+        stats = self.xps.EnableStatistics()
+        if log_interval:
+            stats.start_logging(log_interval)
+        return stats
+
+    def disable_statistics(self):
+        """Stops recording the calls statistics"""
+        if isinstance(self.xps, XPS):
+            stats = self.xps.DisableStatistics()
+            if stats is not None:
+                stats.stop_logging()
+
+    def start_telemetry(self, interval: float = 1.0, capacity: int = 3600) -> TelemetrySampler:
+        """
+        Starts sampling the health of the controller and the following errors of the group (or of the
+        positionner) in the background, on a socket of its own, see xps_telemetry. A sampler already running
+        is stopped first, its samples are lost.
+
+        Parameters
+        ----------
+        interval: float
+            time in seconds between two samples
+        capacity: int
+            number of samples kept in the ring buffer
+
+        Returns
+        -------
+        TelemetrySampler: the running sampler, also available as the telemetry property
+        """
+        self.stop_telemetry()
+        if self._group_positionners:
+            self._telemetry = TelemetrySampler(self, self._group, self._group_positionners, interval, capacity)
         else:
+            self._telemetry = TelemetrySampler(
+                self, self._full_positionner_name, [self._positioner], interval, capacity
+            )
+        return self._telemetry.start()
+
+    def stop_telemetry(self):
+        """Stops the telemetry sampler, its samples stay available from the telemetry property"""
+        if self._telemetry is not None:
+            self._telemetry.stop()
+
+    @property
+    def telemetry(self) -> TelemetrySampler | None:
+        """The last telemetry sampler started, None if there isn't any"""
+        return self._telemetry
+
+    def start_clock_sync(self, interval: float = 10.0, window: int = 60) -> ClockSync:
+        """
+        Starts aligning the host clock on the controller clock in the background, on a socket of its own,
+        see xps_clock. The positions read and the gathering runs are then stamped with controller times.
+
+        Parameters
+        ----------
+        interval: float
+            time in seconds between two samples of the controller clock
+        window: int
+            number of samples of the offset and drift fit
+
+        Returns
+        -------
+        ClockSync: the running clock sync, also available as the clock property
+        """
+        self.stop_clock_sync()
+        self._clock = ClockSync(self, interval, window)
+        return self._clock.start()
+
+    def stop_clock_sync(self):
+        """Stops sampling the controller clock, its last fit is still used"""
+        if self._clock is not None:
+            self._clock.stop()
+
+    @property
+    def clock(self) -> ClockSync | None:
+        """The last clock sync started, None if there isn't any"""
+        return self._clock
+
+    def controller_time(self, host_time_ns: int) -> float | None:
+        """Controller time in seconds of a time.perf_counter_ns host time, None without clock sync"""
+        if self._clock is None or not self._clock.synchronized:
+            return None
+        return float(self._clock.controller_time(host_time_ns))
+
+    def _stamped_query(self, api_name: str, *arguments) -> list:
+        """query, stamping position_time with the controller time of the middle of the request"""
+        start = time.perf_counter_ns()
+        values = self.query(api_name, *arguments)
+        self.position_time = self.controller_time((start + time.perf_counter_ns()) // 2)
+        return values
+
+    def group_status_string(self, status: int | None = None) -> str:
+        """Description of a group status, by default the current status of the group"""
+        if status is None:
+            [status] = self.query("GroupStatusGet", self._group)
+        status_string = None if self._strings is None else self._strings.group_status_string(status)
+        if status_string is None:
+            [status_string] = self.query("GroupStatusStringGet", status)
+        return status_string
+
+    def get_position(self):
+        """Returns current the position, its controller time is in position_time"""
+        [current_position] = self._stamped_query(
+            "GroupPositionCurrentGet", self._full_positionner_name, 1
+        )
+        return float(current_position)
+
+    def get_group_positions(self) -> List[float]:
+        """Returns the current positions of all the group positionners, in one request, see get_position"""
+        return self._stamped_query("GroupPositionCurrentGet", self._group, self.nb_group_positionners)
+
+    def submit_motion(self, api_name: str, *arguments) -> Future:
+        """Issues a motion command from the motion worker thread, on its own socket of the pool"""
+        if not self.check_connected():
             raise XPSError("XPS connection failed")
+        self._motion = self._motion_executor.submit(self.query, api_name, *arguments)
+        return self._motion
+
+    def is_moving(self) -> bool:
+        """Returns True if a motion command issued by this object has not completed yet"""
+        return self._motion is not None and not self._motion.done()
+
+    def move_absolute(self, value, wait: bool = True) -> Future:
+        """
+        Moves the stage to the position value.
+
+        Parameters
+        ----------
+        value: float
+            target position
+        wait: bool
+            if True, returns once the motion is done, else returns immediately
+
+        Returns
+        -------
+        Future: completed when the XPS reports the end of the motion, its result raises XPSError if
+            the motion failed
+        """
+        future = self.submit_motion(
+            "GroupMoveAbsolute", self._full_positionner_name, [value]
+        )
+        if wait:
+            future.result()
+        return future
+
+    def move_relative(self, value, wait: bool = True) -> Future:
+        """Moves the stage to value relative to it's current position. See move_absolute for wait."""
+        future = self.submit_motion(
+            "GroupMoveRelative", self._full_positionner_name, [value]
+        )
+        if wait:
+            future.result()
+        return future
+
+    def move_group_absolute(self, values: Sequence[float], wait: bool = True) -> Future:
+        """
+        Moves all the group positionners to values with a single command, their motions starting and
+        ending together. See move_absolute for wait.
+
+        Parameters
+        ----------
+        values: sequence of float
+            one target position per positionner, in the order of group_positionners
+        """
+        future = self.submit_motion("GroupMoveAbsolute", self._group, self._group_values(values))
+        if wait:
+            future.result()
+        return future
+
+    def move_group_relative(self, values: Sequence[float], wait: bool = True) -> Future:
+        """Moves all the group positionners by values with a single command. See move_group_absolute."""
+        future = self.submit_motion("GroupMoveRelative", self._group, self._group_values(values))
+        if wait:
+            future.result()
+        return future
+
+    def motion_model(self, positionner: str | None = None) -> SGammaModel:
+        """
+        Returns the move duration model of a positionner, its SGamma parameters being read once
+
+        Parameters
+        ----------
+        positionner: str or None
+            name of a positionner of the group, ex: "X", by default the positionner of this object
+        """
+        name = self._positionner_name(positionner)
+        model = self._motion_models.get(name)
+        if model is None:
+            model = self._motion_models[name] = SGammaModel.from_controller(self.query, name)
+        return model
+
+    def predict_move_time(self, displacements, positionner: str | None = None) -> np.ndarray:
+        """Durations in seconds of moves of a positionner by displacements (float or array), see motion_model"""
+        return self.motion_model(positionner).duration(displacements)
 
-    def move_home(self):
-        """Moves the stage to it's home"""
-        if self.check_connected():
-            [error_code, return_string] = self.xps.GroupHomeSearch(
-                self.socket_id, self._group
+    def predict_group_move_time(self, displacements) -> np.ndarray:
+        """
+        Durations in seconds of group moves, the positionners moving together, the slowest one sets the duration
+
+        Parameters
+        ----------
+        displacements: array
+            displacements of the group positionners, in their order, along the last axis. ex: shape (nb_moves, 3)
+            for a XYZ group
+        """
+        displacements = np.asarray(displacements, dtype=float)
+        durations = [self.predict_move_time(displacements[..., index], positionner)
+                     for index, positionner in enumerate(self._group_positionners)]
+        return np.max(durations, axis=0)
+
+    def calibrate_motion_model(self, displacement: float, positionner: str | None = None) -> List[float]:
+        """
+        Calibrates the move duration model of a positionner with the times of its last move, which was of
+        displacement, read with PositionerSGammaPreviousMotionTimesGet
+
+        Returns
+        -------
+        list: the setting and settling times of the move, in seconds
+        """
+        with self._profile_lock:
+            model = self.motion_model(positionner)
+            times = self.query("PositionerSGammaPreviousMotionTimesGet", self._positionner_name(positionner))
+            model.record(displacement, *times)
+            model.calibrate()
+        return times
+
+    @property
+    def profile_lock(self) -> threading.RLock:
+        """Lock held while the SGamma parameters are set or a move calibrates the motion model"""
+        return self._profile_lock
+
+    def _positionner_name(self, positionner: str | None) -> str:
+        """Full name of a positionner of the group, by default the positionner of this object"""
+        return self._full_positionner_name if positionner is None else f"{self._group}.{positionner}"
+
+    def sgamma_parameters(self, positionner: str | None = None) -> List[float]:
+        """Returns the SGamma parameters of a positionner: velocity, acceleration, minimum and maximum jerk times"""
+        return self.query("PositionerSGammaParametersGet", self._positionner_name(positionner))
+
+    def set_sgamma_parameters(
+        self,
+        velocity: float | None = None,
+        acceleration: float | None = None,
+        min_jerk_time: float | None = None,
+        max_jerk_time: float | None = None,
+        positionner: str | None = None,
+    ) -> List[float]:
+        """
+        Sets the SGamma parameters of a positionner for its next moves, and of its motion model
+
+        The parameters left to None are kept, the velocity and the acceleration are limited to the maximum
+        ones of the positionner (PositionerMaximumVelocityAndAccelerationGet).
+
+        Returns
+        -------
+        list: the parameters set: velocity, acceleration, minimum and maximum jerk times
+        """
+        with self._profile_lock:
+            model = self.motion_model(positionner)
+            parameters = [
+                current if value is None else value
+                for current, value in zip(model.parameters(), (velocity, acceleration, min_jerk_time, max_jerk_time))
+            ]
+            parameters[0] = min(parameters[0], model.maximum_velocity)
+            parameters[1] = min(parameters[1], model.maximum_acceleration)
+            self.query("PositionerSGammaParametersSet", self._positionner_name(positionner), *parameters)
+            model.set_parameters(*parameters)
+        return parameters
+
+    def fast_steps(self, positionner: str | None = None, max_step: float | None = None) -> FastSteps:
+        """Returns a scan mode moving the small steps with a faster SGamma profile, see xps_fast_steps"""
+        return FastSteps(self, positionner, max_step)
+
+    def jog_mode(self, enable: bool = True):
+        """Enables the jog mode of the group, or disables it once the positionners are stopped"""
+        self.query("GroupJogModeEnable" if enable else "GroupJogModeDisable", self._group)
+
+    def set_jog_parameters(self, velocities: Sequence[float], accelerations: Sequence[float]):
+        """
+        Sets the velocities and accelerations of the positionners in jog mode, they move until their velocity
+        is set to 0. One value per group positionner, in their order, or a single value without group positionners
+        """
+        name = self._group if self._group_positionners else self._full_positionner_name
+        self.query("GroupJogParametersSet", name, [float(value) for value in velocities],
+                   [float(value) for value in accelerations])
+
+    def jog_parameters(self) -> List[float]:
+        """Returns the jog velocity and acceleration of each group positionner, or of the positionner"""
+        if self._group_positionners:
+            return self.query("GroupJogParametersGet", self._group, self.nb_group_positionners)
+        return self.query("GroupJogParametersGet", self._full_positionner_name, 1)
+
+    def _group_values(self, values: Sequence[float]) -> List[float]:
+        values = [float(value) for value in values]
+        if len(values) != self.nb_group_positionners:
+            raise XPSError(
+                f"{self._group} has {self.nb_group_positionners} positionners, got {len(values)} values"
             )
-            if error_code != 0:
-                self.display_error_and_close(error_code, "GroupHomeSearch")
-        else:
+        return values
+
+    def move_home(self, wait: bool = True) -> Future:
+        """Moves the stage to it's home. See move_absolute for wait."""
+        future = self.submit_motion("GroupHomeSearch", self._group)
+        if wait:
+            future.result()
+        return future
+
+    def stop_motion(self, acceleration_multiplier: float = 1.0) -> float:
+        """
+        Aborts the motion of the group, using the socket reserved for it so that the command is not
+        queued behind the motion or the position requests.
+
+        Parameters
+        ----------
+        acceleration_multiplier: float
+            if greater than 1, uses GroupMoveAbortFast to decelerate faster than the motion profile
+
+        Returns
+        -------
+        float: the stop latency in seconds, from the call to the acknowledgement of the XPS. Also
+            stored in the last_stop_latency attribute
+        """
+        if not self.check_connected():
             raise XPSError("XPS connection failed")
+        if not self._pool.is_valid(self._priority_socket):
+            self._pool.unreserve(self._priority_socket)
+            self._priority_socket = self._pool.reserve()
+        start = time.perf_counter()
+        with self._pool.reserved(self._priority_socket) as socket_id:
+            if acceleration_multiplier > 1:
+                self.query_on(
+                    socket_id,
+                    "GroupMoveAbortFast",
+                    self._group,
+                    acceleration_multiplier,
+                )
+            else:
+                self.query_on(socket_id, "GroupMoveAbort", self._group)
+        self.last_stop_latency = time.perf_counter() - start
+        return self.last_stop_latency
+
+    @property
+    def positionner_name(self) -> str:
+        """Full name of the positionner, ex: Group2.Pos"""
+        return self._full_positionner_name
+
+    @property
+    def nb_group_positionners(self) -> int:
+        """Number of positionners of the group, 1 if the group positionners were not given"""
+        return max(len(self._group_positionners), 1)
+
+    def startup(self) -> ControllerStartup:
+        """Startup registry of the controller, with the combined readiness of its groups"""
+        return ControllerStartup.get(self._ip, self._port)
+
+    def file_store(self, **kwargs) -> XPSFileStore:
+        """FTP access to the files of the XPS, kwargs are passed to XPSFileStore (user, password...)"""
+        return XPSFileStore(self._ip, **kwargs)
+
+    def gathering(
+        self,
+        nb_points: int,
+        quantities=("SetpointPosition", "CurrentPosition", "FollowingError"),
+        divisor: int = 1,
+        **kwargs,
+    ) -> GatheringSession:
+        """
+        Returns a gathering session of the positionner, to be started with its start method or used as a
+        context manager
+
+        Parameters
+        ----------
+        nb_points: int
+            number of lines to gather
+        quantities: sequence of str
+            gathered quantities of the positionner, see xps_gathering.GATHERING_QUANTITIES
+        divisor: int
+            the data is gathered once every `divisor` servo cycles
+        kwargs:
+            other parameters of GatheringSession (chunk_lines, poll_interval)
+        """
+        types = [f"{self._full_positionner_name}.{quantity}" for quantity in quantities]
+        return GatheringSession(self, types, nb_points, divisor, **kwargs)
+
+    def trajectory(self, positionners=None, **kwargs) -> PVTRunner:
+        """
+        Returns a runner of PVT trajectories on the group
+
+        Parameters
+        ----------
+        positionners: sequence of str or None
+            names (without the group) of all the positionners of the group, in the order of the
+            trajectory columns. Defaults to the group positionners, or to the positionner of this object
+        kwargs:
+            passed to XPSFileStore (user, password...)
+        """
+        if positionners is None:
+            positionners = self._group_positionners or [self._positioner]
+        return PVTRunner(
+            self,
+            self._group,
+            [f"{self._group}.{positionner}" for positionner in positionners],
+            self.file_store(**kwargs),
+        )
+
+    def tcl_scan(self, points, positionners=None, **kwargs) -> TCLScan:
+        """
+        Returns a step scan of the group executed on the XPS by a TCL script, to be started with its start
+        method
+
+        Parameters
+        ----------
+        points: ndarray
+            positions of the scan points, shape (nb_points,) or (nb_points, nb_positionners)
+        positionners: sequence of str or None
+            names (without the group) of all the positionners of the group, in the order of the points
+            columns. Defaults to the group positionners, or to the positionner of this object
+        kwargs:
+            other parameters of TCLScan (analog_inputs, dwell, batch_size...)
+        """
+        if positionners is None:
+            positionners = self._group_positionners or [self._positioner]
+        return TCLScan(self, self._group, positionners, points, self.file_store(), **kwargs)
+
+    def motion_done_listener(self) -> MotionDoneListener:
+        """
+        Returns the listener of the MotionDone events of the positionner, created on first use. If the group
+        positionners were given, it reports the positions of the whole group at the end of its motions.
+        """
+        if self._listener is None:
+            if self._group_positionners:
+                self._listener = MotionDoneListener(
+                    self,
+                    f"{self._group}.{self._group_positionners[0]}",
+                    position_name=self._group,
+                    nb_positions=len(self._group_positionners),
+                )
+            else:
+                self._listener = MotionDoneListener(self, self._full_positionner_name)
+        return self._listener
+
+    def _close_listener(self):
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+    def position_compare(self) -> PositionCompareTrigger:
+        """Returns the position compare output (hardware triggering) of the positionner"""
+        return PositionCompareTrigger(self, self._full_positionner_name)
 
     def set_group(self, group: str):
         """
@@ -164,7 +807,8 @@ class SimpleXPS:
             group: Name of the group
         """
         self._group = group
-        self._full_positionner_name = f"{group}.{self._positionner}"
+        self._full_positionner_name = f"{group}.{self._positioner}"
+        self._close_listener()
 
     def set_positionner(self, positionner: str):
         """
@@ -173,8 +817,19 @@ class SimpleXPS:
         Args:
             positionner: Name of the positionner
         """
-        self._positionner = positionner
+        self._positioner = positionner
         self._full_positionner_name = f"{self._group}.{positionner}"
+        self._close_listener()
+
+    def set_group_positionners(self, group_positionners: Sequence[str]):
+        """
+        Sets the positionners of a multi-axis group, see __init__
+
+        Args:
+            group_positionners: Names of all the positionners of the group, empty for single axis use
+        """
+        self._group_positionners = list(group_positionners)
+        self._close_listener()
 
     def set_ip(self, ip: str):
         """
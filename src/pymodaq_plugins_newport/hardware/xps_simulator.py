@@ -0,0 +1,948 @@
+# -*- coding: utf-8 -*-
+"""
+Pure python simulator of the TCP/IP interface of an XPS controller, for tests and benchmarks.
+
+The simulator answers the ``Name(arguments,type *...)`` commands with ``error,values,EndOfAPI`` replies
+on any number of connections. It covers the groups and positioners (status, initialization, homing,
+positions, SGamma parameters, travel limits), the motions (blocking moves following trapezoidal
+velocity profiles in real time, aborts), the gathering (evaluated from the motion profiles at a
+configurable servo rate, optionally saved as the Gathering.dat file of a local directory standing for
+the FTP service), the verification of the PVT trajectories uploaded into that directory, the MotionDone
+extended events, the position compare settings, the global arrays, the error codes of the controller and a
+configurable network latency.
+
+Jerk times are accepted but not simulated, and the APIs it doesn't know return the error -4.
+
+Run it standalone with: python -m pymodaq_plugins_newport.hardware.xps_simulator [port] [Group1.Pos ...]
+"""
+import shutil
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .xps_codec import END_OF_API
+from .xps_files import XPSFileStore
+from .xps_trajectory import PVTTrajectory
+
+ERROR_STRINGS = {
+    0: "Successful command",
+    -2: "TCP timeout",
+    -3: "The TCP/IP connection was closed by an administrator",
+    -4: "Unknown command",
+    -7: "Wrong format in the command string",
+    -8: "Wrong object type for this command",
+    -9: "Wrong number of parameters in the command",
+    -17: "Parameter out of range or incorrect",
+    -18: "Positioner Name doesn't exist or unknown command",
+    -19: "GroupName doesn't exist or unknown command",
+    -22: "Not allowed action",
+    -27: "Move Aborted",
+    -35: "Position is outside of travel limits",
+    -43: "Wrong gathering type or configuration",
+    -61: "Error during file writing or file doesn't exist",
+    -68: "Velocity on trajectory is too big",
+    -69: "Acceleration on trajectory is too big",
+}
+
+# GroupStatusGet codes used by the simulator
+NOT_INITIALIZED = 0
+NOT_INITIALIZED_AFTER_KILL = 7
+READY_FROM_HOMING = 11
+READY_FROM_MOTION = 12
+NOT_REFERENCED = 42
+HOMING = 43
+MOVING = 44
+JOGGING = 47
+READY_FROM_JOGGING = 15
+
+GROUP_STATUS_STRINGS = {
+    NOT_INITIALIZED: "Not initialized state",
+    NOT_INITIALIZED_AFTER_KILL: "Not initialized state due to a GroupKill or KillAll command",
+    READY_FROM_HOMING: "Ready state from homing",
+    READY_FROM_MOTION: "Ready state from motion",
+    NOT_REFERENCED: "Not referenced state",
+    HOMING: "Homing state",
+    MOVING: "Moving state",
+    JOGGING: "Jogging state",
+    READY_FROM_JOGGING: "Ready state from jogging",
+}
+
+# bits of the PositionerErrorGet and PositionerHardwareStatusGet masks listed by the simulator
+POSITIONER_ERROR_STRINGS = {
+    0x00000001: "General inhibition detected",
+    0x00000002: "Fatal following error detected",
+    0x00000004: "Home search time out",
+    0x00000100: "Minus end of run activated",
+    0x00000200: "Plus end of run activated",
+}
+HARDWARE_STATUS_STRINGS = {
+    0x00000001: "General inhibition detected",
+    0x00000004: "Motor is enabled",
+    0x00000100: "Minus end of run activated",
+    0x00000200: "Plus end of run activated",
+}
+
+
+def _string_list(strings, hexadecimal=False):
+    """Reply of the *ListGet APIs, ex: "-17 : Parameter out of range or incorrect;..." """
+    return ";".join(f"{code:#010x} : {text}" if hexadecimal else f"{code} : {text}"
+                    for code, text in strings.items())
+
+
+class SimulatorError(Exception):
+    """Error of a simulated command, answered with its XPS error code"""
+
+    def __init__(self, code: int):
+        super().__init__(ERROR_STRINGS.get(code, str(code)))
+        self.code = code
+
+
+class _Hold:
+    """Positioner at rest from time t0"""
+
+    def __init__(self, t0: float, x0: float):
+        self.t0, self.x0 = t0, x0
+        self.end = t0
+
+    def position(self, t):
+        return self.x0 + 0. * np.asarray(t)
+
+    def velocity(self, t):
+        return 0. * np.asarray(t)
+
+    def acceleration(self, t):
+        return 0. * np.asarray(t)
+
+
+class _Move(_Hold):
+    """Trapezoidal (or triangular) velocity profile from rest at x0 to rest at x1"""
+
+    def __init__(self, t0: float, x0: float, x1: float, velocity: float, acceleration: float):
+        super().__init__(t0, x0)
+        self.sign = 1. if x1 >= x0 else -1.
+        distance = abs(x1 - x0)
+        self.a = acceleration
+        if distance >= velocity ** 2 / acceleration:
+            self.ramp = velocity / acceleration
+            self.cruise = (distance - velocity ** 2 / acceleration) / velocity
+            self.v = velocity
+        else:
+            self.ramp = (distance / acceleration) ** 0.5
+            self.cruise = 0.
+            self.v = acceleration * self.ramp
+        self.x1 = x1
+        self.duration = 2 * self.ramp + self.cruise
+        self.end = t0 + self.duration
+
+    def _phases(self, t):
+        dt = np.clip(np.asarray(t, dtype=np.float64) - self.t0, 0., self.duration)
+        return dt, dt - self.ramp, dt - self.ramp - self.cruise
+
+    def position(self, t):
+        dt, cruise, decel = self._phases(t)
+        ramp_distance = self.a * self.ramp ** 2 / 2
+        distance = np.where(
+            dt < self.ramp, self.a * dt ** 2 / 2,
+            np.where(decel < 0, ramp_distance + self.v * cruise,
+                     ramp_distance + self.v * self.cruise + self.v * decel - self.a * decel ** 2 / 2))
+        return self.x0 + self.sign * distance
+
+    def velocity(self, t):
+        dt, _, decel = self._phases(t)
+        speed = np.where(dt < self.ramp, self.a * dt, np.where(decel < 0, self.v, self.v - self.a * decel))
+        return self.sign * np.where(dt >= self.duration, 0., speed)
+
+    def acceleration(self, t):
+        dt, _, decel = self._phases(t)
+        acceleration = np.where(dt < self.ramp, self.a, np.where(decel < 0, 0., -self.a))
+        return self.sign * np.where(dt >= self.duration, 0., acceleration)
+
+
+class _Stop(_Hold):
+    """Deceleration from the velocity v0 down to rest"""
+
+    def __init__(self, t0: float, x0: float, v0: float, deceleration: float):
+        super().__init__(t0, x0)
+        self.v0 = v0
+        self.a = -np.sign(v0) * deceleration
+        self.duration = abs(v0) / deceleration
+        self.x1 = x0 + v0 * self.duration / 2
+        self.end = t0 + self.duration
+
+    def position(self, t):
+        dt = np.clip(np.asarray(t, dtype=np.float64) - self.t0, 0., self.duration)
+        return self.x0 + self.v0 * dt + self.a * dt ** 2 / 2
+
+    def velocity(self, t):
+        dt = np.clip(np.asarray(t, dtype=np.float64) - self.t0, 0., self.duration)
+        return self.v0 + self.a * dt
+
+    def acceleration(self, t):
+        dt = np.asarray(t, dtype=np.float64) - self.t0
+        return np.where(dt < self.duration, self.a, 0.)
+
+
+class _Jog(_Hold):
+    """Linear change of the velocity from v0 to v1, then constant velocity"""
+
+    def __init__(self, t0: float, x0: float, v0: float, v1: float, acceleration: float):
+        super().__init__(t0, x0)
+        self.v0, self.v1 = v0, v1
+        self.a = np.sign(v1 - v0) * acceleration
+        self.ramp = abs(v1 - v0) / acceleration
+        self.end = t0 + self.ramp if v1 == 0 else np.inf
+        if v1 == 0:
+            self.x1 = x0 + v0 * self.ramp / 2
+
+    def position(self, t):
+        dt = np.maximum(np.asarray(t, dtype=np.float64) - self.t0, 0.)
+        ramp = np.minimum(dt, self.ramp)
+        return self.x0 + self.v0 * ramp + self.a * ramp ** 2 / 2 + self.v1 * (dt - ramp)
+
+    def velocity(self, t):
+        dt = np.maximum(np.asarray(t, dtype=np.float64) - self.t0, 0.)
+        return self.v0 + self.a * np.minimum(dt, self.ramp)
+
+    def acceleration(self, t):
+        dt = np.asarray(t, dtype=np.float64) - self.t0
+        return np.where(dt < self.ramp, self.a, 0.)
+
+
+class SimulatedPositioner:
+    """Motion state and parameters of one positioner"""
+
+    def __init__(self, name: str, velocity: float, acceleration: float, travel: Sequence[float],
+                 following_error: float, maximum_velocity: float, maximum_acceleration: float):
+        self.name = name
+        self.velocity = velocity
+        self.acceleration = acceleration
+        self.jerk_times = [0.005, 0.05]
+        self.maximum_velocity = maximum_velocity
+        self.maximum_acceleration = maximum_acceleration
+        self.jog = [0., 0.]  # velocity and acceleration
+        self.travel = list(travel)
+        self.following_error = following_error  # at maximum velocity
+        self.segments = [_Hold(0., 0.)]
+        self.motion_times = (0., 0.)
+        self.motion_done_count = 0
+        self.pco = [0., 0., 0., False]
+        self.pco_pulse = [0.2, 0.075]
+        self.pvt_verification = None  # file name, minimum and maximum positions, maximum velocity and acceleration
+
+    def segment_at(self, t: float):
+        for segment in reversed(self.segments):
+            if segment.t0 <= t:
+                return segment
+        return self.segments[0]
+
+    def position(self, t: float) -> float:
+        return float(self.segment_at(t).position(t))
+
+    def target(self) -> float:
+        return float(getattr(self.segments[-1], "x1", self.segments[-1].x0))
+
+    def push(self, segment):
+        # segments are evaluated by gathering requests, old ones are dropped to bound the memory
+        self.segments.append(segment)
+        del self.segments[:-1000]
+
+    def gather(self, quantity: str, times: np.ndarray) -> np.ndarray:
+        """Values of a gathering quantity at the given times"""
+        starts = np.array([segment.t0 for segment in self.segments])
+        index = np.maximum(np.searchsorted(starts, times, side="right") - 1, 0)
+        setpoint = np.empty_like(times)
+        velocity = np.empty_like(times)
+        acceleration = np.empty_like(times)
+        for segment_index in np.unique(index):
+            mask = index == segment_index
+            segment = self.segments[segment_index]
+            setpoint[mask] = segment.position(times[mask])
+            velocity[mask] = segment.velocity(times[mask])
+            acceleration[mask] = segment.acceleration(times[mask])
+        error = self.following_error * velocity / self.maximum_velocity
+        values = {
+            "SetpointPosition": setpoint,
+            "CurrentPosition": setpoint - error,
+            "FollowingError": error,
+            "SetpointVelocity": velocity,
+            "CurrentVelocity": velocity,
+            "SetpointAcceleration": acceleration,
+            "CurrentAcceleration": acceleration,
+            "CorrectorOutput": np.zeros_like(times),
+        }
+        if quantity not in values:
+            raise SimulatorError(-43)
+        return values[quantity]
+
+
+class SimulatedGroup:
+    def __init__(self, name: str, positioners: List[SimulatedPositioner], status: int):
+        self.name = name
+        self.positioners = positioners
+        self.status = status
+        self.motion_serial = 0  # incremented by each new motion and abort
+
+
+class XPSSimulator:
+    """
+    TCP server simulating an XPS controller
+
+    Parameters
+    ----------
+    groups: dict
+        positioner names of each group, ex: {"Group1": ["Pos"], "XY": ["X", "Y"]}
+    host: str
+    port: int
+        0 to pick a free port, see the port attribute once started
+    latency: float
+        time in seconds waited before each reply, standing for the network and the controller
+    ready: bool
+        if True, the groups start READY at 0, else NOT INITIALIZED
+    home_time: float
+        duration in seconds of GroupHomeSearch
+    velocity, acceleration: float
+        SGamma velocity and acceleration of every positioner
+    maximum_velocity, maximum_acceleration: float or None
+        limits of every positioner, by default the SGamma velocity and acceleration
+    travel: (float, float)
+        user travel limits of every positioner
+    following_error: float
+        following error of the positioners at maximum velocity
+    servo_rate: float
+        gathering rate in Hz with a divisor of 1, 8 kHz on an XPS-Q8
+    files_root: Path or None
+        local directory standing for the files of the XPS: GatheringStopAndSave writes the gathering
+        file there, MultipleAxesPVTVerification reads the trajectory files from it and TCLScriptExecute
+        checks that the script exists. See XPSFileStore and LocalFTP
+
+    Example
+    -------
+    >>> with XPSSimulator({"Group1": ["Pos"]}, ready=True) as simulator:
+    ...     controller = SimpleXPS("127.0.0.1", simulator.port, "Group1", "Pos")
+    """
+
+    FIRMWARE_VERSION = "XPS-Q8 Simulator V1.0"
+
+    def __init__(
+        self,
+        groups: Optional[Dict[str, Sequence[str]]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        ready: bool = False,
+        home_time: float = 0.5,
+        velocity: float = 20.0,
+        acceleration: float = 80.0,
+        maximum_velocity: Optional[float] = None,
+        maximum_acceleration: Optional[float] = None,
+        travel: Sequence[float] = (-100.0, 100.0),
+        following_error: float = 1e-4,
+        servo_rate: float = 8000.0,
+        files_root: Optional[Path] = None,
+    ):
+        if groups is None:
+            groups = {"Group1": ["Pos"]}
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.home_time = home_time
+        self.servo_rate = servo_rate
+        self.files_root = None if files_root is None else Path(files_root)
+
+        self.groups: Dict[str, SimulatedGroup] = {}
+        self.positioners: Dict[str, SimulatedPositioner] = {}
+        for group_name, names in groups.items():
+            positioners = [SimulatedPositioner(
+                f"{group_name}.{name}", velocity, acceleration, travel, following_error,
+                velocity if maximum_velocity is None else maximum_velocity,
+                acceleration if maximum_acceleration is None else maximum_acceleration,
+            ) for name in names]
+            self.groups[group_name] = SimulatedGroup(
+                group_name, positioners, READY_FROM_HOMING if ready else NOT_INITIALIZED)
+            self.positioners.update({positioner.name: positioner for positioner in positioners})
+
+        self.global_arrays: Dict[int, str] = {}
+        self.double_global_arrays: Dict[int, float] = {}
+        self.tcl_tasks: Dict[str, str] = {}  # script file name of the running TCL tasks, by task name
+        self.gathering_types: List[str] = []
+        self.gathering_run = None  # (start time, nb points, divisor, stop time)
+        self.commands = 0  # number of commands answered
+
+        self._condition = threading.Condition()
+        self._epoch = time.perf_counter()
+        self._server = None
+
+    # Server
+
+    def start(self) -> int:
+        """Starts serving in a daemon thread and returns the port"""
+        simulator = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                # replies to pipelined commands are sent at once, not delayed by the Nagle algorithm
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                session = {}
+                buffer = b""
+                while True:
+                    try:
+                        data = self.request.recv(65536)
+                    except OSError:
+                        return
+                    if not data:
+                        return
+                    buffer += data
+                    if simulator.latency:
+                        time.sleep(simulator.latency)
+                    while b")" in buffer:
+                        command, _, buffer = buffer.partition(b")")
+                        reply = simulator.execute(command.decode().strip() + ")", session)
+                        try:
+                            self.request.sendall(reply.encode())
+                        except OSError:
+                            return
+
+        self._server = socketserver.ThreadingTCPServer((self.host, self.port), Handler, bind_and_activate=False)
+        self._server.daemon_threads = True
+        self._server.allow_reuse_address = True
+        self._server.server_bind()
+        self._server.server_activate()
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="xps_simulator", daemon=True).start()
+        return self.port
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def now(self) -> float:
+        return time.perf_counter() - self._epoch
+
+    # Protocol
+
+    def execute(self, command: str, session: Optional[dict] = None) -> str:
+        """Answers one command, ex: "GroupStatusGet(Group1,int *)" -> "0,11,EndOfAPI" """
+        self.commands += 1
+        name, _, arguments = command.partition("(")
+        fields = [field.strip() for field in arguments[:-1].split(",")] if arguments[:-1].strip() else []
+        inputs = [field for field in fields if not field.endswith("*")]
+        nb_outputs = len(fields) - len(inputs)
+        handler = getattr(self, f"_api_{name}", None)
+        try:
+            if handler is None:
+                raise SimulatorError(-4)
+            values = handler(session if session is not None else {}, *inputs)
+        except SimulatorError as error:
+            return f"{error.code}{END_OF_API}"
+        except (TypeError, ValueError, IndexError):
+            return f"-9{END_OF_API}"
+        values = [] if values is None else list(values)
+        if nb_outputs and len(values) != nb_outputs:
+            return f"-9{END_OF_API}"
+        return ",".join(["0"] + [self._format(value) for value in values[:nb_outputs]]) + END_OF_API
+
+    @staticmethod
+    def _format(value) -> str:
+        if isinstance(value, (bool, np.bool_)):
+            return "1" if value else "0"
+        if isinstance(value, float):
+            return repr(value)
+        return str(value)
+
+    def _group(self, name: str) -> SimulatedGroup:
+        group = self.groups.get(name)
+        if group is None:
+            raise SimulatorError(-19)
+        return group
+
+    def _positioner(self, name: str) -> SimulatedPositioner:
+        positioner = self.positioners.get(name)
+        if positioner is None:
+            raise SimulatorError(-18)
+        return positioner
+
+    def _group_or_positioner(self, name: str):
+        """Returns the group and its positioners concerned by a command on a group or a positioner"""
+        if "." in name:
+            positioner = self._positioner(name)
+            return self._group(name.split(".")[0]), [positioner]
+        group = self._group(name)
+        return group, group.positioners
+
+    # Controller
+
+    def _api_FirmwareVersionGet(self, session):
+        return [self.FIRMWARE_VERSION]
+
+    def _api_ElapsedTimeGet(self, session):
+        return [self.now()]
+
+    def _api_ErrorStringGet(self, session, code):
+        return [ERROR_STRINGS.get(int(code), f"Error {code}")]
+
+    def _api_ErrorListGet(self, session):
+        return [_string_list(ERROR_STRINGS)]
+
+    def _api_GroupStatusListGet(self, session):
+        return [_string_list(GROUP_STATUS_STRINGS)]
+
+    def _api_PositionerErrorListGet(self, session):
+        return [_string_list(POSITIONER_ERROR_STRINGS, hexadecimal=True)]
+
+    def _api_PositionerHardwareStatusListGet(self, session):
+        return [_string_list(HARDWARE_STATUS_STRINGS, hexadecimal=True)]
+
+    def _api_TestTCP(self, session, text):
+        return [text]
+
+    def _api_CPUTemperatureAndFanSpeedGet(self, session):
+        return [45.0, 3000.0]
+
+    def _api_ControllerMotionKernelTimeLoadGet(self, session):
+        return [0.3, 0.15, 0.1, 0.05]
+
+    def _api_ControllerRTTimeGet(self, session):
+        return [1 / self.servo_rate, 0.4]
+
+    def _api_GlobalArrayGet(self, session, number):
+        return [self.global_arrays.get(int(number), "")]
+
+    def _api_GlobalArraySet(self, session, number, *value):
+        self.global_arrays[int(number)] = ",".join(value)
+
+    def _api_DoubleGlobalArrayGet(self, session, number):
+        return [self.double_global_arrays.get(int(number), 0.)]
+
+    def _api_DoubleGlobalArraySet(self, session, number, value):
+        self.double_global_arrays[int(number)] = float(value)
+
+    # Groups
+
+    def _api_GroupStatusGet(self, session, name):
+        return [self._group(name).status]
+
+    def _api_GroupStatusStringGet(self, session, code):
+        return [GROUP_STATUS_STRINGS.get(int(code), f"Group state {code}")]
+
+    def _api_GroupKill(self, session, name):
+        group = self._group(name)
+        self._abort(group, None)
+        group.status = NOT_INITIALIZED_AFTER_KILL
+
+    def _api_GroupInitialize(self, session, name):
+        group = self._group(name)
+        if group.status not in (NOT_INITIALIZED, NOT_INITIALIZED_AFTER_KILL):
+            raise SimulatorError(-22)
+        group.status = NOT_REFERENCED
+
+    def _api_GroupHomeSearch(self, session, name):
+        group = self._group(name)
+        if group.status != NOT_REFERENCED:
+            raise SimulatorError(-22)
+        group.status = HOMING
+        time.sleep(self.home_time)
+        with self._condition:
+            for positioner in group.positioners:
+                positioner.push(_Hold(self.now(), 0.))
+            group.status = READY_FROM_HOMING
+            self._condition.notify_all()
+
+    def _api_GroupPositionCurrentGet(self, session, name):
+        _, positioners = self._group_or_positioner(name)
+        now = self.now()
+        return [positioner.position(now) - positioner.following_error * float(
+            positioner.segment_at(now).velocity(now)) / positioner.maximum_velocity for positioner in positioners]
+
+    def _api_GroupPositionSetpointGet(self, session, name):
+        _, positioners = self._group_or_positioner(name)
+        now = self.now()
+        return [positioner.position(now) for positioner in positioners]
+
+    def _api_GroupPositionTargetGet(self, session, name):
+        _, positioners = self._group_or_positioner(name)
+        return [positioner.target() for positioner in positioners]
+
+    def _api_GroupCurrentFollowingErrorGet(self, session, name):
+        _, positioners = self._group_or_positioner(name)
+        now = self.now()
+        return [positioner.following_error * float(positioner.segment_at(now).velocity(now))
+                / positioner.maximum_velocity for positioner in positioners]
+
+    def _api_GroupVelocityCurrentGet(self, session, name):
+        _, positioners = self._group_or_positioner(name)
+        now = self.now()
+        return [float(positioner.segment_at(now).velocity(now)) for positioner in positioners]
+
+    def _api_GroupMotionStatusGet(self, session, name):
+        _, positioners = self._group_or_positioner(name)
+        now = self.now()
+        return [int(positioner.segments[-1].end > now) for positioner in positioners]
+
+    def _api_GroupMoveAbsolute(self, session, name, *targets):
+        group, positioners = self._group_or_positioner(name)
+        targets = [float(target) for target in targets]
+        if len(targets) != len(positioners):
+            raise SimulatorError(-9)
+        return self._move(group, positioners, targets)
+
+    def _api_GroupMoveRelative(self, session, name, *displacements):
+        group, positioners = self._group_or_positioner(name)
+        if len(displacements) != len(positioners):
+            raise SimulatorError(-9)
+        targets = [positioner.target() + float(displacement)
+                   for positioner, displacement in zip(positioners, displacements)]
+        return self._move(group, positioners, targets)
+
+    def _api_GroupJogModeEnable(self, session, name):
+        group = self._group(name)
+        with self._condition:
+            if not 10 <= group.status <= 18:
+                raise SimulatorError(-22)
+            for positioner in group.positioners:
+                positioner.jog = [0., 0.]
+            group.status = JOGGING
+
+    def _api_GroupJogModeDisable(self, session, name):
+        group = self._group(name)
+        with self._condition:
+            now = self.now()
+            if group.status != JOGGING or any(positioner.segments[-1].end > now for positioner in group.positioners):
+                raise SimulatorError(-22)
+            group.status = READY_FROM_JOGGING
+
+    def _api_GroupJogParametersSet(self, session, name, *values):
+        group, positioners = self._group_or_positioner(name)
+        if len(values) != 2 * len(positioners):
+            raise SimulatorError(-9)
+        with self._condition:
+            if group.status != JOGGING:
+                raise SimulatorError(-22)
+            now = self.now()
+            for positioner, velocity, acceleration in zip(positioners, values[::2], values[1::2]):
+                velocity, acceleration = float(velocity), float(acceleration)
+                if not (abs(velocity) <= positioner.maximum_velocity
+                        and 0 < acceleration <= positioner.maximum_acceleration):
+                    raise SimulatorError(-17)
+            for positioner, velocity, acceleration in zip(positioners, values[::2], values[1::2]):
+                positioner.jog = [float(velocity), float(acceleration)]
+                positioner.push(_Jog(now, positioner.position(now), float(positioner.segment_at(now).velocity(now)),
+                                     *positioner.jog))
+
+    def _api_GroupJogParametersGet(self, session, name):
+        _, positioners = self._group_or_positioner(name)
+        return [value for positioner in positioners for value in positioner.jog]
+
+    def _api_GroupJogCurrentGet(self, session, name):
+        _, positioners = self._group_or_positioner(name)
+        now = self.now()
+        return [value for positioner in positioners
+                for value in (float(positioner.segment_at(now).velocity(now)),
+                              float(positioner.segment_at(now).acceleration(now)))]
+
+    def _move(self, group: SimulatedGroup, positioners: List[SimulatedPositioner], targets: List[float]):
+        with self._condition:
+            if not 10 <= group.status <= 18:
+                raise SimulatorError(-22)
+            for positioner, target in zip(positioners, targets):
+                if not positioner.travel[0] <= target <= positioner.travel[1]:
+                    raise SimulatorError(-35)
+            now = self.now()
+            moves = [_Move(now, positioner.position(now), target, positioner.velocity, positioner.acceleration)
+                     for positioner, target in zip(positioners, targets)]
+            for positioner, move in zip(positioners, moves):
+                positioner.push(move)
+                positioner.motion_times = (move.duration, 0.)
+            group.status = MOVING
+            group.motion_serial += 1
+            serial = group.motion_serial
+            end = max(move.end for move in moves)
+            while self.now() < end and group.motion_serial == serial:
+                self._condition.wait(end - self.now())
+            aborted = group.motion_serial != serial
+            if aborted:
+                # the command returns once the deceleration of the abort is over
+                end = max(positioner.segments[-1].end for positioner in positioners)
+                while self.now() < end:
+                    self._condition.wait(end - self.now())
+            else:
+                group.status = READY_FROM_MOTION
+            for positioner in positioners:
+                positioner.motion_done_count += 1
+            self._condition.notify_all()
+        if aborted:
+            raise SimulatorError(-27)
+
+    def _abort(self, group: SimulatedGroup, multiplier: Optional[float] = 1.):
+        """Decelerates the moving positioners, at once if multiplier is None"""
+        with self._condition:
+            now = self.now()
+            for positioner in group.positioners:
+                if positioner.segments[-1].end > now:
+                    segment = positioner.segment_at(now)
+                    position, velocity = float(segment.position(now)), float(segment.velocity(now))
+                    if multiplier is None or velocity == 0:
+                        positioner.push(_Hold(now, position))
+                    else:
+                        positioner.push(_Stop(now, position, velocity, positioner.acceleration * multiplier))
+            group.motion_serial += 1
+            if group.status == MOVING:
+                group.status = READY_FROM_MOTION
+            self._condition.notify_all()
+
+    def _api_GroupMoveAbort(self, session, name):
+        self._abort(self._group(name))
+
+    def _api_GroupMoveAbortFast(self, session, name, multiplier):
+        self._abort(self._group(name), max(float(multiplier), 1.))
+
+    # Positioners
+
+    def _api_PositionerSGammaParametersGet(self, session, name):
+        positioner = self._positioner(name)
+        return [positioner.velocity, positioner.acceleration] + positioner.jerk_times
+
+    def _api_PositionerSGammaParametersSet(self, session, name, velocity, acceleration, min_jerk, max_jerk):
+        positioner = self._positioner(name)
+        velocity, acceleration = float(velocity), float(acceleration)
+        if not (0 < velocity <= positioner.maximum_velocity and 0 < acceleration <= positioner.maximum_acceleration):
+            raise SimulatorError(-17)
+        positioner.velocity, positioner.acceleration = velocity, acceleration
+        positioner.jerk_times = [float(min_jerk), float(max_jerk)]
+
+    def _api_PositionerSGammaPreviousMotionTimesGet(self, session, name):
+        return list(self._positioner(name).motion_times)
+
+    def _api_PositionerMaximumVelocityAndAccelerationGet(self, session, name):
+        positioner = self._positioner(name)
+        return [positioner.maximum_velocity, positioner.maximum_acceleration]
+
+    def _api_PositionerUserTravelLimitsGet(self, session, name):
+        return list(self._positioner(name).travel)
+
+    def _api_PositionerUserTravelLimitsSet(self, session, name, minimum, maximum):
+        self._positioner(name).travel = [float(minimum), float(maximum)]
+
+    def _api_PositionerPositionCompareSet(self, session, name, minimum, maximum, step):
+        positioner = self._positioner(name)
+        minimum, maximum, step = float(minimum), float(maximum), float(step)
+        if minimum >= maximum or step <= 0:
+            raise SimulatorError(-17)
+        positioner.pco[:3] = [minimum, maximum, step]
+
+    def _api_PositionerPositionCompareGet(self, session, name):
+        return list(self._positioner(name).pco)
+
+    def _api_PositionerPositionCompareEnable(self, session, name):
+        positioner = self._positioner(name)
+        if positioner.pco[2] <= 0:
+            raise SimulatorError(-22)
+        positioner.pco[3] = True
+
+    def _api_PositionerPositionCompareDisable(self, session, name):
+        self._positioner(name).pco[3] = False
+
+    def _api_PositionerPositionComparePulseParametersSet(self, session, name, width, settling_time):
+        self._positioner(name).pco_pulse = [float(width), float(settling_time)]
+
+    def _api_PositionerPositionComparePulseParametersGet(self, session, name):
+        return list(self._positioner(name).pco_pulse)
+
+    # Extended events, the trigger is configured per connection
+
+    def _api_EventExtendedConfigurationTriggerSet(self, session, event, *parameters):
+        positioner_name, _, event_name = event.rpartition(".SGamma.")
+        if event_name != "MotionDone":
+            raise SimulatorError(-22)
+        positioner = self._positioner(positioner_name)
+        session["trigger"] = (positioner, positioner.motion_done_count)
+
+    def _api_EventExtendedStart(self, session):
+        return [1]
+
+    def _api_EventExtendedWait(self, session):
+        if "trigger" not in session:
+            raise SimulatorError(-22)
+        positioner, count = session["trigger"]
+        with self._condition:
+            while positioner.motion_done_count <= count:
+                self._condition.wait()
+
+    # Gathering
+
+    def _api_GatheringReset(self, session):
+        self.gathering_run = None
+
+    def _api_GatheringConfigurationSet(self, session, *types):
+        for gathering_type in types:
+            positioner_name, _, quantity = gathering_type.rpartition(".")
+            self._positioner(positioner_name).gather(quantity, np.zeros(1))
+        self.gathering_types = list(types)
+
+    def _api_GatheringConfigurationGet(self, session):
+        return [";".join(self.gathering_types)]
+
+    def _api_GatheringRun(self, session, nb_points, divisor):
+        if not self.gathering_types:
+            raise SimulatorError(-43)
+        self.gathering_run = [self.now(), int(nb_points), int(divisor), None]
+
+    def _gathered_number(self) -> int:
+        if self.gathering_run is None:
+            return 0
+        start, nb_points, divisor, stop = self.gathering_run
+        end = self.now() if stop is None else stop
+        return min(nb_points, int((end - start) * self.servo_rate / divisor))
+
+    def _api_GatheringCurrentNumberGet(self, session):
+        return [self._gathered_number(), 0 if self.gathering_run is None else self.gathering_run[1]]
+
+    def _api_GatheringStop(self, session):
+        if self.gathering_run is None:
+            raise SimulatorError(-22)
+        self.gathering_run[3] = self.now()
+
+    def _gathering_lines(self, start: int, nb_lines: int) -> np.ndarray:
+        run_start, _, divisor, _ = self.gathering_run
+        times = run_start + (start + np.arange(nb_lines)) * divisor / self.servo_rate
+        columns = []
+        for gathering_type in self.gathering_types:
+            positioner_name, _, quantity = gathering_type.rpartition(".")
+            columns.append(self.positioners[positioner_name].gather(quantity, times))
+        return np.column_stack(columns)
+
+    def _api_GatheringDataMultipleLinesGet(self, session, start, nb_lines):
+        start, nb_lines = int(start), int(nb_lines)
+        if self.gathering_run is None or start < 0 or nb_lines <= 0 or start + nb_lines > self._gathered_number():
+            raise SimulatorError(-17)
+        lines = self._gathering_lines(start, nb_lines)
+        return ["\n".join(";".join(f"{value:.12g}" for value in line) for line in lines)]
+
+    def _api_GatheringStopAndSave(self, session):
+        self._api_GatheringStop(session)
+        if self.files_root is not None:
+            path = self.files_root / XPSFileStore.GATHERING_FILE.lstrip("/")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as file:
+                file.write("\t".join(self.gathering_types) + "\n")
+                np.savetxt(file, self._gathering_lines(0, self._gathered_number()), fmt="%.12g", delimiter="\t")
+
+    # TCL scripts, not interpreted: the tasks are only recorded, a test plays the script through the global
+    # arrays
+
+    def _api_TCLScriptExecute(self, session, file_name, task_name, arguments):
+        if self.files_root is None:
+            raise SimulatorError(-61)
+        if not (self.files_root / XPSFileStore.SCRIPTS_DIRECTORY.lstrip("/") / file_name).is_file():
+            raise SimulatorError(-61)
+        if task_name in self.tcl_tasks:
+            raise SimulatorError(-22)
+        self.tcl_tasks[task_name] = file_name
+
+    def _api_TCLScriptKill(self, session, task_name):
+        if self.tcl_tasks.pop(task_name, None) is None:
+            raise SimulatorError(-22)
+
+    # PVT trajectories, read from the files of files_root
+
+    def _api_MultipleAxesPVTVerification(self, session, name, file_name):
+        group = self._group(name)
+        if self.files_root is None:
+            raise SimulatorError(-61)
+        path = self.files_root / XPSFileStore.TRAJECTORIES_DIRECTORY.lstrip("/") / file_name
+        try:
+            rows = np.loadtxt(path, delimiter=",", ndmin=2)
+        except (OSError, ValueError):
+            raise SimulatorError(-61)
+        if rows.shape[1] != 1 + 2 * len(group.positioners):
+            raise SimulatorError(-61)
+        trajectory = PVTTrajectory(rows[:, 0], rows[:, 1::2], rows[:, 2::2])
+        velocities, accelerations = trajectory.kinematics()
+        now = self.now()
+        reached = trajectory.excursion() + [positioner.position(now) for positioner in group.positioners]
+        for positioner in group.positioners:
+            positioner.pvt_verification = None
+        results = []
+        for index, positioner in enumerate(group.positioners):
+            if velocities[:, index].max() > positioner.maximum_velocity * (1 + PVTTrajectory.LIMIT_TOLERANCE):
+                raise SimulatorError(-68)
+            if accelerations[:, index].max() > positioner.maximum_acceleration * (1 + PVTTrajectory.LIMIT_TOLERANCE):
+                raise SimulatorError(-69)
+            if reached[0, index] < positioner.travel[0] or reached[1, index] > positioner.travel[1]:
+                raise SimulatorError(-35)
+            results.append([file_name, reached[0, index], reached[1, index], velocities[:, index].max(),
+                            accelerations[:, index].max()])
+        for positioner, result in zip(group.positioners, results):
+            positioner.pvt_verification = result
+
+    def _api_MultipleAxesPVTVerificationResultGet(self, session, name):
+        positioner = self._positioner(name)
+        if positioner.pvt_verification is None:
+            raise SimulatorError(-22)
+        return [positioner.pvt_verification[0]] + [float(value) for value in positioner.pvt_verification[1:]]
+
+
+class LocalFTP:
+    """Stand-in of ftplib.FTP serving the files of a local directory, the files_root of a simulator
+
+    Give ``functools.partial(LocalFTP, simulator.files_root)`` as the ftp_factory of XPSFileStore.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def connect(self, host, port, timeout):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def retrbinary(self, command, callback, blocksize=8192):
+        with open(self.root / command.split(" ", 1)[1].lstrip("/"), "rb") as file:
+            while block := file.read(blocksize):
+                callback(block)
+
+    def storbinary(self, command, file, blocksize=8192):
+        path = self.root / command.split(" ", 1)[1].lstrip("/")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as output:
+            shutil.copyfileobj(file, output, blocksize)
+
+    def quit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def main(port: int = 5001, *positioners: str):
+    """Serves a simulated XPS until interrupted, positioners given as Group.Positioner"""
+    groups: Dict[str, List[str]] = {}
+    for name in positioners or ("Group1.Pos",):
+        group, _, positioner = name.partition(".")
+        groups.setdefault(group, []).append(positioner)
+    with XPSSimulator(groups, host="0.0.0.0", port=port) as simulator:
+        print(f"XPS simulator listening on port {simulator.port} with {groups}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main(*(int(arg) if index == 0 else arg for index, arg in enumerate(sys.argv[1:])))
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Startup of the groups of an XPS controller.
+
+Homing a group takes tens of seconds and the groups of a controller are independent, so the groups
+listed in a bring-up are initialized and homed concurrently, each on its own socket of the connection
+pool. The results are kept in a registry per controller, shared by the SimpleXPS objects: a SimpleXPS
+whose group is being brought up waits for it instead of running its own startup sequence.
+"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, NamedTuple, Optional, Sequence, Tuple
+
+from .xps_codec import XPSError
+from .xps_pool import XPSConnectionPool
+
+# GroupStatusGet codes
+READY_STATES = range(10, 19)
+NOT_REFERENCED_STATE = 42
+
+
+def start_group(query: Callable, group: str, fast_startup: bool = True,
+                home: Optional[Callable[[], None]] = None) -> str:
+    """
+    Brings a group to the READY state
+
+    Parameters
+    ----------
+    query: callable
+        query(api_name, *arguments) calls an API of the XPS and returns its values, raising XPSError on errors
+    group: str
+        name of the group, ex: "Group1"
+    fast_startup: bool
+        if True, a group already READY is left untouched and a NOT REFERENCED group is only homed. If False,
+        the group is always killed, initialized and homed
+    home: callable or None
+        homes the group, defaults to GroupHomeSearch through query
+
+    Returns
+    -------
+    str: the path taken, "reused", "homed" or "initialized"
+    """
+    if home is None:
+        def home():
+            query("GroupHomeSearch", group)
+
+    status = None
+    if fast_startup:
+        [status] = query("GroupStatusGet", group)
+    if status in READY_STATES:
+        # already initialized and homed, the group is left untouched
+        return "reused"
+    if status == NOT_REFERENCED_STATE:
+        home()
+        return "homed"
+    # Group kill to be sure
+    query("GroupKill", group)
+    # Initialize
+    query("GroupInitialize", group)
+    # Home search
+    home()
+    return "initialized"
+
+
+class GroupStartup(NamedTuple):
+    """Result of the startup of a group"""
+    group: str
+    path: str  # "reused", "homed", "initialized", or "failed"
+    duration: float  # s
+    error: str = ""
+
+    @property
+    def ready(self) -> bool:
+        return not self.error
+
+
+class ControllerStartup:
+    """
+    Concurrent startup of the groups of one XPS controller
+
+    Use :meth:`get` to obtain the startup registry of a controller, shared by all its users.
+
+    Example
+    -------
+    >>> startup = ControllerStartup.get("192.168.0.254", 5001)
+    >>> startup.bring_up(["Group1", "Group2", "Group3"])
+    >>> startup.wait_all()
+    >>> print(startup.summary())
+    """
+
+    _registry: Dict[Tuple[str, int], "ControllerStartup"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, ip: str, port: int):
+        self.ip = ip
+        self.port = port
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+
+    @classmethod
+    def get(cls, ip: str, port: int) -> "ControllerStartup":
+        """Returns the startup registry of the controller at ip:port, creating it if needed"""
+        with cls._registry_lock:
+            startup = cls._registry.get((ip, port))
+            if startup is None:
+                startup = cls(ip, port)
+                cls._registry[(ip, port)] = startup
+        return startup
+
+    def bring_up(self, groups: Sequence[str], fast_startup: bool = True, pool_size: int = 0,
+                 driver: Optional[type] = None) -> Dict[str, Future]:
+        """
+        Starts the groups concurrently, each one on its own socket of the controller pool
+
+        Groups whose startup is already running or succeeded are not started again.
+
+        Parameters
+        ----------
+        groups: sequence of str
+            names of the groups
+        fast_startup: bool
+            see start_group
+        pool_size: int
+            minimum size of the connection pool, defaults to one socket per started group
+        driver: type or None
+            driver of the pool, see XPSConnectionPool.acquire
+
+        Returns
+        -------
+        dict: the Future of the GroupStartup of each group
+        """
+        with self._lock:
+            started = [group for group in groups if group not in self._futures
+                       or (self._futures[group].done() and not self._futures[group].result().ready)]
+            for group in started:
+                self._futures[group] = Future()
+            futures = {group: self._futures[group] for group in groups}
+        if not started:
+            return futures
+
+        try:
+            pool = XPSConnectionPool.acquire(self.ip, self.port, max(pool_size, len(started)), driver=driver)
+        except XPSError as e:
+            # the controller is connected with another driver
+            for group in started:
+                self._futures[group].set_running_or_notify_cancel()
+                self._futures[group].set_result(GroupStartup(group, "failed", 0., f"{e}"))
+            return futures
+        executor = ThreadPoolExecutor(max_workers=len(started), thread_name_prefix="xps_startup")
+        for group in started:
+            executor.submit(self._start, pool, group, fast_startup, self._futures[group])
+        executor.shutdown(wait=False)
+        threading.Thread(target=self._release_when_done, args=(pool, [futures[group] for group in started]),
+                         daemon=True).start()
+        return futures
+
+    @staticmethod
+    def _start(pool: XPSConnectionPool, group: str, fast_startup: bool, future: Future):
+        def query(api_name, *arguments):
+            with pool.socket() as socket_id:
+                error_code, *values = getattr(pool.xps, api_name)(socket_id, *arguments)
+                if error_code in (-2, -108):
+                    pool.invalidate(socket_id)
+            if error_code != 0:
+                raise XPSError(f"{api_name}({group}) : ERROR {error_code}")
+            return values
+
+        future.set_running_or_notify_cancel()
+        start = time.perf_counter()
+        try:
+            path = start_group(query, group, fast_startup)
+        except Exception as e:
+            # any error, ex: OSError of the connection, completes the future so that no user waits forever
+            future.set_result(GroupStartup(group, "failed", time.perf_counter() - start, f"{e}"))
+        else:
+            future.set_result(GroupStartup(group, path, time.perf_counter() - start))
+
+    @staticmethod
+    def _release_when_done(pool: XPSConnectionPool, futures):
+        wait(futures)
+        pool.release()
+
+    def record(self, result: GroupStartup):
+        """Records the startup of a group run outside of bring_up, ex: by a SimpleXPS"""
+        future = Future()
+        future.set_result(result)
+        with self._lock:
+            self._futures[result.group] = future
+
+    def pending(self, group: str) -> Optional[Future]:
+        """Returns the Future of the startup of the group if it is running, else None"""
+        with self._lock:
+            future = self._futures.get(group)
+        return None if future is None or future.done() else future
+
+    def wait_all(self, timeout: Optional[float] = None) -> Dict[str, GroupStartup]:
+        """Waits for all the started groups and returns their results"""
+        with self._lock:
+            futures = dict(self._futures)
+        wait(futures.values(), timeout)
+        return self.status()
+
+    def status(self) -> Dict[str, Optional[GroupStartup]]:
+        """Result of the startup of each group, None for the groups still starting"""
+        with self._lock:
+            futures = dict(self._futures)
+        return {group: future.result() if future.done() else None for group, future in futures.items()}
+
+    @property
+    def ready(self) -> bool:
+        """True once every started group is READY"""
+        return all(result is not None and result.ready for result in self.status().values())
+
+    def summary(self) -> str:
+        """One line combined readiness status, ex: Group1 reused 0.0 s, Group2 homed 21.3 s, Group3 starting"""
+        items = []
+        for group, result in self.status().items():
+            if result is None:
+                items.append(f"{group} starting")
+            elif result.ready:
+                items.append(f"{group} {result.path} {result.duration:.1f} s")
+            else:
+                items.append(f"{group} failed: {result.error}")
+        return ", ".join(items)
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+Latency and throughput statistics of the XPS API calls.
+
+When enabled on an XPS driver, each call records its send time (writing the command), wait time
+(from the command sent to the complete reply, i.e. network and controller), parse time (splitting and
+converting the reply), the bytes exchanged and the error code, per API name. Durations go into
+log-linear histograms in the manner of HdrHistogram: a fixed number of sub-buckets per power of two
+keeps a constant relative precision from nanoseconds to minutes with a small fixed memory, and a
+record is a couple of integer operations.
+"""
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+from pymodaq.utils.logger import set_logger, get_module_name
+
+logger = set_logger(get_module_name(__file__), add_to_console=False)
+
+
+class LogHistogram:
+    """
+    Histogram of positive integer values (ex: durations in ns) with a relative precision of
+    1 / 2**sub_bucket_bits
+
+    Parameters
+    ----------
+    sub_bucket_bits: int
+        log2 of the number of buckets per power of two, 4 gives a precision of 6 %
+    """
+
+    MAX_EXPONENT = 64
+
+    def __init__(self, sub_bucket_bits: int = 4):
+        self.sub_bucket_bits = sub_bucket_bits
+        self._sub_buckets = 1 << sub_bucket_bits
+        self.counts = [0] * (self._sub_buckets * (self.MAX_EXPONENT - sub_bucket_bits + 1))
+        self.total = 0
+        self.sum = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        # values below 2 * sub_buckets have their own bucket, then sub_buckets buckets per power of two
+        shift = value.bit_length() - self.sub_bucket_bits - 1
+        if shift <= 0:
+            return value
+        return (shift + 1) * self._sub_buckets + (value >> shift) - self._sub_buckets
+
+    def _lower_bound(self, index: int) -> int:
+        if index < 2 * self._sub_buckets:
+            return index
+        shift, sub_bucket = divmod(index, self._sub_buckets)
+        return (sub_bucket + self._sub_buckets) << (shift - 1)
+
+    def record(self, value: int):
+        value = max(int(value), 0)
+        self.counts[self._index(value)] += 1
+        self.total += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        self.min = value if self.min is None else min(self.min, value)
+
+    def percentile(self, percent: float) -> int:
+        """Returns the lower bound of the bucket holding the given percentile, 0 if empty"""
+        if self.total == 0:
+            return 0
+        rank = max(1, int(round(percent / 100 * self.total)))
+        cumulated = 0
+        for index, count in enumerate(self.counts):
+            cumulated += count
+            if cumulated >= rank:
+                return min(self._lower_bound(index), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.total if self.total else 0.
+
+    def summary(self, percentiles: Sequence[float] = (50, 90, 99, 99.9)) -> dict:
+        """Count, extremes, mean and percentiles of the recorded values"""
+        summary = {"count": self.total, "min": self.min or 0, "mean": self.mean, "max": self.max}
+        summary.update({f"p{percent:g}": self.percentile(percent) for percent in percentiles})
+        return summary
+
+    def merge(self, other: "LogHistogram"):
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.total += other.total
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+
+
+class ApiStats:
+    """Statistics of one XPS API"""
+
+    PHASES = ("send", "wait", "parse")
+
+    def __init__(self):
+        self.calls = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.errors: Dict[int, int] = {}
+        self.histograms = {phase: LogHistogram() for phase in self.PHASES}
+
+    def snapshot(self) -> dict:
+        return {
+            "calls": self.calls,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "errors": dict(self.errors),
+            **{f"{phase}_ns": self.histograms[phase].summary() for phase in self.PHASES},
+        }
+
+
+class XPSStats:
+    """
+    Statistics of the calls made through an XPS driver, see XPS.EnableStatistics
+
+    Example
+    -------
+    >>> stats = simple_xps.enable_statistics(log_interval=10.)
+    >>> ...
+    >>> stats.snapshot()["GroupPositionCurrentGet"]["wait_ns"]["p99"]
+    >>> stats.export("xps_stats.json")
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._apis: Dict[str, ApiStats] = {}
+        self._logging_stop: Optional[threading.Event] = None
+
+    def record(self, api_name: str, send_ns: int, wait_ns: int, bytes_out: int, bytes_in: int,
+               error: int):
+        """Records a call, its parse time is added by :meth:`record_parse`"""
+        with self._lock:
+            api = self._apis.get(api_name)
+            if api is None:
+                api = self._apis[api_name] = ApiStats()
+            api.calls += 1
+            api.bytes_out += bytes_out
+            api.bytes_in += bytes_in
+            if error != 0:
+                api.errors[error] = api.errors.get(error, 0) + 1
+            api.histograms["send"].record(send_ns)
+            api.histograms["wait"].record(wait_ns)
+
+    def record_parse(self, api_name: str, parse_ns: int):
+        with self._lock:
+            api = self._apis.get(api_name)
+            if api is not None:
+                api.histograms["parse"].record(parse_ns)
+
+    def reset(self):
+        with self._lock:
+            self._apis.clear()
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Returns the statistics of each API: calls, bytes, error counts and the summary of the send,
+        wait and parse histograms in ns"""
+        with self._lock:
+            return {api_name: api.snapshot() for api_name, api in self._apis.items()}
+
+    def totals(self) -> dict:
+        """Statistics of all the APIs together"""
+        with self._lock:
+            total = ApiStats()
+            for api in self._apis.values():
+                total.calls += api.calls
+                total.bytes_out += api.bytes_out
+                total.bytes_in += api.bytes_in
+                for error, count in api.errors.items():
+                    total.errors[error] = total.errors.get(error, 0) + count
+                for phase in ApiStats.PHASES:
+                    total.histograms[phase].merge(api.histograms[phase])
+        return total.snapshot()
+
+    def export(self, path):
+        """Writes the snapshot and the totals into a json file"""
+        Path(path).write_text(json.dumps({"totals": self.totals(), "apis": self.snapshot()}, indent=2))
+
+    def log_line(self) -> str:
+        """One line summary: number of calls, bytes and median/p99 durations of all the APIs"""
+        totals = self.totals()
+        wait, parse = totals["wait_ns"], totals["parse_ns"]
+        return (
+            f"XPS: {totals['calls']} calls, {totals['bytes_out']} B out, {totals['bytes_in']} B in, "
+            f"{sum(totals['errors'].values())} errors, wait p50 {wait['p50'] / 1e3:.0f} us "
+            f"p99 {wait['p99'] / 1e3:.0f} us, parse p50 {parse['p50'] / 1e3:.1f} us"
+        )
+
+    def start_logging(self, interval: float):
+        """Logs log_line every interval seconds from a daemon thread"""
+        self.stop_logging()
+        stop = self._logging_stop = threading.Event()
+
+        def log():
+            while not stop.wait(interval):
+                logger.info(self.log_line())
+        threading.Thread(target=log, name="xps_stats", daemon=True).start()
+
+    def stop_logging(self):
+        if self._logging_stop is not None:
+            self._logging_stop.set()
+            self._logging_stop = None
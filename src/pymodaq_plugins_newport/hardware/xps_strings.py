@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Error and status strings of the XPS, decoded locally.
+
+The controller lists all its error codes, group states, positioner errors and hardware status bits with
+ErrorListGet, GroupStatusListGet, PositionerErrorListGet and PositionerHardwareStatusListGet. These
+lists only depend on the firmware, so they are requested once, in one batch, and saved in a json file
+named after the firmware version (FirmwareVersionGet). Decoding an error code or a status is then a
+dictionary lookup instead of an ErrorStringGet or GroupStatusStringGet round trip, and later
+connections to a controller with the same firmware only read the file.
+"""
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+LIST_APIS = {
+    "errors": "ErrorListGet",
+    "group_states": "GroupStatusListGet",
+    "positioner_errors": "PositionerErrorListGet",
+    "hardware_status": "PositionerHardwareStatusListGet",
+}
+
+# entries of the lists, ex: "-17 : Parameter out of range or incorrect" or "0x00000002 : Warning ..."
+_ENTRY = re.compile(r"^\s*(-?(?:0x[0-9a-fA-F]+|\d+))\s*:\s*(.+?)\s*$")
+
+
+def parse_string_list(text: str) -> Dict[int, str]:
+    """Parses the reply of a *ListGet API into a dictionary {code: description}
+
+    The entries are separated by semicolons or line feeds, entries that are not in the
+    ``code : description`` format are ignored.
+    """
+    strings = {}
+    for entry in re.split(r"[;\n]", text):
+        match = _ENTRY.match(entry)
+        if match is not None:
+            strings[int(match.group(1), 0)] = match.group(2)
+    return strings
+
+
+class XPSStrings:
+    """
+    Error and status strings of one XPS controller
+
+    Use :meth:`get` to obtain the strings of a controller, shared by all its users, and :meth:`load`
+    to fill them.
+
+    Example
+    -------
+    >>> strings = XPSStrings.get("192.168.0.254", 5001)
+    >>> strings.load(simple_xps.query, Path("~/.pymodaq/newport").expanduser())
+    >>> strings.error_string(-17)
+    'Parameter out of range or incorrect'
+    """
+
+    _registry: Dict[Tuple[str, int], "XPSStrings"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, ip: str, port: int):
+        self.ip = ip
+        self.port = port
+        self.firmware_version = ""
+        self.tables: Dict[str, Dict[int, str]] = {name: {} for name in LIST_APIS}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls, ip: str, port: int) -> "XPSStrings":
+        """Returns the strings of the controller at ip:port, creating them if needed"""
+        with cls._registry_lock:
+            strings = cls._registry.get((ip, port))
+            if strings is None:
+                strings = cls(ip, port)
+                cls._registry[(ip, port)] = strings
+        return strings
+
+    @staticmethod
+    def cache_path(directory: Path, firmware_version: str) -> Path:
+        """File of the strings of a firmware version"""
+        return Path(directory) / f"xps_strings_{re.sub(r'[^0-9A-Za-z.]+', '_', firmware_version)}.json"
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self.firmware_version)
+
+    def load(self, query: Callable, directory: Optional[Path] = None, batch: Optional[Callable] = None) -> str:
+        """
+        Fills the strings for the firmware of the controller, from the cache file if it exists, else from
+        the controller
+
+        Parameters
+        ----------
+        query: callable
+            query(api_name, *arguments) calls an API of the XPS and returns its values, raising XPSError on errors
+        directory: Path or None
+            directory of the cache files, None to neither read nor write them
+        batch: callable or None
+            returns an empty queue of API calls sent in one round trip, ex: SimpleXPS.batch. If None, the lists
+            are requested one by one with query
+
+        Returns
+        -------
+        str: "cached" if the strings were already loaded or read from the file, else "queried"
+        """
+        [firmware_version] = query("FirmwareVersionGet")
+        with self._lock:
+            if firmware_version == self.firmware_version:
+                return "cached"
+            path = None if directory is None else self.cache_path(directory, firmware_version)
+            if path is not None and path.is_file():
+                try:
+                    tables = json.loads(path.read_text())
+                    self._set(firmware_version, {name: {int(code): string for code, string in tables[name].items()}
+                                                 for name in LIST_APIS})
+                    return "cached"
+                except (OSError, ValueError, KeyError, AttributeError):
+                    # corrupted file, replaced below
+                    pass
+
+            if batch is not None:
+                calls = batch()
+                for api_name in LIST_APIS.values():
+                    calls.add(api_name)
+                replies = calls.execute()
+            else:
+                replies = [query(api_name) for api_name in LIST_APIS.values()]
+            self._set(firmware_version, {name: parse_string_list(text)
+                                         for name, [text] in zip(LIST_APIS, replies)})
+            if path is not None:
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_text(json.dumps(self.tables, indent=1))
+                except OSError:
+                    pass
+        return "queried"
+
+    def _set(self, firmware_version: str, tables: Dict[str, Dict[int, str]]):
+        self.tables = tables
+        self.firmware_version = firmware_version
+
+    def error_string(self, error_code: int) -> Optional[str]:
+        """Description of an API error code, None if unknown"""
+        return self.tables["errors"].get(error_code)
+
+    def add_error_string(self, error_code: int, error_string: str):
+        """Adds the description of an error code missing from ErrorListGet, ex: read with ErrorStringGet"""
+        self.tables["errors"][error_code] = error_string
+
+    def group_status_string(self, status: int) -> Optional[str]:
+        """Description of a GroupStatusGet code, None if unknown"""
+        return self.tables["group_states"].get(status)
+
+    @staticmethod
+    def _bits(table: Dict[int, str], mask: int) -> List[str]:
+        return [string for bit, string in sorted(table.items()) if bit > 0 and mask & bit == bit]
+
+    def positioner_errors(self, mask: int) -> List[str]:
+        """Descriptions of the bits set in a PositionerErrorGet mask"""
+        return self._bits(self.tables["positioner_errors"], mask)
+
+    def hardware_status(self, mask: int) -> List[str]:
+        """Descriptions of the bits set in a PositionerHardwareStatusGet mask"""
+        return self._bits(self.tables["hardware_status"], mask)
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+Step scans executed on the XPS by a TCL script.
+
+The step loop (move, dwell, read) runs in a TCL task of the controller, so a scan point costs no round
+trip to the host. The script is rendered from the scan description, uploaded through the FTP service of
+the XPS and started with TCLScriptExecute. It writes its results by batches of points into a ring of
+string global arrays and publishes its progress in double global arrays; the host acknowledges the
+batches it read, so that the script never overwrites a batch still unread.
+
+Global arrays used, from the first string slot S and the first double slot D:
+
+* GlobalArray S ... S + nb_slots - 1: ring of result batches, values separated by spaces
+* GlobalArray S + nb_slots: error message of the script
+* DoubleGlobalArray D: number of batches written, D + 1: status (0 running, 1 done, -1 error),
+  D + 2: number of batches read by the host
+"""
+import time
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+from numpy.lib.recfunctions import unstructured_to_structured
+
+from .xps_codec import XPSError
+from .xps_files import XPSFileStore
+
+TCL_SCAN_TEMPLATE = """\
+# Step scan rendered by pymodaq_plugins_newport
+set group {group}
+set nb_points {nb_points}
+set dwell_ms {dwell_ms}
+set batch_size {batch_size}
+set nb_slots {nb_slots}
+set string_slot {string_slot}
+set progress_slot {progress_slot}
+set status_slot {status_slot}
+set ack_slot {ack_slot}
+set points {{
+{points}
+}}
+
+proc Fail {{socketID message}} {{
+    global string_slot nb_slots status_slot
+    GlobalArraySet $socketID [expr {{$string_slot + $nb_slots}}] $message
+    DoubleGlobalArraySet $socketID $status_slot -1
+    TCP_CloseSocket $socketID
+    exit
+}}
+
+if {{[catch "OpenConnection 60 socketID"]}} {{
+    exit
+}}
+set batch ""
+set nb_done 0
+set nb_batches 0
+foreach point $points {{
+    if {{[catch {{eval GroupMoveAbsolute $socketID $group $point}} error]}} {{
+        Fail $socketID "GroupMoveAbsolute $point: $error"
+    }}
+    if {{$dwell_ms > 0}} {{
+        after $dwell_ms
+    }}
+{reads}
+    append batch "{line} "
+    incr nb_done
+    if {{$nb_done % $batch_size == 0 || $nb_done == $nb_points}} {{
+        DoubleGlobalArrayGet $socketID $ack_slot acked
+        while {{$nb_batches - $acked >= $nb_slots}} {{
+            after 1
+            DoubleGlobalArrayGet $socketID $ack_slot acked
+        }}
+        GlobalArraySet $socketID [expr {{$string_slot + $nb_batches % $nb_slots}}] $batch
+        set batch ""
+        incr nb_batches
+        DoubleGlobalArraySet $socketID $progress_slot $nb_batches
+    }}
+}}
+DoubleGlobalArraySet $socketID $status_slot 1
+TCP_CloseSocket $socketID
+"""
+
+TCL_READ_TEMPLATE = """\
+    if {{[catch {{{api} $socketID {name} {variables}}} error]}} {{
+        Fail $socketID "{api} {name}: $error"
+    }}"""
+
+
+class TCLScan:
+    """
+    Step scan of a group executed by a TCL task of the XPS
+
+    At each point, the group is moved with GroupMoveAbsolute, waits dwell seconds, then the current
+    positions of its positionners and the analog inputs are recorded.
+
+    Parameters
+    ----------
+    controller: SimpleXPS
+        connection to the XPS, each request borrows a socket of its pool
+    group: str
+        name of the group, ex: "Group1"
+    positioners: sequence of str
+        names (without the group) of all the positionners of the group, in the order of the points columns
+    points: ndarray
+        positions of the scan points, shape (nb_points,) or (nb_points, nb_positioners)
+    file_store: XPSFileStore
+        FTP access used to upload the script
+    analog_inputs: sequence of str
+        analog inputs read at each point with GPIOAnalogGet, ex: ["GPIO2.ADC1"]
+    dwell: float
+        time in seconds waited at each point before the readings
+    batch_size: int
+        number of points per result batch
+    nb_slots: int
+        number of string global arrays holding the batches not read yet
+    string_slot, double_slot: int
+        first string and double global arrays used by the scan
+    poll_interval: float
+        time in seconds between two progress requests when no new batch is available
+
+    Example
+    -------
+    >>> x, y = np.meshgrid(np.linspace(0, 1, 101), np.linspace(0, 1, 101))
+    >>> scan = controller.tcl_scan(np.column_stack((x.ravel(), y.ravel())), ["X", "Y"], analog_inputs=["GPIO2.ADC1"])
+    >>> scan.start()
+    >>> for batch in scan.stream():
+    ...     signal = batch["GPIO2.ADC1"]
+    """
+
+    def __init__(
+        self,
+        controller,
+        group: str,
+        positioners: Sequence[str],
+        points,
+        file_store: XPSFileStore,
+        analog_inputs: Sequence[str] = (),
+        dwell: float = 0.0,
+        batch_size: int = 100,
+        nb_slots: int = 16,
+        string_slot: int = 0,
+        double_slot: int = 0,
+        poll_interval: float = 0.05,
+        file_name: str = "pymodaq_scan.tcl",
+        task_name: str = "pymodaq_scan",
+    ):
+        self._controller = controller
+        self.group = group
+        self.positioners = [f"{group}.{positioner}" for positioner in positioners]
+        self.points = np.asarray(points, dtype=np.float64).reshape((-1, len(self.positioners)))
+        self.file_store = file_store
+        self.analog_inputs = list(analog_inputs)
+        self.dwell = dwell
+        self.batch_size = batch_size
+        self.nb_slots = nb_slots
+        self.string_slot = string_slot
+        self.progress_slot, self.status_slot, self.ack_slot = double_slot, double_slot + 1, double_slot + 2
+        self.poll_interval = poll_interval
+        self.file_name = file_name
+        self.task_name = task_name
+        self.dtype = np.dtype([(name, np.float64) for name in self.positioners + self.analog_inputs])
+        self._nb_read = 0
+
+    @property
+    def nb_points(self) -> int:
+        return self.points.shape[0]
+
+    @property
+    def nb_batches(self) -> int:
+        return -(-self.nb_points // self.batch_size)
+
+    def render(self) -> str:
+        """Returns the TCL script of the scan"""
+        positions = [f"p{index}" for index in range(len(self.positioners))]
+        analogs = [f"a{index}" for index in range(len(self.analog_inputs))]
+        reads = [TCL_READ_TEMPLATE.format(api="GroupPositionCurrentGet", name="$group",
+                                          variables=" ".join(positions))]
+        reads += [TCL_READ_TEMPLATE.format(api="GPIOAnalogGet", name=name, variables=variable)
+                  for name, variable in zip(self.analog_inputs, analogs)]
+        return TCL_SCAN_TEMPLATE.format(
+            group=self.group,
+            nb_points=self.nb_points,
+            dwell_ms=int(round(self.dwell * 1e3)),
+            batch_size=self.batch_size,
+            nb_slots=self.nb_slots,
+            string_slot=self.string_slot,
+            progress_slot=self.progress_slot,
+            status_slot=self.status_slot,
+            ack_slot=self.ack_slot,
+            points="\n".join("{" + " ".join(f"{value:.12g}" for value in point) + "}"
+                             for point in self.points),
+            reads="\n".join(reads),
+            line=" ".join(f"${variable}" for variable in positions + analogs),
+        )
+
+    def start(self):
+        """Uploads the script, resets the global arrays of the scan and starts the TCL task"""
+        self.file_store.upload(f"{XPSFileStore.SCRIPTS_DIRECTORY}/{self.file_name}", self.render().encode())
+        batch = self._controller.batch()
+        for slot in (self.progress_slot, self.status_slot, self.ack_slot):
+            batch.add("DoubleGlobalArraySet", slot, 0.)
+        batch.add("TCLScriptExecute", self.file_name, self.task_name, "0")
+        batch.execute()
+        self._nb_read = 0
+
+    def kill(self):
+        """Stops the TCL task, the group stops at the end of the current move"""
+        self._controller.query("TCLScriptKill", self.task_name)
+
+    def progress(self):
+        """
+        Returns
+        -------
+        tuple: number of batches written by the script and its status (0 running, 1 done, -1 error)
+        """
+        batch = self._controller.batch()
+        batch.add("DoubleGlobalArrayGet", self.progress_slot)
+        batch.add("DoubleGlobalArrayGet", self.status_slot)
+        [[nb_written], [status]] = batch.execute()
+        return int(nb_written), int(status)
+
+    def stream(self, timeout: Optional[float] = None) -> Iterator[np.ndarray]:
+        """
+        Yields the results by batches until the end of the scan
+
+        Each poll is a single round trip reading the progress, and each read fetches all the available
+        batches and acknowledges them in a single round trip as well.
+
+        Parameters
+        ----------
+        timeout: float or None
+            maximum time in seconds without any new batch, None waits forever
+
+        Yields
+        ------
+        ndarray: structured arrays of batch_size points (less for the last one), with one field per
+            positionner (current position) and per analog input
+        """
+        last_progress = time.perf_counter()
+        while self._nb_read < self.nb_batches:
+            nb_written, status = self.progress()
+            if status < 0:
+                [message] = self._controller.query("GlobalArrayGet", self.string_slot + self.nb_slots)
+                raise XPSError(f"TCL scan failed: {message}")
+            if nb_written <= self._nb_read:
+                if timeout is not None and time.perf_counter() - last_progress > timeout:
+                    raise XPSError(f"TCL scan stalled after {self._nb_read} of {self.nb_batches} batches")
+                time.sleep(self.poll_interval)
+                continue
+            last_progress = time.perf_counter()
+            batch = self._controller.batch()
+            for index in range(self._nb_read, nb_written):
+                batch.add("GlobalArrayGet", self.string_slot + index % self.nb_slots)
+            batch.add("DoubleGlobalArraySet", self.ack_slot, float(nb_written))
+            texts = [text for [text] in batch.execute()[:-1]]
+            nb_points = min(nb_written * self.batch_size, self.nb_points) - self._nb_read * self.batch_size
+            self._nb_read = nb_written
+            # np.fromstring raises ValueError at the first value that is not a number, or stops there with
+            # older numpy versions: malformed batches then have missing values
+            try:
+                values = np.fromstring(" ".join(texts), dtype=np.float64, sep=" ")
+            except ValueError as e:
+                raise XPSError(f"Malformed TCL scan batch: {e}") from None
+            if values.size != nb_points * len(self.dtype):
+                raise XPSError(
+                    f"TCL scan batches of {values.size} values instead of {nb_points} points of "
+                    f"{len(self.dtype)} values"
+                )
+            yield unstructured_to_structured(values.reshape((nb_points, len(self.dtype))), dtype=self.dtype)
+
+    def read_all(self, timeout: Optional[float] = None) -> np.ndarray:
+        """Waits for the end of the scan and returns all its results in one structured array"""
+        batches = list(self.stream(timeout))
+        return np.concatenate(batches) if batches else np.empty(0, dtype=self.dtype)
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+Health history of an XPS controller.
+
+A background thread samples the CPU temperature and fan speed, the motion kernel load, the servo loop
+period and usage, and the following errors of the positioners of a group. Each sample is a single
+batch of requests sent on a socket reserved in the connection pool, so the sampling never delays the
+motion commands. The samples go into a fixed size ring buffer (a structured array), read as a whole
+with :meth:`TelemetrySampler.samples` or exported to a file.
+"""
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
+
+from .xps_codec import XPSError, output_types
+
+CONTROLLER_FIELDS = (
+    "cpu_temperature",  # °C
+    "fan_speed",  # rpm
+    "total_load",  # ratios of the motion kernel time
+    "corrector_load",
+    "profiler_load",
+    "servitudes_load",
+    "rt_period",  # s, period of the servo loop
+    "rt_usage",  # ratio of the servo period used by the calculations
+)
+
+
+class TelemetrySampler:
+    """
+    Periodic sampling of the controller health into a ring buffer
+
+    Parameters
+    ----------
+    controller: SimpleXPS
+        connection to the XPS
+    name: str
+        group or positioner whose following errors are sampled, ex: "Group1" or "Group1.Pos"
+    positioners: sequence of str
+        names (without the group) of the positioners of the group, or of the positioner
+    interval: float
+        time in seconds between two samples
+    capacity: int
+        number of samples kept, the oldest ones are overwritten
+
+    Example
+    -------
+    >>> telemetry = simple_xps.start_telemetry(interval=0.5, capacity=7200)  # last hour
+    >>> ...
+    >>> history = telemetry.samples()
+    >>> history["time"][history["cpu_temperature"] > 60]
+    >>> telemetry.export("xps_health.csv")
+    """
+
+    def __init__(self, controller, name: str, positioners: Sequence[str], interval: float = 1.0,
+                 capacity: int = 3600):
+        self._controller = controller
+        self.name = name
+        self.positioners = list(positioners)
+        self.interval = interval
+        self.dtype = np.dtype(
+            [("time", np.float64)]
+            + [(name, np.float64) for name in CONTROLLER_FIELDS]
+            + [(f"following_error_{positioner}", np.float64) for positioner in self.positioners]
+        )
+        self._buffer = np.full(capacity, np.nan, dtype=self.dtype)
+        self._nb_samples = 0
+        self._lock = threading.Lock()
+        self._socket_id = -1
+        self._stop: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self.nb_errors = 0
+        self.last_error = ""
+
+    @property
+    def capacity(self) -> int:
+        return self._buffer.size
+
+    @property
+    def nb_samples(self) -> int:
+        """Number of samples taken since the start, including the overwritten ones"""
+        return self._nb_samples
+
+    def __len__(self):
+        return min(self._nb_samples, self.capacity)
+
+    @property
+    def running(self) -> bool:
+        return self._stop is not None
+
+    def start(self):
+        """Starts sampling every interval seconds from a daemon thread"""
+        self.stop()
+        stop = self._stop = threading.Event()
+
+        def run():
+            next_time = time.perf_counter()
+            while not stop.is_set():
+                self.sample()
+                # fixed rate, a late sample doesn't shift the following ones
+                next_time = max(next_time + self.interval, time.perf_counter())
+                stop.wait(next_time - time.perf_counter())
+        self._thread = threading.Thread(target=run, name="xps_telemetry", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        """Stops sampling and closes the socket of the sampler, the samples are kept"""
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+            self._thread.join(timeout)
+            self._thread = None
+        self._release()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _socket(self) -> int:
+        pool = self._controller.pool
+        if self._socket_id == -1 or not pool.is_valid(self._socket_id):
+            self._release()
+            self._socket_id = pool.reserve()
+        return self._socket_id
+
+    def _release(self):
+        if self._socket_id != -1:
+            self._controller.pool.unreserve(self._socket_id)
+            self._socket_id = -1
+
+    def sample(self) -> np.ndarray:
+        """
+        Takes one sample and stores it in the ring buffer
+
+        The values of a request that failed are NaN, the failure is counted in nb_errors.
+
+        Returns
+        -------
+        ndarray: the sample, a structured scalar
+        """
+        calls = [
+            ("CPUTemperatureAndFanSpeedGet", []),
+            ("ControllerMotionKernelTimeLoadGet", []),
+            ("ControllerRTTimeGet", []),
+            ("GroupCurrentFollowingErrorGet", [self.name], len(self.positioners)),
+        ]
+        row = np.full((), np.nan, dtype=self.dtype)
+        row["time"] = time.time()
+        try:
+            pool = self._controller.pool
+            socket_id = self._socket()
+            with pool.reserved(socket_id):
+                replies = pool.xps.Batch(socket_id, calls)
+            if replies is None:
+                raise XPSError("telemetry socket closed")
+        except XPSError as e:
+            self.nb_errors += 1
+            self.last_error = f"{e}"
+        else:
+            values = []
+            for (api_name, _, *nb_element), (error_code, *outputs) in zip(calls, replies):
+                if error_code in (-2, -108):
+                    pool.invalidate(socket_id)
+                if error_code != 0:
+                    self.nb_errors += 1
+                    self.last_error = f"{api_name} : ERROR {error_code}"
+                    outputs = [np.nan] * len(output_types(api_name, *nb_element))
+                values.extend(outputs)
+            for name, value in zip(self.dtype.names[1:], values):
+                row[name] = value
+        with self._lock:
+            self._buffer[self._nb_samples % self.capacity] = row
+            self._nb_samples += 1
+        return row
+
+    def samples(self, last: Optional[int] = None) -> np.ndarray:
+        """
+        Returns a copy of the samples in chronological order
+
+        Parameters
+        ----------
+        last: int or None
+            number of most recent samples returned, all the stored ones if None
+        """
+        with self._lock:
+            nb_stored = len(self)
+            nb = nb_stored if last is None else min(last, nb_stored)
+            indices = np.arange(self._nb_samples - nb, self._nb_samples) % self.capacity
+            return self._buffer[indices]
+
+    def latest(self) -> Optional[np.ndarray]:
+        """Returns the last sample, None if there isn't any"""
+        samples = self.samples(1)
+        return samples[0] if samples.size else None
+
+    def export(self, path):
+        """Writes the samples into a .npy file, or a csv file with a header line for any other suffix"""
+        samples = self.samples()
+        path = Path(path)
+        if path.suffix == ".npy":
+            np.save(path, samples)
+        else:
+            np.savetxt(path, structured_to_unstructured(samples), delimiter=",",
+                       header=",".join(self.dtype.names), comments="",
+                       fmt=["%.6f"] + ["%.9g"] * (len(self.dtype) - 1))
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+PVT (position, velocity, time) trajectories of the XPS, for continuous fly scans.
+
+A PVT file has one line per segment: ``duration, displacement1, velocity1, displacement2, velocity2...``
+where the displacements are relative and the velocities are the ones reached at the end of the segment.
+The XPS interpolates each segment with a cubic polynomial, so the acceleration is linear within a
+segment and its extremes are reached at the segment ends. Trajectories are checked on the host against
+the positioner limits before being uploaded, verified and executed by the controller.
+"""
+from concurrent.futures import Future
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .xps_codec import XPSError
+from .xps_files import XPSFileStore
+
+
+class PVTTrajectory:
+    """
+    Segments of a PVT trajectory
+
+    Parameters
+    ----------
+    durations: ndarray
+        duration of each segment in seconds, shape (nb_segments,)
+    displacements: ndarray
+        displacement of each positioner during each segment, shape (nb_segments, nb_axes)
+    velocities: ndarray
+        velocity of each positioner at the end of each segment, shape (nb_segments, nb_axes)
+    """
+
+    def __init__(self, durations, displacements, velocities):
+        self.durations = np.atleast_1d(np.asarray(durations, dtype=np.float64))
+        self.displacements = np.asarray(displacements, dtype=np.float64).reshape((self.durations.size, -1))
+        self.velocities = np.asarray(velocities, dtype=np.float64).reshape((self.durations.size, -1))
+        if self.displacements.shape != self.velocities.shape:
+            raise XPSError("PVT durations, displacements and velocities have inconsistent shapes")
+        if np.any(self.durations <= 0):
+            raise XPSError("PVT segments must have positive durations")
+
+    @property
+    def nb_segments(self) -> int:
+        return self.durations.size
+
+    @property
+    def nb_axes(self) -> int:
+        return self.displacements.shape[1]
+
+    @classmethod
+    def from_points(cls, times, positions, velocities=None) -> "PVTTrajectory":
+        """
+        Builds the segments joining points of a path
+
+        Parameters
+        ----------
+        times: ndarray
+            increasing times of the points, shape (nb_points,)
+        positions: ndarray
+            positions of the points, shape (nb_points,) or (nb_points, nb_axes). The first point is the
+            position at which the trajectory starts
+        velocities: ndarray or None
+            velocities at the points, same shape as positions. If None, they are estimated by finite
+            differences, with the path starting and ending at rest
+        """
+        times = np.asarray(times, dtype=np.float64)
+        positions = np.asarray(positions, dtype=np.float64).reshape((times.size, -1))
+        if velocities is None:
+            velocities = np.gradient(positions, times, axis=0)
+            velocities[0] = 0.
+            velocities[-1] = 0.
+        velocities = np.asarray(velocities, dtype=np.float64).reshape(positions.shape)
+        return cls(np.diff(times), np.diff(positions, axis=0), velocities[1:])
+
+    @classmethod
+    def constant_velocity_line(cls, length: float, velocity: float, acceleration: float,
+                               nb_axes: int = 1, axis: int = 0) -> "PVTTrajectory":
+        """
+        Builds a raster line: acceleration from rest, constant velocity over `length`, deceleration
+
+        The constant velocity part is the second segment. The run-up and run-down distances are
+        returned by :meth:`run_up_distance`.
+        """
+        ramp_time = abs(velocity) / acceleration
+        durations = [ramp_time, abs(length / velocity), ramp_time]
+        displacements = np.zeros((3, nb_axes))
+        velocities = np.zeros((3, nb_axes))
+        displacements[:, axis] = [velocity * ramp_time / 2, length, velocity * ramp_time / 2]
+        velocities[:, axis] = [velocity, velocity, 0.]
+        return cls(durations, displacements, velocities)
+
+    def run_up_distance(self) -> np.ndarray:
+        """Displacement of each axis during the first segment"""
+        return self.displacements[0].copy()
+
+    def start_velocities(self) -> np.ndarray:
+        """Velocities at the start of each segment, the trajectory starts at rest"""
+        return np.vstack((np.zeros((1, self.nb_axes)), self.velocities[:-1]))
+
+    def kinematics(self):
+        """
+        Extreme velocity and acceleration of each axis over each segment
+
+        Returns
+        -------
+        tuple of ndarray: maximum absolute velocities and accelerations, of shape (nb_segments, nb_axes)
+        """
+        dt = self.durations[:, None]
+        v0 = self.start_velocities()
+        v1 = self.velocities
+        dx = self.displacements
+        # p(t) = v0 t + c t^2 + d t^3 on each segment
+        c = (3 * dx / dt - 2 * v0 - v1) / dt
+        d = (v0 + v1 - 2 * dx / dt) / dt ** 2
+        accelerations = np.maximum(np.abs(2 * c), np.abs(2 * c + 6 * d * dt))
+        velocities = np.maximum(np.abs(v0), np.abs(v1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_extremum = np.where(d != 0, -c / (3 * d), -1.)
+            inside = (t_extremum > 0) & (t_extremum < dt)
+            v_extremum = np.abs(v0 + 2 * c * t_extremum + 3 * d * t_extremum ** 2)
+        velocities = np.where(inside, np.maximum(velocities, v_extremum), velocities)
+        return velocities, accelerations
+
+    def excursion(self) -> np.ndarray:
+        """Minimum and maximum displacement of each axis from the start, shape (2, nb_axes)"""
+        path = np.vstack((np.zeros((1, self.nb_axes)), np.cumsum(self.displacements, axis=0)))
+        return np.vstack((path.min(axis=0), path.max(axis=0)))
+
+    # relative margin of the limits in check, so that a segment computed to reach a limit passes it
+    LIMIT_TOLERANCE = 1e-9
+
+    def check(self, max_velocities, max_accelerations, start_positions=None, travel_limits=None):
+        """
+        Checks the trajectory against the positioner limits, raises XPSError at the first violation
+
+        The velocities and accelerations may exceed the limits by their rounding error, LIMIT_TOLERANCE.
+
+        Parameters
+        ----------
+        max_velocities, max_accelerations: sequence of float
+            one value per axis
+        start_positions: sequence of float or None
+            positions at which the trajectory starts, required to check the travel limits
+        travel_limits: sequence of (float, float) or None
+            minimum and maximum position of each axis
+        """
+        velocities, accelerations = self.kinematics()
+        for name, values, limits in (("velocity", velocities, max_velocities),
+                                     ("acceleration", accelerations, max_accelerations)):
+            limits = np.asarray(limits, dtype=np.float64)
+            segments, axes = np.nonzero(values > limits * (1 + self.LIMIT_TOLERANCE))
+            if segments.size:
+                raise XPSError(
+                    f"PVT segment {segments[0] + 1} exceeds the maximum {name} of axis {axes[0]}: "
+                    f"{values[segments[0], axes[0]]:.6g} > {np.atleast_1d(limits)[axes[0]]:.6g}"
+                )
+        if travel_limits is not None and start_positions is not None:
+            limits = np.asarray(travel_limits, dtype=np.float64).reshape((-1, 2))
+            reached = self.excursion() + np.asarray(start_positions, dtype=np.float64)
+            outside = (reached[0] < limits[:, 0]) | (reached[1] > limits[:, 1])
+            if np.any(outside):
+                axis = int(np.argmax(outside))
+                raise XPSError(f"PVT trajectory leaves the travel range of axis {axis}")
+
+    def to_text(self) -> str:
+        """Content of the PVT file"""
+        columns = np.empty((self.nb_segments, 1 + 2 * self.nb_axes))
+        columns[:, 0] = self.durations
+        columns[:, 1::2] = self.displacements
+        columns[:, 2::2] = self.velocities
+        return "\n".join(", ".join(f"{value:.12g}" for value in row) for row in columns) + "\n"
+
+
+class PVTRunner:
+    """
+    Uploads, verifies and executes PVT trajectories on a group of the XPS
+
+    Parameters
+    ----------
+    controller: SimpleXPS
+        connection to the XPS, whose motion worker executes the trajectories
+    group: str
+        name of the group, ex: "Group1"
+    positioners: sequence of str
+        full names of the positioners of the group, in the order of the PVT file columns
+    file_store: XPSFileStore
+        FTP access used to upload the trajectory files
+    """
+
+    def __init__(self, controller, group: str, positioners: Sequence[str], file_store: XPSFileStore):
+        self._controller = controller
+        self.group = group
+        self.positioners = list(positioners)
+        self.file_store = file_store
+
+    def limits(self):
+        """
+        Returns
+        -------
+        tuple: maximum velocities, maximum accelerations and user travel limits of the positioners
+        """
+        velocities, accelerations, travels = [], [], []
+        for positioner in self.positioners:
+            velocity, acceleration = self._controller.query(
+                "PositionerMaximumVelocityAndAccelerationGet", positioner)
+            velocities.append(velocity)
+            accelerations.append(acceleration)
+            travels.append(self._controller.query("PositionerUserTravelLimitsGet", positioner))
+        return np.array(velocities), np.array(accelerations), np.array(travels)
+
+    def positions(self) -> np.ndarray:
+        return np.array(self._controller.query("GroupPositionCurrentGet", self.group, len(self.positioners)))
+
+    def load(self, trajectory: PVTTrajectory, file_name: str = "pymodaq_pvt.trj") -> List[list]:
+        """
+        Checks the trajectory on the host from the current position, uploads it and has the XPS verify it
+
+        Returns
+        -------
+        list: for each positioner, the result of MultipleAxesPVTVerificationResultGet (file name,
+            minimum and maximum positions, maximum velocity and acceleration)
+        """
+        if trajectory.nb_axes != len(self.positioners):
+            raise XPSError(
+                f"PVT trajectory has {trajectory.nb_axes} axes, the group has {len(self.positioners)}"
+            )
+        max_velocities, max_accelerations, travels = self.limits()
+        trajectory.check(max_velocities, max_accelerations, self.positions(), travels)
+        self.file_store.upload(
+            f"{XPSFileStore.TRAJECTORIES_DIRECTORY}/{file_name}", trajectory.to_text().encode()
+        )
+        self._controller.query("MultipleAxesPVTVerification", self.group, file_name)
+        return [self._controller.query("MultipleAxesPVTVerificationResultGet", positioner)
+                for positioner in self.positioners]
+
+    def set_pulses(self, start_element: int, end_element: int, time_interval: float):
+        """Emits a pulse every time_interval seconds from segment start_element to end_element (1-based)"""
+        self._controller.query(
+            "MultipleAxesPVTPulseOutputSet", self.group, start_element, end_element, time_interval
+        )
+
+    def execute(self, file_name: str = "pymodaq_pvt.trj", repetitions: int = 1, wait: bool = True) -> Future:
+        """Executes a verified trajectory from the motion worker of the controller"""
+        future = self._controller.submit_motion(
+            "MultipleAxesPVTExecution", self.group, file_name, repetitions
+        )
+        if wait:
+            future.result()
+        return future
+
+    def fly_line(self, start, stop, velocity: float, pulse_step: Optional[float] = None,
+                 acceleration: Optional[float] = None, axis: int = 0, wait: bool = True) -> Future:
+        """
+        Runs a raster line: goes to the run-up position, then crosses [start, stop] of one axis at
+        constant velocity, optionally emitting a pulse every pulse_step
+
+        Parameters
+        ----------
+        start, stop: float
+            positions of the axis between which the velocity is constant
+        velocity: float
+            absolute velocity of the constant part
+        pulse_step: float or None
+            distance between two pulses, None for no pulse output
+        acceleration: float or None
+            acceleration of the run-up and run-down, defaults to the maximum acceleration of the axis
+        axis: int
+            index of the scanned positioner
+        wait: bool
+            if True, returns once the line is done
+        """
+        if acceleration is None:
+            acceleration = self.limits()[1][axis]
+        velocity = np.copysign(abs(velocity), stop - start)
+        trajectory = PVTTrajectory.constant_velocity_line(
+            stop - start, velocity, acceleration, len(self.positioners), axis)
+        run_up_position = self.positions()
+        run_up_position[axis] = start - trajectory.run_up_distance()[axis]
+        self._controller.submit_motion("GroupMoveAbsolute", self.group, list(run_up_position)).result()
+        self.load(trajectory)
+        if pulse_step is not None:
+            self.set_pulses(2, 2, abs(pulse_step / velocity))
+        return self.execute(wait=wait)
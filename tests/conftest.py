@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+from functools import partial
+
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_files import XPSFileStore
+from pymodaq_plugins_newport.hardware.xps_q8_simplified import SimpleXPS
+from pymodaq_plugins_newport.hardware.xps_simulator import LocalFTP, XPSSimulator
+
+
+@pytest.fixture
+def simulator(tmp_path):
+    with XPSSimulator({"Group1": ["Pos"], "XY": ["X", "Y"]}, ready=True, files_root=tmp_path / "xps") as simulator:
+        yield simulator
+
+
+@pytest.fixture
+def controller(simulator):
+    controller = SimpleXPS("127.0.0.1", simulator.port, "Group1", "Pos")
+    yield controller
+    controller.close_tcpip()
+
+
+@pytest.fixture
+def xy_controller(simulator):
+    controller = SimpleXPS("127.0.0.1", simulator.port, "XY", "X", group_positionners=["X", "Y"])
+    yield controller
+    controller.close_tcpip()
+
+
+@pytest.fixture
+def ftp_factory(simulator):
+    """Factory of FTP sessions on the files of the simulator, see XPSFileStore"""
+    return partial(LocalFTP, simulator.files_root)
+
+
+@pytest.fixture
+def file_store(simulator, ftp_factory):
+    return XPSFileStore("127.0.0.1", ftp_factory=ftp_factory)
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from pymodaq_plugins_newport.hardware.XPS_Q8_drivers import XPS
+from pymodaq_plugins_newport.hardware.xps_api import api_names, api_spec, build_api_command
+
+
+def test_driver_methods_against_the_simulator(simulator):
+    xps = XPS()
+    socket_id = xps.TCP_ConnectToServer("127.0.0.1", simulator.port, 1.)
+    try:
+        assert xps.GroupMoveAbsolute(socket_id, "XY", [0.5, 0.25]) == [0, ""]
+        assert xps.GroupPositionCurrentGet(socket_id, "XY", 2) == [0, 0.5, 0.25]
+        # keyword arguments, as the Newport driver
+        assert xps.GroupPositionCurrentGet(socketId=socket_id, GroupName="XY.Y", nbElement=1) == [0, 0.25]
+        assert xps.GroupStatusGet(socket_id, "Nope")[0] == -19
+        with pytest.raises(TypeError):
+            xps.GroupStatusGet(socket_id)
+    finally:
+        xps.TCP_CloseSocket(socket_id)
+
+
+class CommandRecorder(XPS):
+    def _sendAndDecode(self, socketId, APIName, command, nbElement):
+        return command, nbElement
+
+    def Call(self, socketId, APIName, *Arguments):
+        return build_api_command(APIName, Arguments)
+
+
+def test_api_methods_send_the_command_of_their_declaration():
+    xps = CommandRecorder()
+    for api_name in api_names():
+        spec = api_spec(api_name)
+        arguments = [[1.5, 2] if is_list else 2 if argument == "nbElement" else f"{argument}1"
+                     for argument, is_list in zip(spec.arguments, spec.lists)]
+        assert getattr(xps, api_name)(0, *arguments) == build_api_command(api_name, arguments), api_name
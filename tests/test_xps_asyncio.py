@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+from pymodaq_plugins_newport.hardware.XPS_Q8_drivers import XPS, SyncXPS
+from pymodaq_plugins_newport.hardware.xps_q8_simplified import SimpleXPS
+from pymodaq_plugins_newport.hardware.xps_simulator import XPSSimulator
+
+
+@pytest.fixture
+def simulator():
+    # 1 unit/s: a move of 1.5 lasts more than 1.5 s
+    with XPSSimulator({"Group1": ["Pos"]}, ready=True, velocity=1., acceleration=10.) as simulator:
+        yield simulator
+
+
+@pytest.mark.parametrize("driver", [XPS, SyncXPS])
+def test_move_longer_than_timeout(simulator, driver):
+    xps = driver()
+    socket_id = xps.TCP_ConnectToServer("127.0.0.1", simulator.port, 0.5)
+    assert socket_id != -1
+    try:
+        start = time.perf_counter()
+        error, _ = xps.GroupMoveAbsolute(socket_id, "Group1", [1.5])
+        assert error == 0
+        assert time.perf_counter() - start > 1.
+        error, position = xps.GroupPositionCurrentGet(socket_id, "Group1", 1)
+        assert error == 0
+        assert position == pytest.approx(1.5)
+    finally:
+        xps.TCP_CloseSocket(socket_id)
+
+
+def test_reply_timeout_of_a_socket(simulator):
+    xps = SyncXPS()
+    moving = xps.TCP_ConnectToServer("127.0.0.1", simulator.port, 0.5)
+    waiting = xps.TCP_ConnectToServer("127.0.0.1", simulator.port, 0.5)
+    try:
+        xps.TCP_SetTimeout(waiting, 0.2)
+        # the timeout of a socket does not bound the replies of the others
+        assert xps.GroupMoveAbsolute(moving, "Group1", [1.5])[0] == 0
+        assert xps.GroupMoveAbsolute(waiting, "Group1", [0.])[0] == -2
+    finally:
+        xps.TCP_CloseSocket(waiting)
+        xps.TCP_CloseSocket(moving)
+
+
+@pytest.mark.parametrize("use_asyncio", [False, True])
+def test_jog_parameters_interleaving_two_lists(use_asyncio):
+    with XPSSimulator({"XY": ["X", "Y"]}, ready=True) as simulator:
+        controller = SimpleXPS("127.0.0.1", simulator.port, "XY", "X", group_positionners=["X", "Y"],
+                               use_asyncio=use_asyncio)
+        try:
+            controller.jog_mode()
+            # GroupJogParametersSet(XY,0.5,5.0,-0.25,2.0)
+            controller.set_jog_parameters([0.5, -0.25], [5., 2.])
+            assert controller.jog_parameters() == [0.5, 5., -0.25, 2.]
+            controller.set_jog_parameters([0., 0.], [5., 2.])
+        finally:
+            controller.close_tcpip()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import time
+
+import numpy as np
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_clock import ClockSync
+from pymodaq_plugins_newport.hardware.xps_codec import XPSError
+
+
+def test_controller_time_before_the_first_sample(controller):
+    clock = ClockSync(controller)
+    assert not clock.synchronized
+    assert np.isnan(clock.controller_time(time.perf_counter_ns()))
+    assert np.isnan(clock.host_time_ns(1.))
+    assert controller.controller_time(time.perf_counter_ns()) is None
+
+
+def test_offset_of_the_controller_clock(controller, simulator):
+    clock = controller.start_clock_sync(interval=0.05)
+    try:
+        time.sleep(0.3)
+        assert clock.running
+        assert clock.nb_errors == 0
+        now = time.perf_counter_ns()
+        # the simulator clock is perf_counter since its start
+        assert clock.controller_time(now) == pytest.approx(simulator.now(), abs=2e-3)
+        assert clock.host_time_ns(clock.controller_time(now)) == pytest.approx(now, abs=1e3)
+        controller.get_position()
+        assert controller.position_time == pytest.approx(simulator.now(), abs=2e-3)
+    finally:
+        controller.stop_clock_sync()
+    assert not clock.running
+    assert clock.synchronized
+
+
+def test_drift_of_the_controller_clock(controller, simulator, monkeypatch):
+    # controller clock gaining 1 % on the host clock
+    monkeypatch.setattr(simulator, "_api_ElapsedTimeGet", lambda session: [100. + 1.01 * simulator.now()])
+    clock = ClockSync(controller, burst=3)
+    try:
+        for _ in range(8):
+            clock.sample()
+            time.sleep(0.05)
+    finally:
+        clock.stop()
+    assert clock.drift == pytest.approx(0.01, abs=2e-3)
+    assert clock.residual < 1e-3
+    assert clock.controller_time(time.perf_counter_ns()) == pytest.approx(100. + 1.01 * simulator.now(), abs=2e-3)
+
+
+def test_gathering_timestamps(controller, simulator):
+    session = controller.gathering(100)
+    session.start()
+    with pytest.raises(XPSError, match="clock sync"):
+        session.timestamps()
+    controller.start_clock_sync(interval=1.)
+    try:
+        start = simulator.now()
+        session.start()
+        times = session.timestamps()
+    finally:
+        session.stop()
+        controller.stop_clock_sync()
+    assert times.size == 100
+    assert times[0] == pytest.approx(start, abs=5e-3)
+    np.testing.assert_allclose(np.diff(times), 1 / simulator.servo_rate)
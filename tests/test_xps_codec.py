@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_codec import build_command, decode_reply, decode_result, split_reply
+
+
+@pytest.mark.parametrize("api_name, arguments, nb_element, expected", [
+    ("GroupStatusGet", ["Group1"], 1, [11]),
+    ("GroupPositionCurrentGet", ["XY"], 2, [0., 0.]),
+    ("PositionerMaximumVelocityAndAccelerationGet", ["Group1.Pos"], 1, [20., 80.]),
+    ("ErrorStringGet", [-17], 1, ["Parameter out of range or incorrect"]),
+    ("FirmwareVersionGet", [], 1, ["XPS-Q8 Simulator V1.0"]),
+])
+def test_round_trip(simulator, api_name, arguments, nb_element, expected):
+    command = build_command(api_name, arguments, nb_element)
+    error, returned_string = split_reply(simulator.execute(command))
+    assert error == 0
+    assert decode_reply(api_name, returned_string, nb_element) == expected
+
+
+def test_round_trip_of_list_arguments(simulator):
+    command = build_command("GroupMoveAbsolute", ["XY", [1., -2.]])
+    assert command == "GroupMoveAbsolute(XY,1.0,-2.0)"
+    assert split_reply(simulator.execute(command)) == (0, "")
+    error, returned_string = split_reply(simulator.execute(build_command("GroupPositionCurrentGet", ["XY"], 2)))
+    assert decode_result("GroupPositionCurrentGet", error, returned_string, 2) == [0, 1., -2.]
+
+
+def test_error_replies_are_not_decoded(simulator):
+    error, returned_string = split_reply(simulator.execute(build_command("GroupStatusGet", ["Nope"])))
+    assert decode_result("GroupStatusGet", error, returned_string) == [-19, ""]
+
+
+def test_string_output_with_commas():
+    assert decode_reply("ErrorStringGet", "Wrong, really wrong") == ["Wrong, really wrong"]
+    assert decode_reply("GroupStatusStringGet", "Ready, from homing") == ["Ready, from homing"]
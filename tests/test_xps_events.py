@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_codec import XPSError
+from pymodaq_plugins_newport.hardware.xps_q8_simplified import SimpleXPS
+
+
+def wait_until(condition, timeout=5.):
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_motion_done_event_reports_the_final_position(controller):
+    listener = controller.motion_done_listener()
+    assert listener.use_events
+    positions = []
+    listener.add_callback(positions.append)
+    for target in (1., 0.5, 2.):
+        done = listener.watch(lambda: controller.move_absolute(target, wait=False))
+        assert done.result(timeout=5.) == pytest.approx(target)
+    assert positions == pytest.approx([1., 0.5, 2.])
+    assert controller.motion_done_listener() is listener
+
+
+def test_group_listener_reports_the_group_positions(xy_controller):
+    listener = xy_controller.motion_done_listener()
+    done = listener.watch(lambda: xy_controller.move_group_absolute([1., 2.], wait=False))
+    assert done.result(timeout=5.) == pytest.approx([1., 2.])
+
+
+def test_rejected_moves_leave_no_pending_wait(controller):
+    listener = controller.motion_done_listener()
+    listener.watch(lambda: controller.move_absolute(0.1, wait=False)).result(timeout=5.)
+    nb_opened = controller.pool.nb_opened
+    for _ in range(6):
+        done = listener.watch(lambda: controller.move_absolute(1000., wait=False))
+        with pytest.raises(XPSError, match="travel limits"):
+            done.result(timeout=5.)
+    # the waits armed for the rejected moves are cancelled and their sockets closed
+    assert wait_until(lambda: controller.pool.nb_opened <= nb_opened)
+    done = listener.watch(lambda: controller.move_absolute(1., wait=False))
+    assert done.result(timeout=5.) == pytest.approx(1.)
+
+
+def test_listener_without_events_reports_the_end_of_the_motion_command(simulator):
+    controller = SimpleXPS("127.0.0.1", simulator.port, "Group1", "Pos", use_asyncio=True)
+    try:
+        listener = controller.motion_done_listener()
+        assert not listener.use_events
+        done = listener.watch(lambda: controller.move_absolute(1.5, wait=False))
+        assert done.result(timeout=5.) == pytest.approx(1.5)
+    finally:
+        controller.close_tcpip()
+
+
+def test_close_stops_the_pending_waits(controller):
+    listener = controller.motion_done_listener()
+    done = listener.watch(lambda: controller.move_absolute(50., wait=False))
+    time.sleep(0.2)
+    controller.close_tcpip()
+    with pytest.raises(XPSError):
+        done.result(timeout=5.)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_q8_simplified import SimpleXPS
+from pymodaq_plugins_newport.hardware.xps_simulator import XPSSimulator
+
+
+@pytest.fixture
+def controller():
+    # the default acceleration is a quarter of the maximum one, as on a tuned stage
+    with XPSSimulator(ready=True, maximum_acceleration=320.) as simulator:
+        controller = SimpleXPS("127.0.0.1", simulator.port, "Group1", "Pos")
+        yield controller
+        controller.close_tcpip()
+
+
+def test_small_steps_use_the_fast_profile(controller):
+    steps = controller.fast_steps()
+    assert steps.defaults == (20., 80., 0.005, 0.05)
+    assert steps.fast == (20., 320., 0.005, 0.005)
+    assert steps.max_step == pytest.approx(20. * (20. / 80. + 0.005), rel=1e-3)
+    assert steps.prepare(0.1)
+    assert controller.sgamma_parameters() == [20., 320., 0.005, 0.005]
+    assert not steps.prepare(10.)
+    assert controller.sgamma_parameters() == [20., 80., 0.005, 0.05]
+
+
+def test_fast_steps_save_time(controller):
+    with controller.fast_steps() as steps:
+        for _ in range(3):
+            assert steps.move_relative(0.1) > 0
+        assert steps.move_relative(10.) is None
+        assert controller.sgamma_parameters() == [20., 80., 0.005, 0.05]
+        assert steps.move_relative(-0.1) > 0
+    assert controller.sgamma_parameters() == [20., 80., 0.005, 0.05]
+    assert controller.get_position() == pytest.approx(10.2, abs=1e-6)
+    assert steps.nb_steps == 4
+    saved, ratio = steps.time_saved()
+    assert saved > 0 and 0 < ratio < 1
+    assert steps.summary() == f"4 fast steps, {saved * 1e3:.1f} ms saved per step ({ratio:.0%})"
+
+
+def test_restore_after_an_error(controller):
+    with pytest.raises(RuntimeError):
+        with controller.fast_steps(max_step=1.) as steps:
+            steps.prepare(0.5)
+            raise RuntimeError("scan aborted")
+    assert controller.sgamma_parameters() == [20., 80., 0.005, 0.05]
+    assert steps.nb_steps == 0
+    assert steps.time_saved() == (0., 0.)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import time
+
+import numpy as np
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_codec import XPSError
+from pymodaq_plugins_newport.hardware.xps_files import XPSFileStore
+from pymodaq_plugins_newport.hardware.xps_gathering import parse_gathering_lines
+
+
+def test_stream_yields_the_lines_by_chunks(controller):
+    # 2000 lines at 8 kHz: 0.25 s, the move of 1 lasts 0.16 s
+    session = controller.gathering(2000, chunk_lines=300, poll_interval=0.01)
+    with session:
+        controller.move_absolute(1., wait=False)
+        chunks = list(session.stream(timeout=5.))
+    assert [chunk.size for chunk in chunks] == [300] * 6 + [200]
+    assert session.nb_read == 2000
+    setpoints = np.concatenate(chunks)["Group1.Pos.SetpointPosition"]
+    assert np.all(np.diff(setpoints) >= 0)
+    assert setpoints[0] == pytest.approx(0.)
+    assert setpoints[-1] == pytest.approx(1.)
+
+
+def test_read_all_matches_the_saved_file(controller, file_store):
+    session = controller.gathering(1000, quantities=("SetpointPosition", "CurrentVelocity"), divisor=2)
+    session.start()
+    controller.move_absolute(-0.5, wait=False)
+    data = session.read_all(timeout=5.)
+    assert data.dtype.names == ("Group1.Pos.SetpointPosition", "Group1.Pos.CurrentVelocity")
+    assert data.size == 1000
+    saved = session.fetch_saved(file_store)
+    assert saved.dtype == data.dtype
+    for name in data.dtype.names:
+        np.testing.assert_allclose(saved[name], data[name])
+
+
+def test_stream_ends_with_the_lines_gathered_before_a_stop(controller):
+    session = controller.gathering(10 ** 6, poll_interval=0.01)
+    session.start()
+    time.sleep(0.05)
+    session.stop()
+    chunks = list(session.stream())
+    assert 0 < session.nb_read == sum(chunk.size for chunk in chunks) < 10 ** 6
+
+
+def test_stream_raises_when_the_gathering_stalls(controller):
+    session = controller.gathering(10 ** 6, poll_interval=0.01)
+    session.start()
+    controller.query("GatheringStop")
+    with pytest.raises(XPSError, match="stalled"):
+        list(session.stream(timeout=0.2))
+
+
+def test_stream_raises_when_the_gathering_is_stopped_on_the_controller(controller):
+    session = controller.gathering(10 ** 6, poll_interval=0.01)
+    session.start()
+    # by another client
+    controller.query("GatheringStop")
+    start = time.perf_counter()
+    with pytest.raises(XPSError, match="stopped on the controller"):
+        list(session.stream())
+    assert time.perf_counter() - start < 2 * session.MIN_STALL_TIME
+
+
+def test_parse_gathering_lines():
+    np.testing.assert_array_equal(parse_gathering_lines("1;2\n3;4\n", 2), [[1., 2.], [3., 4.]])
+    assert parse_gathering_lines("", 3).shape == (0, 3)
+    with pytest.raises(XPSError):
+        # truncated reply
+        parse_gathering_lines("1;2\n3", 2, 2)
+    with pytest.raises(XPSError):
+        parse_gathering_lines("1;2\n3;x", 2, 2)
+
+
+def test_npy_file_of_a_short_gathering_file(file_store, simulator, tmp_path):
+    path = simulator.files_root / XPSFileStore.GATHERING_FILE.lstrip("/")
+    path.parent.mkdir(parents=True)
+    path.write_text("A\tB\n1\t2\n3\t4\n5\t6\n")
+    data = file_store.fetch_gathering(["A", "B"], npy_path=tmp_path / "gathering.npy", nb_lines=1000)
+    np.testing.assert_array_equal(data["B"], [2., 4., 6.])
+    del data
+    saved = np.load(tmp_path / "gathering.npy")
+    assert saved.shape == (3,)
+    np.testing.assert_array_equal(saved["A"], [1., 3., 5.])
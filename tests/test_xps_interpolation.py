@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_codec import XPSError
+from pymodaq_plugins_newport.hardware.xps_interpolation import FrameInterpolator
+
+
+@pytest.fixture
+def trajectory():
+    rng = np.random.default_rng(0)
+    times = 100. + np.arange(2000) / 8000.
+    positions = np.cumsum(rng.normal(0., 1e-3, times.size))
+    velocities = np.gradient(positions, times)
+    # frames around the gathered times, some of them outside
+    frame_times = rng.uniform(times[0] - 0.01, times[-1] + 0.01, 5000)
+    return times, positions, velocities, frame_times
+
+
+def expected(times, values, frame_times):
+    return np.interp(frame_times, times, values, left=np.nan, right=np.nan)
+
+
+@pytest.mark.parametrize("order", ["increasing", "random"])
+def test_matches_np_interp(trajectory, order):
+    times, positions, velocities, frame_times = trajectory
+    if order == "increasing":
+        frame_times = np.sort(frame_times)
+    interpolated_positions, interpolated_velocities = FrameInterpolator(times, positions, velocities)(frame_times)
+    np.testing.assert_allclose(interpolated_positions, expected(times, positions, frame_times), rtol=1e-12)
+    np.testing.assert_allclose(interpolated_velocities, expected(times, velocities, frame_times), rtol=1e-12)
+
+
+def test_unevenly_spaced_lines(trajectory):
+    times, positions, velocities, frame_times = trajectory
+    times = times + np.random.default_rng(1).uniform(0., 1e-5, times.size)
+    interpolator = FrameInterpolator(times, positions, velocities)
+    assert interpolator.period is None
+    np.testing.assert_allclose(interpolator(frame_times[::-1])[0], expected(times, positions, frame_times[::-1]),
+                               rtol=1e-12)
+
+
+def test_frames_at_the_gathered_times(trajectory):
+    times, positions, velocities, _ = trajectory
+    frame_times = np.random.default_rng(2).permutation(times)
+    interpolated_positions, _ = FrameInterpolator(times, positions, velocities)(frame_times)
+    np.testing.assert_allclose(interpolated_positions, expected(times, positions, frame_times), rtol=1e-12)
+
+
+def test_several_positioners_without_velocities(trajectory):
+    times, positions, _, frame_times = trajectory
+    xy = np.stack([positions, -2 * positions], axis=1)
+    interpolated_positions, interpolated_velocities = FrameInterpolator(times, xy)(frame_times)
+    assert interpolated_positions.shape == (frame_times.size, 2)
+    for axis in range(2):
+        np.testing.assert_allclose(interpolated_positions[:, axis], expected(times, xy[:, axis], frame_times),
+                                   rtol=1e-12)
+    # the velocity of a frame is the slope of the segment around it
+    index = np.clip(np.searchsorted(times, frame_times, side="right") - 1, 0, times.size - 2)
+    slopes = np.diff(xy, axis=0) / np.diff(times)[:, np.newaxis]
+    inside = (frame_times >= times[0]) & (frame_times <= times[-1])
+    np.testing.assert_allclose(interpolated_velocities[inside], slopes[index[inside]], rtol=1e-9)
+    assert np.all(np.isnan(interpolated_velocities[~inside]))
+
+
+def test_chunks_and_preallocated_outputs(trajectory):
+    times, positions, velocities, frame_times = trajectory
+    outputs = np.empty(frame_times.size), np.empty(frame_times.size)
+    interpolator = FrameInterpolator(times, positions, velocities, chunk_size=333)
+    result = interpolator(frame_times, *outputs)
+    assert result[0] is outputs[0] and result[1] is outputs[1]
+    np.testing.assert_allclose(outputs[0], expected(times, positions, frame_times), rtol=1e-12)
+    batches = list(interpolator.stream(np.array_split(frame_times, 7)))
+    np.testing.assert_allclose(np.concatenate([batch[0] for batch in batches]), outputs[0], rtol=1e-12)
+
+
+def test_invalid_gathering():
+    with pytest.raises(XPSError, match="increasing"):
+        FrameInterpolator([0., 1., 1.], [0., 1., 2.])
+    with pytest.raises(XPSError, match="at least 2"):
+        FrameInterpolator([0.], [0.])
+    with pytest.raises(XPSError, match="same number"):
+        FrameInterpolator([0., 1.], [0., 1., 2.])
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_motion_model import SGammaModel
+
+
+def integrate_profile(jerk, ramp_time, hold_time, cruise_time, dt=1e-6):
+    """Distance and duration of a symmetric jerk limited move: the acceleration ramps in ramp_time, holds
+    for hold_time, ramps down, the velocity holds for cruise_time, then the same backwards"""
+    phases = [(jerk, ramp_time), (0., hold_time), (-jerk, ramp_time), (0., cruise_time),
+              (-jerk, ramp_time), (0., hold_time), (jerk, ramp_time)]
+    jerks = np.concatenate([np.full(int(round(duration / dt)), value) for value, duration in phases])
+    accelerations = np.cumsum(jerks) * dt
+    velocities = np.cumsum(accelerations) * dt
+    return velocities.sum() * dt, jerks.size * dt
+
+
+@pytest.fixture
+def model():
+    # jerk time 0.02 s, jerk of 80 / 0.02
+    return SGammaModel(20., 80., 0.02, 0.02)
+
+
+@pytest.mark.parametrize("ramp_time, hold_time, cruise_time", [
+    (0.02, 0.23, 0.5),  # velocity reached: 80 * (0.02 + 0.23) = 20
+    (0.02, 0.1, 0.),  # acceleration reached only
+    (0.01, 0., 0.),  # neither
+])
+def test_setting_time_of_the_three_profiles(model, ramp_time, hold_time, cruise_time):
+    distance, duration = integrate_profile(80. / 0.02, ramp_time, hold_time, cruise_time)
+    assert model.setting_time(distance) == pytest.approx(duration, rel=1e-3)
+    assert model.setting_time(-distance) == model.setting_time(distance)
+
+
+def test_setting_time_is_continuous_and_increasing(model):
+    distances = np.linspace(1e-6, 20., 200001)
+    times = model.setting_time(distances)
+    assert times.shape == distances.shape
+    assert np.all(np.diff(times) > 0)
+    # no jump where the profile changes: velocity reached, acceleration reached
+    for boundary in (20. * float(model.ramp_time()), 2 * 80. * 0.02 ** 2):
+        below, above = model.setting_time([boundary * (1 - 1e-9), boundary * (1 + 1e-9)])
+        assert above == pytest.approx(below, abs=1e-7)
+
+
+def test_trapezoidal_profile_without_jerk_time():
+    model = SGammaModel(20., 80., 0., 0.)
+    assert model.setting_time(10.) == pytest.approx(10. / 20. + 20. / 80.)
+    assert model.setting_time(1.) == pytest.approx(2 * np.sqrt(1. / 80.))
+
+
+def test_duration_broadcasts_the_parameters(model):
+    model.settling_time = 0.01
+    durations = model.duration([1., 2.], velocity=[[10.], [20.]])
+    assert durations.shape == (2, 2)
+    assert durations[1] == pytest.approx(model.setting_time([1., 2.]) + 0.01)
+
+
+def test_calibrate_finds_the_jerk_time_of_the_moves():
+    truth = SGammaModel(20., 80., 0.01, 0.05)
+    truth.jerk_fraction = 0.5
+    model = SGammaModel(20., 80., 0.01, 0.05)
+    assert model.calibrate() == (0.01, 0.)
+    rng = np.random.default_rng(0)
+    for displacement in rng.uniform(0.01, 10., 20):
+        model.record(displacement, float(truth.setting_time(displacement)), rng.uniform(0.002, 0.004))
+    # moves made with other parameters calibrate the same jerk fraction
+    for parameters in [(10., 40., 0.02, 0.1), (20., 80., 0.01, 0.05)]:
+        truth.set_parameters(*parameters)
+        model.set_parameters(*parameters)
+        for displacement in (0.05, 1., 5.):
+            model.record(displacement, float(truth.setting_time(displacement)), 0.003)
+    jerk_time, settling_time = model.calibrate()
+    assert model.nb_moves == 26
+    assert model.jerk_fraction == pytest.approx(0.5, abs=1 / (SGammaModel.NB_JERK_TIMES - 1))
+    assert jerk_time == pytest.approx(0.03, abs=1e-3)
+    assert 0.002 <= settling_time <= 0.004
+    assert model.residual < 1e-3
+
+
+def test_model_of_the_controller(controller, simulator):
+    model = controller.motion_model()
+    assert model.parameters() == (20., 80., 0.005, 0.05)
+    assert (model.maximum_velocity, model.maximum_acceleration) == (20., 80.)
+    for displacement in (0.5, 2., -1.5):
+        controller.move_relative(displacement)
+        setting_time, _ = controller.calibrate_motion_model(displacement)
+        # the simulator moves have trapezoidal profiles: the shortest jerk time fits them best
+        assert controller.predict_move_time(displacement) == pytest.approx(setting_time, abs=0.01)
+    assert model.nb_moves == 3
+    assert model.jerk_time == pytest.approx(0.005)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_codec import XPSError
+
+
+def test_configure_programs_a_whole_number_of_steps(controller, simulator):
+    trigger = controller.position_compare()
+    # decreasing scan of 1.75: 3 steps of 0.5 down from 2.05, the last 0.25 is dropped
+    trigger.configure(2.05, 0.3, -0.5, pulse_width=1.)
+    minimum, maximum, step, enabled = trigger.settings()
+    assert [minimum, maximum, step] == pytest.approx([0.55, 2.05, 0.5])
+    assert not enabled
+    np.testing.assert_allclose(trigger.configured_pulse_positions(), [0.55, 1.05, 1.55, 2.05])
+    assert simulator.groups["Group1"].positioners[0].pco_pulse == [1., 0.075]
+
+
+def test_configure_rejects_invalid_settings(controller):
+    trigger = controller.position_compare()
+    with pytest.raises(XPSError, match="step"):
+        trigger.configure(0., 1., 0.)
+    with pytest.raises(XPSError, match="pulse width"):
+        trigger.configure(0., 1., 0.1, pulse_width=0.5)
+    with pytest.raises(XPSError, match="settling time"):
+        trigger.configure(0., 1., 0.1, encoder_settling_time=2.)
+
+
+def test_run_up_distance_of_the_sgamma_profile(controller):
+    controller.query("PositionerSGammaParametersSet", "Group1.Pos", 10., 50., 0.01, 0.02)
+    # 10^2 / (2 * 50) + 10 * 0.02 / 2
+    assert controller.position_compare().run_up_distance() == pytest.approx(1.1)
+
+
+def test_scan_enables_the_position_compare_for_the_scan_move_only(controller):
+    trigger = controller.position_compare()
+    scan = trigger.scan(0., 4., 0.5, margin=1., wait=False)
+    # run-up to -1 done, the scan move to 5 lasts about 0.5 s at 20 units/s
+    assert trigger.settings()[3]
+    assert not scan.done()
+    scan.result(timeout=5.)
+    assert not trigger.settings()[3]
+    assert controller.get_position() == pytest.approx(5.)
+    assert trigger.configured_pulse_positions().size == 9
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import pytest
+
+from pymodaq_plugins_newport.hardware.XPS_Q8_drivers import XPS, SyncXPS
+from pymodaq_plugins_newport.hardware.xps_codec import XPSError
+from pymodaq_plugins_newport.hardware.xps_pool import XPSConnectionPool
+
+
+@pytest.fixture(params=[None, SyncXPS], ids=["XPS", "SyncXPS"])
+def pool(simulator, request):
+    kwargs = {} if request.param is None else {"driver": request.param}
+    pool = XPSConnectionPool("127.0.0.1", simulator.port, size=2, timeout=1., **kwargs)
+    yield pool
+    pool.close()
+
+
+def test_checkout_reuses_the_sockets_given_back(pool):
+    first = pool.checkout()
+    second = pool.checkout()
+    assert first != second
+    assert pool.nb_opened == 2
+    assert pool.xps.GroupStatusGet(first, "Group1") == [0, 11]
+    pool.checkin(first)
+    assert pool.checkout() == first
+    assert pool.nb_opened == 2
+
+
+def test_checkout_waits_for_a_socket_when_the_pool_is_full(pool):
+    sockets = [pool.checkout(), pool.checkout()]
+    start = time.perf_counter()
+    with pytest.raises(XPSError, match="No free socket"):
+        pool.checkout(timeout=0.2)
+    assert time.perf_counter() - start >= 0.2
+
+    threading.Timer(0.1, pool.checkin, (sockets[0],)).start()
+    assert pool.checkout(timeout=5.) == sockets[0]
+
+
+def test_reserved_sockets_are_not_lent(pool):
+    reserved = pool.reserve()
+    shared = {pool.checkout(), pool.checkout()}
+    assert reserved not in shared
+    assert pool.nb_opened == 3
+    assert pool.nb_shared == 2
+    with pool.reserved(reserved) as socket_id:
+        assert pool.xps.GroupStatusGet(socket_id, "Group1") == [0, 11]
+    pool.unreserve(reserved)
+    assert not pool.is_valid(reserved)
+    assert pool.nb_opened == 2
+
+
+def test_invalidated_socket_is_closed_when_given_back(pool):
+    with pool.socket() as socket_id:
+        pool.invalidate(socket_id)
+    assert not pool.is_valid(socket_id)
+    assert pool.nb_opened == 0
+    with pool.socket() as socket_id:
+        assert pool.xps.GroupStatusGet(socket_id, "Group1") == [0, 11]
+
+
+def test_checkout_raises_when_the_controller_is_unreachable(simulator):
+    pool = XPSConnectionPool("127.0.0.1", simulator.port, size=1, timeout=0.5)
+    simulator.stop()
+    # the slot of a failed connection is freed, the next checkout tries again instead of waiting
+    for _ in range(2):
+        with pytest.raises(XPSError, match="connection failed"):
+            pool.checkout(timeout=0.)
+    assert pool.nb_opened == 0
+
+
+def test_acquire_shares_the_pool_of_a_controller(simulator):
+    pool = XPSConnectionPool.acquire("127.0.0.1", simulator.port, size=2)
+    other = XPSConnectionPool.acquire("127.0.0.1", simulator.port, size=3)
+    assert other is pool
+    assert pool.size == 3
+    with pool.socket():
+        pass
+    pool.release()
+    assert pool.nb_opened == 1
+    other.release()
+    assert pool.nb_opened == 0
+    new_pool = XPSConnectionPool.acquire("127.0.0.1", simulator.port)
+    assert new_pool is not pool
+    new_pool.release()
+
+
+def test_acquire_refuses_another_driver(simulator):
+    pool = XPSConnectionPool.acquire("127.0.0.1", simulator.port, driver=SyncXPS)
+    try:
+        assert XPSConnectionPool.acquire("127.0.0.1", simulator.port) is pool
+        pool.release()
+        with pytest.raises(XPSError, match="SyncXPS driver, not XPS"):
+            XPSConnectionPool.acquire("127.0.0.1", simulator.port, driver=XPS)
+    finally:
+        pool.release()
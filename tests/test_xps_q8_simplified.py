@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_codec import XPSError
+
+
+def test_batch_returns_the_results_of_sequential_queries(xy_controller):
+    xy_controller.move_group_absolute([1., -1.])
+    batch = xy_controller.batch()
+    batch.add("GroupPositionCurrentGet", "XY", nb_element=2)
+    batch.add("GroupStatusGet", "XY")
+    batch.add("PositionerUserTravelLimitsGet", "XY.Y")
+    assert len(batch) == 3
+    assert batch.execute() == [
+        xy_controller.query("GroupPositionCurrentGet", "XY", 2),
+        xy_controller.query("GroupStatusGet", "XY"),
+        xy_controller.query("PositionerUserTravelLimitsGet", "XY.Y"),
+    ]
+    assert len(batch) == 0
+
+
+def test_batch_raises_the_error_of_a_call(controller):
+    batch = controller.batch()
+    batch.add("GroupStatusGet", "Group1")
+    batch.add("GroupStatusGet", "Nope")
+    with pytest.raises(XPSError, match="GroupStatusGet : ERROR -19"):
+        batch.execute()
+
+
+def test_move_outside_of_the_travel_limits_is_rejected(controller):
+    with pytest.raises(XPSError, match="travel limits"):
+        controller.move_absolute(1000.)
+    assert controller.query("GroupStatusGet", "Group1") == [11]
+
+
+def test_close_cancels_the_queued_motions(controller):
+    running = controller.move_absolute(50., wait=False)
+    queued = controller.move_absolute(0., wait=False)
+    time.sleep(0.1)
+    controller.stop_motion()
+    controller.close_tcpip()
+    assert queued.cancelled()
+    with pytest.raises(XPSError):
+        running.result(timeout=2.)
+    with pytest.raises(XPSError, match="connection failed"):
+        controller.query("GroupStatusGet", "Group1")
+
+
+def test_stop_motion_aborts_a_pending_move(controller):
+    # 20 units/s: the move lasts 2.5 s
+    motion = controller.move_absolute(50., wait=False)
+    time.sleep(0.2)
+    assert controller.is_moving()
+    # the position is read during the move, the motion holding its own socket
+    assert 0. < controller.get_position() < 50.
+    latency = controller.stop_motion()
+    assert latency == controller.last_stop_latency
+    with pytest.raises(XPSError, match="Move Aborted"):
+        motion.result(timeout=2.)
+    assert not controller.is_moving()
+    assert controller.get_position() < 50.
+    controller.move_absolute(0.)
+    assert controller.get_position() == pytest.approx(0.)
+
+
+def test_group_moves(xy_controller):
+    xy_controller.move_group_absolute([2., 3.])
+    xy_controller.move_group_relative([-1., 1.])
+    assert xy_controller.get_group_positions() == pytest.approx([1., 4.])
+    with pytest.raises(XPSError, match="2 positionners"):
+        xy_controller.move_group_absolute([1.])
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+from pymodaq_plugins_newport.hardware.XPS_Q8_drivers import XPS, SyncXPS
+from pymodaq_plugins_newport.hardware.xps_codec import XPSError
+from pymodaq_plugins_newport.hardware.xps_pool import XPSConnectionPool
+from pymodaq_plugins_newport.hardware.xps_q8_simplified import SimpleXPS
+from pymodaq_plugins_newport.hardware.xps_simulator import XPSSimulator
+from pymodaq_plugins_newport.hardware.xps_startup import ControllerStartup, GroupStartup
+
+
+@pytest.fixture
+def cold_simulator():
+    # groups NOT INITIALIZED, each homing lasting 0.5 s
+    with XPSSimulator({"Group1": ["Pos"], "Group2": ["Pos"], "Group3": ["Pos"]}, home_time=0.5) as simulator:
+        yield simulator
+
+
+def test_groups_are_started_concurrently(cold_simulator):
+    startup = ControllerStartup("127.0.0.1", cold_simulator.port)
+    start = time.perf_counter()
+    futures = startup.bring_up(["Group1", "Group2", "Group3"])
+    results = startup.wait_all(timeout=5.)
+    assert time.perf_counter() - start < 1.2
+    assert set(futures) == {"Group1", "Group2", "Group3"}
+    assert [results[group].path for group in futures] == ["initialized"] * 3
+    assert startup.ready
+    assert "Group2 initialized" in startup.summary()
+
+    # groups already started are not started again
+    assert startup.bring_up(["Group1"])["Group1"] is futures["Group1"]
+
+
+def test_ready_group_is_reused(simulator):
+    startup = ControllerStartup("127.0.0.1", simulator.port)
+    startup.bring_up(["Group1"])
+    assert startup.wait_all(timeout=5.)["Group1"].path == "reused"
+
+
+def test_failed_group_is_reported_and_started_again(cold_simulator):
+    startup = ControllerStartup("127.0.0.1", cold_simulator.port)
+    futures = startup.bring_up(["Group1", "Nope"])
+    results = startup.wait_all(timeout=5.)
+    assert results["Group1"].ready
+    assert results["Nope"].path == "failed"
+    assert "ERROR -19" in results["Nope"].error
+    assert not startup.ready
+    assert startup.bring_up(["Nope"])["Nope"] is not futures["Nope"]
+    startup.wait_all(timeout=5.)
+
+
+def test_simple_xps_waits_for_the_bring_up_of_its_group(cold_simulator):
+    controller = SimpleXPS("127.0.0.1", cold_simulator.port, "Group1", "Pos", bring_up_groups=["Group2", "Group3"])
+    try:
+        startup = controller.startup()
+        assert startup is ControllerStartup.get("127.0.0.1", cold_simulator.port)
+        assert controller.startup_path == "initialized"
+        results = startup.wait_all(timeout=5.)
+        assert [results[group].path for group in ("Group1", "Group2", "Group3")] == ["initialized"] * 3
+        assert cold_simulator.groups["Group2"].status == 11
+    finally:
+        controller.close_tcpip()
+
+
+def test_simple_xps_uses_the_running_bring_up_of_its_group(cold_simulator):
+    startup = ControllerStartup.get("127.0.0.1", cold_simulator.port)
+    future = startup.bring_up(["Group1"])["Group1"]
+    controller = SimpleXPS("127.0.0.1", cold_simulator.port, "Group1", "Pos")
+    try:
+        # started once, by the bring-up, whose record is kept
+        assert controller.startup_path == "initialized"
+        assert startup.status()["Group1"] is future.result()
+    finally:
+        controller.close_tcpip()
+
+
+def test_simple_xps_raises_the_failure_of_the_bring_up_of_its_group(cold_simulator, monkeypatch):
+    def failing_start(pool, group, fast_startup, future):
+        future.set_running_or_notify_cancel()
+        time.sleep(0.3)
+        future.set_result(GroupStartup(group, "failed", 0.3, "GroupHomeSearch(Group1) : ERROR -85"))
+
+    monkeypatch.setattr(ControllerStartup, "_start", staticmethod(failing_start))
+    startup = ControllerStartup.get("127.0.0.1", cold_simulator.port)
+    startup.bring_up(["Group1"])
+    with pytest.raises(XPSError, match="ERROR -85"):
+        SimpleXPS("127.0.0.1", cold_simulator.port, "Group1", "Pos")
+    # the controller was not started by the SimpleXPS
+    assert cold_simulator.groups["Group1"].status != 11
+
+
+def test_bring_up_with_another_driver_fails(cold_simulator):
+    pool = XPSConnectionPool.acquire("127.0.0.1", cold_simulator.port, driver=SyncXPS)
+    try:
+        startup = ControllerStartup("127.0.0.1", cold_simulator.port)
+        result = startup.bring_up(["Group2"], driver=XPS)["Group2"].result(timeout=1.)
+        assert not result.ready
+        assert "SyncXPS" in result.error
+    finally:
+        pool.release()
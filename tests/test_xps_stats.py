@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_codec import XPSError
+from pymodaq_plugins_newport.hardware.xps_q8_simplified import SimpleXPS
+from pymodaq_plugins_newport.hardware.xps_stats import LogHistogram
+
+
+def test_small_values_have_their_own_bucket():
+    histogram = LogHistogram()
+    for value in range(1, 31):
+        histogram.record(value)
+    assert histogram.percentile(50) == 15
+    assert histogram.percentile(100) == 30
+    assert histogram.summary()["min"] == 1
+    assert histogram.mean == pytest.approx(15.5)
+
+
+def test_relative_precision_of_the_percentiles():
+    histogram = LogHistogram(sub_bucket_bits=4)
+    for value in range(1, 100001):
+        histogram.record(value * 1000)
+    for percent in (50, 90, 99, 99.9):
+        exact = percent / 100 * 1e8
+        assert exact / (1 + 1 / 16) <= histogram.percentile(percent) <= exact
+    assert histogram.percentile(100) <= histogram.max == 1e8
+
+
+def test_merge_and_empty_histograms():
+    first, second = LogHistogram(), LogHistogram()
+    assert first.summary()["p99"] == 0
+    first.record(10)
+    second.record(1000)
+    second.record(-5)  # clipped to 0
+    first.merge(second)
+    assert (first.total, first.sum, first.min, first.max) == (3, 1010, 0, 1000)
+
+
+def test_statistics_of_the_calls(controller, tmp_path):
+    stats = controller.enable_statistics()
+    for _ in range(5):
+        controller.get_position()
+    with pytest.raises(XPSError):
+        controller.query("GroupStatusGet", "Nope")
+    snapshot = stats.snapshot()
+    positions = snapshot["GroupPositionCurrentGet"]
+    assert positions["calls"] == 5
+    assert positions["bytes_out"] == 5 * len("GroupPositionCurrentGet(Group1.Pos,double *)")
+    assert positions["wait_ns"]["count"] == positions["parse_ns"]["count"] == 5
+    assert 0 < positions["wait_ns"]["p50"] <= positions["wait_ns"]["max"]
+    assert snapshot["GroupStatusGet"]["errors"] == {-19: 1}
+    assert stats.totals()["calls"] == sum(api["calls"] for api in snapshot.values())
+    assert "errors" in stats.log_line()
+
+    stats.export(tmp_path / "stats.json")
+    exported = json.loads((tmp_path / "stats.json").read_text())
+    assert exported["apis"]["GroupPositionCurrentGet"]["calls"] == 5
+
+    controller.disable_statistics()
+    controller.get_position()
+    assert stats.snapshot()["GroupPositionCurrentGet"]["calls"] == 5
+
+
+def test_statistics_need_the_socket_driver(simulator):
+    controller = SimpleXPS("127.0.0.1", simulator.port, "Group1", "Pos", use_asyncio=True)
+    try:
+        with pytest.raises(XPSError, match="socket based driver"):
+            controller.enable_statistics()
+    finally:
+        controller.close_tcpip()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+from pymodaq_plugins_newport.hardware.xps_q8_simplified import SimpleXPS
+from pymodaq_plugins_newport.hardware.xps_simulator import XPSSimulator
+from pymodaq_plugins_newport.hardware.xps_strings import XPSStrings, parse_string_list
+
+
+def test_parse_string_list():
+    assert parse_string_list("0 : Successful command;-17 : Parameter out of range, or incorrect\nnot an entry") == {
+        0: "Successful command", -17: "Parameter out of range, or incorrect"}
+    assert parse_string_list("0x00000100 : Minus end of run activated") == {0x100: "Minus end of run activated"}
+
+
+def test_strings_are_cached_in_a_file_per_firmware(controller, simulator, tmp_path):
+    strings = XPSStrings("127.0.0.1", simulator.port)
+    assert strings.load(controller.query, tmp_path, controller.batch) == "queried"
+    assert XPSStrings.cache_path(tmp_path, XPSSimulator.FIRMWARE_VERSION).is_file()
+    assert strings.error_string(-17) == "Parameter out of range or incorrect"
+    assert strings.group_status_string(11) == "Ready state from homing"
+    assert strings.positioner_errors(0x301) == [
+        "General inhibition detected", "Minus end of run activated", "Plus end of run activated"]
+    assert strings.hardware_status(0x4) == ["Motor is enabled"]
+    assert strings.load(controller.query) == "cached"
+
+    # a new connection only reads the firmware version
+    commands = simulator.commands
+    cached = XPSStrings("127.0.0.1", simulator.port)
+    assert cached.load(controller.query, tmp_path, controller.batch) == "cached"
+    assert simulator.commands == commands + 1
+    assert cached.tables == strings.tables
+
+
+def test_corrupted_cache_file_is_replaced(controller, simulator, tmp_path):
+    path = XPSStrings.cache_path(tmp_path, XPSSimulator.FIRMWARE_VERSION)
+    path.write_text("{not json")
+    strings = XPSStrings("127.0.0.1", simulator.port)
+    assert strings.load(controller.query, tmp_path) == "queried"
+    assert XPSStrings("127.0.0.1", simulator.port).load(controller.query, tmp_path) == "cached"
+
+
+def test_controller_decodes_the_errors_locally(simulator, tmp_path):
+    controller = SimpleXPS("127.0.0.1", simulator.port, "Group1", "Pos", strings_directory=tmp_path)
+    try:
+        assert controller.strings.loaded
+        assert controller.group_status_string() == "Ready state from homing"
+        commands = simulator.commands
+        assert controller.strings.error_string(-35) == "Position is outside of travel limits"
+        assert controller.group_status_string(44) == "Moving state"
+        assert simulator.commands == commands
+    finally:
+        controller.close_tcpip()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_codec import XPSError
+from pymodaq_plugins_newport.hardware.xps_files import XPSFileStore
+from pymodaq_plugins_newport.hardware.xps_tcl import TCLScan
+
+
+@pytest.fixture
+def scan(xy_controller, file_store):
+    points = np.column_stack((np.linspace(0., 1., 25), np.linspace(0., -1., 25)))
+    return TCLScan(xy_controller, "XY", ["X", "Y"], points, file_store, analog_inputs=["GPIO2.ADC1"],
+                   batch_size=4, nb_slots=2, string_slot=10, double_slot=20, poll_interval=0.005)
+
+
+def play(simulator, scan, rows, error=None):
+    """Plays the TCL scan script on the global arrays of the simulator, writing rows, failing with error
+    after them if given"""
+    nb_batches = 0
+    for start in range(0, len(rows), scan.batch_size):
+        while nb_batches - simulator.double_global_arrays[scan.ack_slot] >= scan.nb_slots:
+            time.sleep(0.001)
+        batch = rows[start:start + scan.batch_size]
+        simulator.global_arrays[scan.string_slot + nb_batches % scan.nb_slots] = " ".join(
+            f"{value:.12g}" for row in batch for value in row) + " "
+        nb_batches += 1
+        simulator.double_global_arrays[scan.progress_slot] = nb_batches
+    if error is None:
+        simulator.double_global_arrays[scan.status_slot] = 1.
+    else:
+        simulator.global_arrays[scan.string_slot + scan.nb_slots] = error
+        simulator.double_global_arrays[scan.status_slot] = -1.
+
+
+def start_playing(simulator, scan, rows, error=None):
+    thread = threading.Thread(target=play, args=(simulator, scan, rows, error), daemon=True)
+    thread.start()
+    return thread
+
+
+def test_render(scan):
+    script = scan.render()
+    assert "set nb_points 25\nset dwell_ms 0\nset batch_size 4\nset nb_slots 2\n" in script
+    assert "set string_slot 10\nset progress_slot 20\nset status_slot 21\nset ack_slot 22\n" in script
+    assert "{0 0}\n{0.0416666666667 -0.0416666666667}\n" in script
+    assert "GroupPositionCurrentGet $socketID $group p0 p1" in script
+    assert "GPIOAnalogGet $socketID GPIO2.ADC1 a0" in script
+    assert 'append batch "$p0 $p1 $a0 "' in script
+
+
+def test_start_uploads_the_script_and_runs_its_task(scan, simulator):
+    simulator.double_global_arrays.update({20: 3., 21: 1., 22: 3.})
+    scan.start()
+    path = simulator.files_root / XPSFileStore.SCRIPTS_DIRECTORY.lstrip("/") / "pymodaq_scan.tcl"
+    assert path.read_text() == scan.render()
+    assert simulator.tcl_tasks == {"pymodaq_scan": "pymodaq_scan.tcl"}
+    assert scan.progress() == (0, 0)
+    assert simulator.double_global_arrays[22] == 0.
+    scan.kill()
+    assert simulator.tcl_tasks == {}
+    with pytest.raises(XPSError):
+        scan.kill()
+
+
+def test_read_all_with_a_ring_smaller_than_the_scan(scan, simulator):
+    rows = np.column_stack((scan.points, np.arange(25.)))
+    scan.start()
+    thread = start_playing(simulator, scan, rows)
+    data = scan.read_all(timeout=5.)
+    thread.join()
+    assert data.dtype.names == ("XY.X", "XY.Y", "GPIO2.ADC1")
+    np.testing.assert_allclose(data["XY.X"], rows[:, 0])
+    np.testing.assert_allclose(data["XY.Y"], rows[:, 1])
+    np.testing.assert_allclose(data["GPIO2.ADC1"], rows[:, 2])
+    assert simulator.double_global_arrays[scan.ack_slot] == scan.nb_batches == 7
+
+
+def test_stream_yields_the_batches(scan, simulator):
+    scan.start()
+    thread = start_playing(simulator, scan, np.column_stack((scan.points, np.zeros(25))))
+    sizes = [batch.size for batch in scan.stream(timeout=5.)]
+    thread.join()
+    # each read takes all the batches written, of 4 points but the last one
+    assert sum(sizes) == 25
+    assert all(size % 4 == 0 for size in sizes[:-1]) and sizes[-1] % 4 == 1
+
+
+def test_script_error_is_raised(scan, simulator):
+    scan.start()
+    start_playing(simulator, scan, np.column_stack((scan.points[:8], np.zeros(8))),
+                  error="GroupMoveAbsolute 0.375 -0.375: -17").join()
+    with pytest.raises(XPSError, match="TCL scan failed: GroupMoveAbsolute 0.375 -0.375: -17"):
+        scan.read_all(timeout=5.)
+
+
+def test_stalled_scan(scan):
+    scan.start()
+    with pytest.raises(XPSError, match="TCL scan stalled after 0 of 7 batches"):
+        scan.read_all(timeout=0.1)
+
+
+def test_malformed_batch(scan, simulator):
+    scan.start()
+    simulator.global_arrays[scan.string_slot] = "0 0 1 0.1 -0.1"
+    simulator.double_global_arrays[scan.progress_slot] = 1.
+    with pytest.raises(XPSError, match="TCL scan batches of 5 values instead of 4 points of 3 values"):
+        next(scan.stream(timeout=1.))
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import time
+
+import numpy as np
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_telemetry import TelemetrySampler
+
+
+def test_sample_of_the_controller_and_the_group(xy_controller, simulator):
+    sampler = TelemetrySampler(xy_controller, "XY", ["X", "Y"])
+    try:
+        sample = sampler.sample()
+    finally:
+        sampler.stop()
+    assert sample["cpu_temperature"] == 45.
+    assert sample["fan_speed"] == 3000.
+    assert [sample[name] for name in ("total_load", "corrector_load", "profiler_load", "servitudes_load")] == \
+        pytest.approx([0.3, 0.15, 0.1, 0.05])
+    assert sample["rt_period"] == pytest.approx(1 / simulator.servo_rate)
+    assert sample["following_error_X"] == sample["following_error_Y"] == 0.
+    assert sampler.nb_errors == 0
+
+
+def test_failed_request_gives_nan_values(controller):
+    sampler = TelemetrySampler(controller, "Nope", ["Pos"])
+    try:
+        sample = sampler.sample()
+    finally:
+        sampler.stop()
+    assert np.isnan(sample["following_error_Pos"])
+    assert sample["cpu_temperature"] == 45.
+    assert sampler.nb_errors == 1
+    assert "GroupCurrentFollowingErrorGet : ERROR" in sampler.last_error
+
+
+def test_ring_buffer_keeps_the_last_samples(controller):
+    sampler = TelemetrySampler(controller, "Group1.Pos", ["Pos"], capacity=3)
+    try:
+        assert sampler.latest() is None
+        for _ in range(5):
+            sampler.sample()
+    finally:
+        sampler.stop()
+    assert (sampler.nb_samples, len(sampler)) == (5, 3)
+    samples = sampler.samples()
+    assert samples.size == 3
+    assert np.all(np.diff(samples["time"]) >= 0)
+    assert sampler.samples(last=1)[0] == sampler.latest()
+    assert sampler.samples(last=10).size == 3
+
+
+def test_background_sampling_and_export(controller, tmp_path):
+    telemetry = controller.start_telemetry(interval=0.05, capacity=100)
+    time.sleep(0.3)
+    controller.stop_telemetry()
+    assert not telemetry.running
+    nb_samples = telemetry.nb_samples
+    assert nb_samples >= 3
+    time.sleep(0.1)
+    assert telemetry.nb_samples == nb_samples
+
+    telemetry.export(tmp_path / "health.npy")
+    np.testing.assert_array_equal(np.load(tmp_path / "health.npy"), telemetry.samples())
+    telemetry.export(tmp_path / "health.csv")
+    exported = np.genfromtxt(tmp_path / "health.csv", delimiter=",", names=True)
+    assert exported.dtype.names == telemetry.dtype.names
+    np.testing.assert_allclose(exported["fan_speed"], 3000.)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_codec import XPSError
+from pymodaq_plugins_newport.hardware.xps_files import XPSFileStore
+from pymodaq_plugins_newport.hardware.xps_trajectory import PVTTrajectory
+
+
+def test_line_at_the_maximum_acceleration_passes_check():
+    rng = np.random.default_rng(0)
+    for velocity, acceleration, length in rng.uniform((0.1, 1., 0.1), (50., 500., 20.), (500, 3)):
+        trajectory = PVTTrajectory.constant_velocity_line(length, velocity, acceleration)
+        trajectory.check([velocity], [acceleration])
+
+
+def test_check_rejects_a_line_above_the_limits():
+    trajectory = PVTTrajectory.constant_velocity_line(10., 5., 20.)
+    with pytest.raises(XPSError, match="acceleration"):
+        trajectory.check([5.], [19.99])
+    with pytest.raises(XPSError, match="velocity"):
+        trajectory.check([4.99], [20.])
+    with pytest.raises(XPSError, match="travel"):
+        trajectory.check([5.], [20.], start_positions=[0.], travel_limits=[(-1., 10.)])
+
+
+def test_load_verifies_the_trajectory_on_the_controller(xy_controller, ftp_factory, simulator):
+    xy_controller.move_group_absolute([1., 2.])
+    runner = xy_controller.trajectory(ftp_factory=ftp_factory)
+    trajectory = PVTTrajectory.constant_velocity_line(4., 5., 50., nb_axes=2)
+    results = runner.load(trajectory)
+    path = simulator.files_root / XPSFileStore.TRAJECTORIES_DIRECTORY.lstrip("/") / "pymodaq_pvt.trj"
+    assert path.read_text() == trajectory.to_text()
+    [name, minimum, maximum, velocity, acceleration], y_result = results
+    assert name == "pymodaq_pvt.trj"
+    assert [minimum, maximum] == pytest.approx([1., 1. + 4. + 2 * trajectory.run_up_distance()[0]])
+    assert [velocity, acceleration] == pytest.approx([5., 50.])
+    assert y_result[1:] == pytest.approx([2., 2., 0., 0.])
+
+
+def test_load_checks_the_trajectory_before_uploading_it(xy_controller, ftp_factory, simulator):
+    runner = xy_controller.trajectory(ftp_factory=ftp_factory)
+    trajectories = simulator.files_root / XPSFileStore.TRAJECTORIES_DIRECTORY.lstrip("/")
+    # maximum velocity and acceleration of the simulator: 20 and 80
+    with pytest.raises(XPSError, match="velocity"):
+        runner.load(PVTTrajectory.constant_velocity_line(4., 25., 50., nb_axes=2))
+    with pytest.raises(XPSError, match="travel"):
+        runner.load(PVTTrajectory.constant_velocity_line(150., 5., 50., nb_axes=2))
+    with pytest.raises(XPSError, match="axes"):
+        runner.load(PVTTrajectory.constant_velocity_line(4., 5., 50.))
+    assert not trajectories.exists()
+
+
+def test_controller_rejects_a_trajectory_above_the_limits(xy_controller, file_store):
+    trajectory = PVTTrajectory.constant_velocity_line(4., 5., 100., nb_axes=2)
+    file_store.upload(f"{XPSFileStore.TRAJECTORIES_DIRECTORY}/fast.trj", trajectory.to_text().encode())
+    with pytest.raises(XPSError, match="Acceleration on trajectory is too big"):
+        xy_controller.query("MultipleAxesPVTVerification", "XY", "fast.trj")
+    with pytest.raises(XPSError, match="doesn't exist"):
+        xy_controller.query("MultipleAxesPVTVerification", "XY", "missing.trj")